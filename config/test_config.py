@@ -2,16 +2,30 @@
 Configurações centralizadas para os testes de automação
 """
 
+import os
+
+
 class TestConfig:
     """Configurações centralizadas para os testes"""
     
+    # Servidor local que imita o Sauce Demo (ver servidor_local/servidor.py)
+    USAR_SERVIDOR_LOCAL = os.getenv("SAUCE_SERVIDOR_LOCAL", "0") == "1"
+    PORTA_SERVIDOR_LOCAL = int(os.getenv("SAUCE_PORTA_SERVIDOR_LOCAL", "8765"))
+    ATRASO_GLITCH_LOCAL_MS = int(os.getenv("SAUCE_LOCAL_ATRASO_GLITCH_MS", "5000"))
+    
     # URLs
-    BASE_URL = "https://www.saucedemo.com/"
+    BASE_URL = (
+        f"http://127.0.0.1:{PORTA_SERVIDOR_LOCAL}/" if USAR_SERVIDOR_LOCAL
+        else os.getenv("SAUCE_BASE_URL", "https://www.saucedemo.com/")
+    )
     LOGIN_URL = f"{BASE_URL}"
     PRODUCTS_URL = f"{BASE_URL}inventory.html"
     CART_URL = f"{BASE_URL}cart.html"
     CHECKOUT_URL = f"{BASE_URL}checkout-step-one.html"
     
+    # Cookie que o Sauce Demo usa para marcar o usuário autenticado
+    COOKIE_SESSAO = "session-username"
+    
     # Timeouts
     DEFAULT_TIMEOUT = 10
     SHORT_TIMEOUT = 5
@@ -19,11 +33,29 @@ class TestConfig:
     
     # Dados de teste
     TEST_DATA_FILE = "data/users.json"
+    CATALOGO_PRODUTOS_FILE = "data/catalogo_produtos.json"
+    # Fonte do catálogo: "snapshot" (JSON versionado) ou "site" (extraído uma vez por execução)
+    CATALOGO_FONTE = os.getenv("SAUCE_CATALOGO_FONTE", "snapshot")
     
-    # Diretórios
-    SCREENSHOTS_DIR = "screenshots"
+    # Worker em execução: pytest-xdist ("gw0", "gw1"...) ou run_bdd_tests.py --paralelo ("bdd0"...);
+    # vazio em execuções seriais
+    WORKER_ID = os.getenv("PYTEST_XDIST_WORKER") or os.getenv("SAUCE_WORKER_ID", "")
+    
+    # Diretórios (screenshots e logs isolados por worker em execuções paralelas)
+    SCREENSHOTS_DIR = os.path.join("screenshots", WORKER_ID) if WORKER_ID else "screenshots"
     REPORTS_DIR = "reports"
-    LOGS_DIR = "logs"
+    LOGS_DIR = os.path.join("logs", WORKER_ID) if WORKER_ID else "logs"
+    FORMATO_LOGS = os.getenv("SAUCE_FORMATO_LOGS", "texto")  # texto ou json (JSON-lines gravado em segundo plano)
+    LOG_JSON_FILE = os.path.join(LOGS_DIR, "eventos.jsonl")
+    FILA_SCREENSHOTS_MAX = int(os.getenv("SAUCE_FILA_SCREENSHOTS", "16"))  # screenshots pendentes de gravação
+    FORMATO_SCREENSHOTS = os.getenv("SAUCE_FORMATO_SCREENSHOTS", "png")  # png, png-otimizado ou webp (requer Pillow)
+    SCREENSHOTS_LIMITE_MB = float(os.getenv("SAUCE_SCREENSHOTS_LIMITE_MB", "200"))  # disco ocupado por worker
+    
+    # Evidências de etapa: "sempre" grava cada screenshot; "falha" guarda as últimas etapas em memória
+    # e só as grava quando o teste falha (utils/evidencias_falha.py)
+    MODO_EVIDENCIAS = os.getenv("SAUCE_MODO_EVIDENCIAS", "sempre")
+    EVIDENCIAS_BUFFER_MAX = int(os.getenv("SAUCE_EVIDENCIAS_BUFFER", "5"))  # etapas mantidas em memória
+    EVIDENCIAS_TAMANHO_DOM = 20000  # caracteres do DOM guardados por etapa
     
     # Taxa de imposto esperada
     TAXA_IMPOSTO_ESPERADA = 0.08  # 8%
@@ -32,9 +64,64 @@ class TestConfig:
     TOLERANCIA_PRECO = 0.01
     
     # Configurações do navegador
-    BROWSER_HEADLESS = False
+    BROWSER_HEADLESS = os.getenv("SAUCE_HEADLESS", "0") == "1"
     BROWSER_WINDOW_SIZE = "--window-size=1920,1080"
+    # Perfil de navegador da execução: padrao, headless ou leve (ver utils/perfis_navegador.py)
+    PERFIL_NAVEGADOR = os.getenv("SAUCE_PERFIL_NAVEGADOR")
+    
+    # Cache do caminho do ChromeDriver compartilhado entre processos
+    CHROMEDRIVER_CACHE_FILE = os.getenv(
+        "SAUCE_CHROMEDRIVER_CACHE",
+        os.path.join(os.path.expanduser("~"), ".cache", "saucedemo", "chromedriver.json")
+    )
+    # Sem rede: o ChromeDriver vem de CHROMEDRIVER_PATH, do cache ou do PATH (nunca do ChromeDriverManager)
+    OFFLINE = os.getenv("SAUCE_OFFLINE", "0") == "1"
     
     # Configurações de teste
     QUANTIDADE_PRODUTOS_PADRAO = 2
     MAX_TENTATIVAS_RETRY = 3
+    
+    # Pool de drivers (reutiliza navegadores entre testes)
+    REUTILIZAR_DRIVERS = os.getenv("SAUCE_REUTILIZAR_DRIVERS", "1") == "1"
+    TAMANHO_POOL_DRIVERS = int(os.getenv("SAUCE_TAMANHO_POOL_DRIVERS", "2"))
+    
+    # Duração dos cenários BDD na última execução (ordena a execução paralela)
+    BEHAVE_TIMINGS_FILE = os.path.join(REPORTS_DIR, "behave_timings.json")
+    
+    # Execução paralela (run_tests.py/run_bdd_tests.py --paralelo): memória reservada por worker/Chrome
+    MEMORIA_POR_WORKER_MB = int(os.getenv("SAUCE_MEMORIA_POR_WORKER_MB", "700"))
+    MAX_WORKERS = int(os.getenv("SAUCE_MAX_WORKERS", "0"))  # 0 = limitado apenas por CPU e memória
+    
+    # Jornadas assíncronas (utils/jornadas_assincronas.py): navegadores abertos ao mesmo tempo
+    CONCORRENCIA_JORNADAS = int(os.getenv("SAUCE_CONCORRENCIA_JORNADAS", "4"))
+    
+    # Cronometragem das ações dos page objects (utils/instrumentacao.py), um arquivo por worker
+    INSTRUMENTAR_ACOES = os.getenv("SAUCE_INSTRUMENTAR_ACOES", "0") == "1"
+    TEMPOS_ACOES_FILE = os.path.join(
+        REPORTS_DIR, f"tempos_acoes_{WORKER_ID}.json" if WORKER_ID else "tempos_acoes.json"
+    )
+    
+    # Trace dos comandos WebDriver por teste (utils/rastreamento_comandos.py)
+    RASTREAR_COMANDOS = os.getenv("SAUCE_RASTREAR_COMANDOS", "0") == "1"
+    TRACES_DIR = os.path.join(REPORTS_DIR, "traces", WORKER_ID) if WORKER_ID else os.path.join(REPORTS_DIR, "traces")
+    
+    # Métricas do navegador por página (utils/metricas_navegador.py), um arquivo por worker
+    COLETAR_METRICAS_NAVEGADOR = os.getenv("SAUCE_METRICAS_NAVEGADOR", "0") == "1"
+    METRICAS_NAVEGADOR_FILE = os.path.join(
+        REPORTS_DIR, f"metricas_navegador_{WORKER_ID}.json" if WORKER_ID else "metricas_navegador.json"
+    )
+    BASELINE_METRICAS_NAVEGADOR_FILE = os.path.join(REPORTS_DIR, "baseline_metricas_navegador.json")
+    LIMITE_REGRESSAO_METRICAS = float(os.getenv("SAUCE_LIMITE_REGRESSAO_METRICAS", "0.25"))  # piora relativa tolerada
+    
+    # Baseline de desempenho (utils/baseline_desempenho.py, run_tests.py --gate-desempenho)
+    BASELINE_DESEMPENHO_FILE = os.path.join(REPORTS_DIR, "baseline_desempenho.sqlite")
+    BASELINE_JANELA_EXECUCOES = int(os.getenv("SAUCE_BASELINE_JANELA", "5"))  # execuções na mediana
+    BASELINE_MINIMO_AMOSTRAS = int(os.getenv("SAUCE_BASELINE_MINIMO_AMOSTRAS", "3"))
+    LIMITE_REGRESSAO_DURACAO = float(os.getenv("SAUCE_LIMITE_REGRESSAO_DURACAO", "0.3"))  # piora relativa tolerada
+    RUIDO_REGRESSAO_S = float(os.getenv("SAUCE_RUIDO_REGRESSAO_S", "0.5"))  # diferença absoluta sempre tolerada
+    
+    # Linha do tempo em formato Chrome trace (SAUCE_LINHA_DO_TEMPO=1, utils/linha_do_tempo.py)
+    LINHA_DO_TEMPO = os.getenv("SAUCE_LINHA_DO_TEMPO", "0") == "1"
+    LINHA_DO_TEMPO_FILE = os.path.join(
+        REPORTS_DIR, f"linha_do_tempo_{WORKER_ID}.json" if WORKER_ID else "linha_do_tempo.json"
+    )
@@ -0,0 +1,160 @@
+"""
+Configurações compartilhadas do pytest
+"""
+
+import time
+
+import pytest
+
+from config.test_config import TestConfig
+from servidor_local.servidor import garantir_servidor_local
+from pages.login_page import LoginPage
+from utils.perfis_navegador import PerfisNavegador
+from utils.evidencias_falha import BufferEvidencias
+from utils import instrumentacao
+from utils.instrumentacao import InstrumentacaoAcoes
+from utils import linha_do_tempo
+from utils import metricas_navegador as metricas
+from utils.linha_do_tempo import LinhaDoTempo
+from utils.logger import TestLogger, mesclar_logs
+from utils.metricas_navegador import MetricasNavegador
+from utils.rastreamento_comandos import RastreadorComandos
+from utils.report_utils import ReportUtils
+from utils.webdriver_config import WebDriverConfig
+
+# Servidor local iniciado por esta sessão (None quando desativado ou já em execução)
+_servidor_local = None
+
+
+def pytest_configure(config):
+    """Registra os markers do framework e inicia o servidor local do Sauce Demo quando SAUCE_SERVIDOR_LOCAL=1"""
+    global _servidor_local
+    # O pytest.ini usa o cabeçalho [tool:pytest] (de setup.cfg) e é ignorado: os markers são registrados aqui
+    config.addinivalue_line("markers", "perfil_navegador(nome): Perfil de navegador do teste (padrao, headless, leve)")
+    config.addinivalue_line("markers", "login_rapido: Autentica via cookie de sessão em vez do formulário de login")
+    # Com pytest-xdist apenas o processo controlador sobe o servidor; os workers o reutilizam
+    if not hasattr(config, "workerinput"):
+        _servidor_local = garantir_servidor_local()
+    # Cronometragem das ações das páginas (SAUCE_INSTRUMENTAR_ACOES=1)
+    if TestConfig.INSTRUMENTAR_ACOES:
+        config.inicio_instrumentacao = time.time()
+        InstrumentacaoAcoes.ativar()
+    # Linha do tempo em formato Chrome trace (SAUCE_LINHA_DO_TEMPO=1)
+    if TestConfig.LINHA_DO_TEMPO:
+        config.inicio_linha_do_tempo = time.time()
+        LinhaDoTempo.ativar()
+    # Métricas do navegador por página (SAUCE_METRICAS_NAVEGADOR=1)
+    if TestConfig.COLETAR_METRICAS_NAVEGADOR:
+        config.inicio_metricas_navegador = time.time()
+    # Logs JSON-lines por worker (SAUCE_FORMATO_LOGS=json)
+    if TestConfig.FORMATO_LOGS == "json":
+        config.inicio_logs = time.time()
+
+
+@pytest.fixture(autouse=True)
+def perfil_navegador(request):
+    """
+    Aplica o perfil de navegador pedido pelo marker perfil_navegador
+    
+    Exemplo: @pytest.mark.perfil_navegador("leve")
+    """
+    marker = request.node.get_closest_marker("perfil_navegador")
+    PerfisNavegador.definir_perfil_do_teste(marker.args[0] if marker else None)
+    yield
+    PerfisNavegador.definir_perfil_do_teste(None)
+
+
+@pytest.fixture(autouse=True)
+def login_rapido(request):
+    """
+    Ativa o login por cookie de sessão para testes com o marker login_rapido
+    
+    Exemplo: @pytest.mark.login_rapido
+    """
+    LoginPage.definir_login_rapido(request.node.get_closest_marker("login_rapido") is not None)
+    yield
+    LoginPage.definir_login_rapido(False)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Span do teste na linha do tempo, do setup ao teardown (SAUCE_LINHA_DO_TEMPO=1)"""
+    if not LinhaDoTempo.ativa():
+        yield
+        return
+    LinhaDoTempo.iniciar_teste(item.nodeid)
+    yield
+    relatorio = getattr(item, "relatorio_call", None) or getattr(item, "relatorio_setup", None)
+    LinhaDoTempo.finalizar_teste(relatorio.outcome if relatorio else None)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Guarda o relatório de cada fase no item (relatorio_setup, relatorio_call...) para os fixtures"""
+    resultado = yield
+    relatorio = resultado.get_result()
+    setattr(item, f"relatorio_{relatorio.when}", relatorio)
+
+
+@pytest.fixture(autouse=True)
+def evidencias_falha():
+    """Começa cada teste com o buffer de evidências vazio (SAUCE_MODO_EVIDENCIAS=falha)"""
+    BufferEvidencias.iniciar_teste()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def rastrear_comandos(request):
+    """
+    Grava o trace de comandos WebDriver do teste (SAUCE_RASTREAR_COMANDOS=1)
+    e anexa o resumo ao Allure
+    """
+    if not TestConfig.RASTREAR_COMANDOS:
+        yield
+        return
+    RastreadorComandos.iniciar_teste()
+    yield
+    caminho, resumo = RastreadorComandos.finalizar_teste(request.node.nodeid)
+    if caminho:
+        ReportUtils.adicionar_evidencia_allure("Comandos WebDriver", resumo, "text")
+        print(f"🔎 Trace de comandos: {caminho}")
+
+
+@pytest.fixture(autouse=True)
+def metricas_navegador(request):
+    """Associa as métricas do navegador coletadas ao teste (SAUCE_METRICAS_NAVEGADOR=1)"""
+    MetricasNavegador.iniciar_teste(request.node.nodeid)
+    yield
+    MetricasNavegador.finalizar_teste()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Fecha os navegadores mantidos pelo pool e grava screenshots, tempos, métricas, logs e linha do tempo ao final da sessão"""
+    # Processo controlador (execução serial ou controlador do pytest-xdist)
+    controlador = not hasattr(session.config, "workerinput") and not TestConfig.WORKER_ID
+    WebDriverConfig.encerrar_pool()
+    ReportUtils.aguardar_screenshots()
+    # Cada worker grava o próprio arquivo; o controlador do xdist não executa ações
+    InstrumentacaoAcoes.gravar_relatorio()
+    # Com pytest-xdist, o controlador recalcula os percentis sobre as amostras dos workers desta execução
+    if TestConfig.INSTRUMENTAR_ACOES and controlador:
+        instrumentacao.mesclar(desde=session.config.inicio_instrumentacao)
+    MetricasNavegador.gravar_relatorio()
+    # Com pytest-xdist, o controlador junta as métricas dos workers desta execução
+    if TestConfig.COLETAR_METRICAS_NAVEGADOR and controlador:
+        metricas.mesclar(desde=session.config.inicio_metricas_navegador)
+    TestLogger.encerrar()
+    # Com pytest-xdist, o controlador intercala os logs dos workers desta execução
+    if TestConfig.FORMATO_LOGS == "json" and controlador:
+        mesclar_logs(desde=session.config.inicio_logs)
+    if TestConfig.LINHA_DO_TEMPO:
+        LinhaDoTempo.gravar()
+        # Com pytest-xdist, o controlador junta as trilhas dos workers desta execução
+        if controlador:
+            linha_do_tempo.mesclar(desde=session.config.inicio_linha_do_tempo)
+
+
+def pytest_unconfigure(config):
+    """Encerra o servidor local iniciado em pytest_configure"""
+    if _servidor_local:
+        _servidor_local.parar()
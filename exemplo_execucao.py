@@ -83,13 +83,10 @@ def exemplo_testes_paralelos():
     """Exemplo: Executar testes em paralelo"""
     print("🔄 Executando testes em paralelo...")
     
+    # Workers calculados por CPU e memória, um Chrome por worker (ver run_tests.py)
     comando = [
-        "pytest",
-        "test_fluxo_completo_compra.py",
-        "-n", "2",  # 2 processos paralelos
-        "-v",
-        "--html=reports/parallel_report.html",
-        "--self-contained-html"
+        "python", "run_tests.py",
+        "--paralelo"
     ]
     
     print(f"Comando: {' '.join(comando)}")
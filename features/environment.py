@@ -0,0 +1,80 @@
+"""
+Hooks do Behave - ambiente compartilhado pelos cenários BDD
+"""
+
+from datetime import datetime
+
+from config.test_config import TestConfig
+from servidor_local.servidor import garantir_servidor_local
+from utils.evidencias_falha import BufferEvidencias
+from utils.gravador_screenshots import GravadorScreenshots
+from utils.instrumentacao import InstrumentacaoAcoes
+from utils.linha_do_tempo import LinhaDoTempo
+from utils.logger import TestLogger
+from utils.metricas_navegador import MetricasNavegador
+from utils.rastreamento_comandos import RastreadorComandos
+from utils.report_utils import ReportUtils
+
+
+def before_all(context):
+    """Inicia o servidor local (SAUCE_SERVIDOR_LOCAL=1) e a cronometragem das ações (SAUCE_INSTRUMENTAR_ACOES=1)"""
+    context.servidor_local = garantir_servidor_local()
+    if TestConfig.INSTRUMENTAR_ACOES:
+        InstrumentacaoAcoes.ativar()
+    if TestConfig.LINHA_DO_TEMPO:
+        LinhaDoTempo.ativar()
+
+
+def before_scenario(context, scenario):
+    """Marca o início do trace de comandos, das métricas do navegador e do buffer de evidências do cenário"""
+    MetricasNavegador.iniciar_teste(f"{scenario.feature.name}::{scenario.name}")
+    BufferEvidencias.iniciar_teste()
+    TestLogger.definir_teste(f"{scenario.feature.name}::{scenario.name}")
+    if LinhaDoTempo.ativa():
+        LinhaDoTempo.iniciar_teste(f"{scenario.feature.name}::{scenario.name}")
+    if TestConfig.RASTREAR_COMANDOS:
+        RastreadorComandos.iniciar_teste()
+
+
+def after_scenario(context, scenario):
+    """Grava o trace de comandos, captura screenshot em caso de falha, fecha o navegador e o span do cenário"""
+    MetricasNavegador.finalizar_teste()
+    TestLogger.definir_teste(None)
+    if TestConfig.RASTREAR_COMANDOS:
+        caminho, resumo = RastreadorComandos.finalizar_teste(f"{scenario.feature.name}::{scenario.name}")
+        if caminho:
+            ReportUtils.adicionar_evidencia_allure("Comandos WebDriver", resumo, "text")
+    
+    driver = getattr(context, "driver", None)
+    if not driver:
+        LinhaDoTempo.finalizar_teste(scenario.status.name)
+        return
+    try:
+        if scenario.status == "failed" and BufferEvidencias.ativo():
+            # Etapas guardadas em memória e o estado no momento da falha
+            BufferEvidencias.descarregar(driver, scenario.name.replace(' ', '_'))
+        elif scenario.status == "failed":
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            nome_arquivo = f"falha_{scenario.name.replace(' ', '_')}_{timestamp}.png"
+            # Gravado em segundo plano no armazém de screenshots; after_all aguarda a fila
+            caminho = GravadorScreenshots.enfileirar(driver, nome_arquivo)
+            print(f"Screenshot salvo: {nome_arquivo} ({caminho})")
+    finally:
+        # Cada cenário abre o próprio Chrome em "Dado que estou na página de login"
+        driver.quit()
+        context.driver = None
+        LinhaDoTempo.finalizar_teste(scenario.status.name)
+
+
+def after_all(context):
+    """Executado após todos os cenários: encerra o servidor local iniciado em before_all e aguarda os screenshots pendentes"""
+    if context.servidor_local:
+        context.servidor_local.parar()
+    GravadorScreenshots.aguardar()
+    InstrumentacaoAcoes.gravar_relatorio()
+    MetricasNavegador.gravar_relatorio()
+    TestLogger.encerrar()
+    LinhaDoTempo.gravar()
+    print("Todos os cenarios BDD foram executados!")
+    print(f"Screenshots disponiveis em: {TestConfig.SCREENSHOTS_DIR}/")
+    print(f"Relatorios disponiveis em: {TestConfig.REPORTS_DIR}/")
@@ -40,14 +40,14 @@ Funcionalidade: Fluxo Completo de Compra no Sauce Demo
     E confirmo a compra
     Então devo ver a mensagem de sucesso "Thank you for your order!"
 
-  @validacao_produtos
+  @validacao_produtos @login_rapido
   Cenário: Validação da seleção de produtos
     Quando faço login com usuário "standard_user" e senha "secret_sauce"
     E seleciono dois produtos aleatórios
     Então devo ver que exatamente dois produtos foram selecionados
     E os produtos devem ter preços válidos
 
-  @validacao_carrinho
+  @validacao_carrinho @login_rapido
   Cenário: Validação do carrinho de compras
     Quando faço login com usuário "standard_user" e senha "secret_sauce"
     E seleciono dois produtos aleatórios
@@ -57,12 +57,10 @@ Funcionalidade: Fluxo Completo de Compra no Sauce Demo
     E o preço total deve ser a soma dos produtos
     E a taxa de imposto deve ser calculada corretamente (8%)
 
-  @validacao_checkout
+  @validacao_checkout @login_rapido
   Cenário: Validação do processo de checkout
     Quando faço login com usuário "standard_user" e senha "secret_sauce"
-    E seleciono dois produtos aleatórios
-    E adiciono os produtos ao carrinho
-    E navego para o carrinho
+    E preparo o carrinho com dois produtos aleatórios
     E clico em "Checkout"
     E preencho as informações de checkout com:
       | Campo      | Valor    |
@@ -6,6 +6,9 @@ from behave import when, then
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from config.test_config import TestConfig
+from pages.cart_page import CartPage
+from utils.catalogo_produtos import CatalogoProdutos
 import time
 
 
@@ -18,7 +21,7 @@ def step_impl(context):
         cart_icon.click()
         
         # Aguardar carregamento da página do carrinho
-        WebDriverWait(context.driver, 10).until(
+        WebDriverWait(context.driver, TestConfig.DEFAULT_TIMEOUT).until(
             EC.presence_of_element_located((By.CLASS_NAME, "cart_list"))
         )
         
@@ -29,6 +32,29 @@ def step_impl(context):
         raise
 
 
+@when('preparo o carrinho com dois produtos aleatórios')
+def step_impl(context):
+    """Monta o carrinho direto no localStorage e abre a página do carrinho"""
+    try:
+        produtos = CartPage(context.driver).preparar_carrinho_aleatorio(2)
+        
+        # Mesmo formato gravado pelos steps de seleção de produtos
+        context.produtos_selecionados = [
+            {
+                'nome': produto['nome'],
+                'preco': f"${produto['preco']:.2f}",
+                'preco_float': produto['preco']
+            }
+            for produto in produtos
+        ]
+        
+        print(f"Carrinho preparado: {[p['nome'] for p in context.produtos_selecionados]}")
+        
+    except Exception as e:
+        print(f"Erro ao preparar o carrinho: {e}")
+        raise
+
+
 @when('verifico o preço total dos produtos')
 def step_impl(context):
     """Verifica o preço total dos produtos no carrinho"""
@@ -64,7 +90,7 @@ def step_impl(context, botao):
             checkout_button.click()
             
             # Aguardar carregamento da página de checkout
-            WebDriverWait(context.driver, 10).until(
+            WebDriverWait(context.driver, TestConfig.DEFAULT_TIMEOUT).until(
                 EC.presence_of_element_located((By.ID, "first-name"))
             )
             
@@ -75,7 +101,7 @@ def step_impl(context, botao):
             continue_button.click()
             
             # Aguardar carregamento da página de resumo
-            WebDriverWait(context.driver, 10).until(
+            WebDriverWait(context.driver, TestConfig.DEFAULT_TIMEOUT).until(
                 EC.presence_of_element_located((By.CLASS_NAME, "summary_info"))
             )
             
@@ -86,7 +112,7 @@ def step_impl(context, botao):
             finish_button.click()
             
             # Aguardar carregamento da página de sucesso
-            WebDriverWait(context.driver, 10).until(
+            WebDriverWait(context.driver, TestConfig.DEFAULT_TIMEOUT).until(
                 EC.presence_of_element_located((By.CLASS_NAME, "complete-header"))
             )
             
@@ -122,8 +148,10 @@ def step_impl(context):
 def step_impl(context):
     """Verifica se o preço total é a soma dos produtos"""
     try:
-        # Calcular soma esperada
-        soma_esperada = sum(produto['preco_float'] for produto in context.produtos_selecionados)
+        # Calcular soma esperada a partir do catálogo
+        soma_esperada = CatalogoProdutos.obter().subtotal_esperado(
+            [produto['nome'] for produto in context.produtos_selecionados]
+        )
         
         # Obter TODOS os preços dos produtos no carrinho
         preco_elements = context.driver.find_elements(By.CLASS_NAME, "inventory_item_price")
@@ -144,8 +172,10 @@ def step_impl(context):
 def step_impl(context, taxa):
     """Verifica se a taxa de imposto está sendo calculada corretamente"""
     try:
-        # Calcular imposto esperado
-        preco_total = sum(produto['preco_float'] for produto in context.produtos_selecionados)
+        # Calcular imposto esperado a partir do catálogo
+        preco_total = CatalogoProdutos.obter().subtotal_esperado(
+            [produto['nome'] for produto in context.produtos_selecionados]
+        )
         imposto_esperado = preco_total * (taxa / 100)
         
         # Obter imposto do carrinho (se disponível)
@@ -6,6 +6,7 @@ from behave import when, then
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from config.test_config import TestConfig
 import time
 
 
@@ -89,7 +90,7 @@ def step_impl(context):
         continue_button.click()
         
         # Aguardar carregamento da página de resumo
-        WebDriverWait(context.driver, 10).until(
+        WebDriverWait(context.driver, TestConfig.DEFAULT_TIMEOUT).until(
             EC.presence_of_element_located((By.CLASS_NAME, "summary_info"))
         )
         
@@ -119,7 +120,7 @@ def step_impl(context):
         finish_button.click()
         
         # Aguardar carregamento da página de sucesso
-        WebDriverWait(context.driver, 10).until(
+        WebDriverWait(context.driver, TestConfig.DEFAULT_TIMEOUT).until(
             EC.presence_of_element_located((By.CLASS_NAME, "complete-header"))
         )
         
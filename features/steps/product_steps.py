@@ -6,8 +6,10 @@ from behave import when, then
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from config.test_config import TestConfig
+from utils.catalogo_produtos import CatalogoProdutos
+from utils.test_helpers import MotorEspera
 import random
-import time
 
 
 @when('seleciono dois produtos aleatórios')
@@ -15,7 +17,7 @@ def step_impl(context):
     """Seleciona dois produtos aleatórios da lista"""
     try:
         # Aguardar carregamento da lista de produtos
-        WebDriverWait(context.driver, 10).until(
+        WebDriverWait(context.driver, TestConfig.DEFAULT_TIMEOUT).until(
             EC.presence_of_element_located((By.CLASS_NAME, "inventory_list"))
         )
         
@@ -58,8 +60,8 @@ def step_impl(context):
             # Clicar no botão
             botao_add.click()
             
-            # Aguardar um pouco
-            time.sleep(1)
+            # Aguardar o botão mudar para "Remove"
+            MotorEspera.aguardar_texto_botao(context.driver, botao_add, "Remove")
         
         print("Produtos adicionados ao carrinho!")
         
@@ -100,10 +102,16 @@ def step_impl(context):
 def step_impl(context):
     """Verifica se os produtos têm preços válidos"""
     try:
+        catalogo = CatalogoProdutos.obter(context.driver)
         for produto in context.produtos_selecionados:
             preco = produto['preco_float']
             assert preco > 0, f"Preço deve ser maior que zero: {preco}"
             assert isinstance(preco, float), f"Preço deve ser float: {type(preco)}"
+            
+            # O preço exibido deve ser o do catálogo
+            preco_catalogo = catalogo.preco_esperado(produto['nome'])
+            assert abs(preco - preco_catalogo) < 0.01, \
+                f"Preço de '{produto['nome']}': esperado ${preco_catalogo}, encontrado ${preco}"
         
         print("Todos os produtos tem precos validos")
         
@@ -4,6 +4,7 @@ Executa o fluxo completo de login e adição de produtos ao carrinho
 """
 
 import time
+from config.test_config import TestConfig
 from utils.webdriver_config import WebDriverConfig
 from pages.login_page import LoginPage
 from pages.products_page import ProductsPage
@@ -27,7 +28,7 @@ def executar_automacao_sauce_demo():
         WebDriverConfig.configurar_driver_com_espera_implicita(driver)
         
         # URLs e credenciais
-        url_site = "https://www.saucedemo.com/"
+        url_site = TestConfig.BASE_URL
         usuario = "standard_user"
         senha = "secret_sauce"
         
@@ -3,9 +3,36 @@ Página do Carrinho do Sauce Demo
 Responsável por listar itens e seguir para o checkout
 """
 
+import json
+import random
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from config.test_config import TestConfig
+from utils.catalogo_produtos import CatalogoProdutos
+from utils.metricas_navegador import MetricasNavegador
+from utils.test_helpers import TestHelpers
+
+
+class ItemCarrinho:
+    """Dados de um item do carrinho extraídos em lote"""
+
+    def __init__(self, nome, preco, quantidade, data_test, elemento=None):
+        """
+        Inicializa o item do carrinho
+
+        Args:
+            nome: Nome do produto
+            preco: Preço exibido (float)
+            quantidade: Quantidade do item
+            data_test: data-test do botão Remove (ex.: "remove-sauce-labs-backpack")
+            elemento: WebElement do cart_item
+        """
+        self.nome = nome
+        self.preco = preco
+        self.quantidade = quantidade
+        self.data_test = data_test
+        self.elemento = elemento
 
 
 class CartPage:
@@ -15,31 +42,105 @@ class CartPage:
     ITEM_NAME = (By.CLASS_NAME, "inventory_item_name")
     ITEM_PRICE = (By.CLASS_NAME, "inventory_item_price")
     CHECKOUT_BUTTON = (By.ID, "checkout")
+    
+    # Chave do localStorage onde o Sauce Demo guarda os ids dos produtos no carrinho
+    CHAVE_CARRINHO_STORAGE = "cart-contents"
+
+    # Extrai todos os itens do carrinho em uma única chamada
+    SCRIPT_EXTRAIR_ITENS = """
+        return Array.from(document.querySelectorAll('.cart_item')).map(function (item) {
+            var nome = item.querySelector('.inventory_item_name');
+            var preco = item.querySelector('.inventory_item_price');
+            var quantidade = item.querySelector('.cart_quantity');
+            var botao = item.querySelector('button');
+            return {
+                nome: nome ? nome.textContent.trim() : '',
+                preco: preco ? preco.textContent.trim() : '',
+                quantidade: quantidade ? quantidade.textContent.trim() : '1',
+                data_test: botao ? (botao.getAttribute('data-test') || botao.id || '') : '',
+                elemento: item
+            };
+        });
+    """
 
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = WebDriverWait(driver, TestConfig.DEFAULT_TIMEOUT)
+
+    def obter_itens_em_lote(self):
+        """
+        Obtém todos os itens do carrinho com uma única chamada execute_script
+        Returns: list[ItemCarrinho]
+        """
+        # A condição de espera já executa o script (carrinho vazio continua aguardando, como antes)
+        dados = self.wait.until(lambda d: d.execute_script(self.SCRIPT_EXTRAIR_ITENS) or False)
+        return [
+            ItemCarrinho(
+                nome=item["nome"],
+                preco=TestHelpers.extrair_numero_de_texto(item["preco"]),
+                quantidade=int(item["quantidade"] or 1),
+                data_test=item["data_test"],
+                elemento=item["elemento"],
+            )
+            for item in dados
+        ]
 
     def obter_itens_carrinho(self):
         """
         Retorna a lista de itens presentes no carrinho
         Returns: list[dict] -> [{"nome": str, "preco": float}]
         """
-        itens = self.wait.until(EC.presence_of_all_elements_located(self.CART_ITEM))
-        resultado = []
-        for item in itens:
-            nome = item.find_element(*self.ITEM_NAME).text.strip()
-            preco_texto = item.find_element(*self.ITEM_PRICE).text.strip().replace("$", "").replace(",", "")
-            try:
-                preco = float(preco_texto)
-            except:
-                preco = 0.0
-            resultado.append({"nome": nome, "preco": preco})
-        return resultado
+        return [{"nome": item.nome, "preco": item.preco} for item in self.obter_itens_em_lote()]
 
+    def preparar_carrinho(self, produtos):
+        """
+        Monta o carrinho direto no localStorage e abre TestConfig.CART_URL
+        
+        Evita clicar em "Add to cart" item a item nos testes que não
+        validam a inclusão de produtos. Requer uma sessão autenticada.
+        
+        Args:
+            produtos: Ids, nomes ou slugs dos produtos (ver CatalogoProdutos.buscar)
+        
+        Returns:
+            list[dict]: Produtos esperados no carrinho com nome e preço do catálogo
+        """
+        catalogo = CatalogoProdutos.obter()
+        selecionados = [catalogo.buscar(produto) for produto in produtos]
+        
+        # localStorage só pode ser escrito a partir de uma página do próprio site
+        if not self.driver.current_url.startswith(TestConfig.BASE_URL):
+            self.driver.get(TestConfig.BASE_URL)
+        self.driver.execute_script(
+            "window.localStorage.setItem(arguments[0], arguments[1]);",
+            self.CHAVE_CARRINHO_STORAGE,
+            json.dumps([produto.id for produto in selecionados]),
+        )
+        self.driver.get(TestConfig.CART_URL)
+        
+        if selecionados:
+            self.wait.until(lambda d: len(d.find_elements(*self.CART_ITEM)) == len(selecionados))
+        print(f"Carrinho preparado com {len(selecionados)} produtos: {[p.nome for p in selecionados]}")
+        return [{"nome": produto.nome, "preco": produto.preco} for produto in selecionados]
+    
+    def preparar_carrinho_aleatorio(self, quantidade=None):
+        """
+        Monta o carrinho com produtos aleatórios do catálogo
+        
+        Args:
+            quantidade: Quantidade de produtos (usa TestConfig.QUANTIDADE_PRODUTOS_PADRAO se não especificada)
+        
+        Returns:
+            list[dict]: Produtos esperados no carrinho com nome e preço do catálogo
+        """
+        quantidade = quantidade or TestConfig.QUANTIDADE_PRODUTOS_PADRAO
+        produtos = random.sample(CatalogoProdutos.obter().produtos, quantidade)
+        return self.preparar_carrinho([produto.id for produto in produtos])
+    
     def clicar_checkout(self):
         botao = self.wait.until(EC.element_to_be_clickable(self.CHECKOUT_BUTTON))
         botao.click()
+        MetricasNavegador.coletar_apos_navegacao(self.driver, "checkout-step-one")
         return True
     
     def ir_para_checkout(self):
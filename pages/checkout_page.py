@@ -7,6 +7,8 @@ import re
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from config.test_config import TestConfig
+from utils.metricas_navegador import MetricasNavegador
 
 
 class CheckoutPage:
@@ -29,7 +31,7 @@ class CheckoutPage:
 
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = WebDriverWait(driver, TestConfig.DEFAULT_TIMEOUT)
 
     def preencher_informacoes_pessoais(self, primeiro_nome: str, sobrenome: str, cep: str):
         self.wait.until(EC.element_to_be_clickable(self.FIRST_NAME)).send_keys(primeiro_nome)
@@ -38,6 +40,7 @@ class CheckoutPage:
 
     def continuar_para_resumo(self):
         self.wait.until(EC.element_to_be_clickable(self.CONTINUE_BUTTON)).click()
+        MetricasNavegador.coletar_apos_navegacao(self.driver, "checkout-step-two")
 
     @staticmethod
     def _extrair_valor(label_texto: str) -> float:
@@ -60,6 +63,7 @@ class CheckoutPage:
 
     def finalizar_compra(self):
         self.wait.until(EC.element_to_be_clickable(self.FINISH_BUTTON)).click()
+        MetricasNavegador.coletar_apos_navegacao(self.driver, "checkout-complete")
 
     def verificar_compra_concluida(self) -> bool:
         try:
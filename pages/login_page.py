@@ -6,6 +6,8 @@ Contém os elementos e métodos para interagir com a página de login
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from config.test_config import TestConfig
+from utils.test_helpers import TestHelpers
 
 
 class LoginPage:
@@ -16,6 +18,14 @@ class LoginPage:
     CAMPO_SENHA = (By.ID, "password")
     BOTAO_LOGIN = (By.ID, "login-button")
     MENSAGEM_ERRO = (By.CLASS_NAME, "error-message-container")
+    MENSAGEM_ERRO_ATIVA = (By.CSS_SELECTOR, "[data-test='error']")
+    LISTA_PRODUTOS = (By.CLASS_NAME, "inventory_list")
+    
+    # Cookies de sessão capturados no primeiro login pela interface, por usuário
+    _sessoes_em_cache = {}
+    
+    # Login rápido pedido pelo teste em execução (marker login_rapido, definido pelo conftest)
+    _login_rapido_do_teste = False
     
     def __init__(self, driver):
         """
@@ -25,7 +35,7 @@ class LoginPage:
             driver: Instância do WebDriver
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = WebDriverWait(driver, TestConfig.DEFAULT_TIMEOUT)
     
     def acessar_pagina_login(self, url):
         """
@@ -85,6 +95,126 @@ class LoginPage:
         self.preencher_senha(senha)
         self.clicar_botao_login()
     
+    @classmethod
+    def definir_login_rapido(cls, ativo):
+        """
+        Define se o teste atual usa o login rápido em LoginPage.entrar
+        
+        Args:
+            ativo: True para injetar a sessão em vez de preencher o formulário
+        """
+        cls._login_rapido_do_teste = ativo
+    
+    @classmethod
+    def login_rapido_ativo(cls):
+        """Indica se o teste atual pediu login rápido"""
+        return cls._login_rapido_do_teste
+    
+    @classmethod
+    def limpar_cache_sessoes(cls):
+        """Descarta os cookies de sessão capturados"""
+        cls._sessoes_em_cache.clear()
+    
+    def entrar(self, usuario, senha):
+        """
+        Autentica o usuário pelo caminho escolhido para o teste atual
+        
+        Usa fazer_login_rapido quando o teste tem o marker login_rapido e,
+        caso contrário, acessa a página de login e preenche o formulário.
+        
+        Args:
+            usuario: Nome do usuário
+            senha: Senha do usuário
+        
+        Returns:
+            bool: True se o login foi bem-sucedido
+        """
+        if self.login_rapido_ativo():
+            return self.fazer_login_rapido(usuario, senha)
+        self.acessar_pagina_login(TestConfig.BASE_URL)
+        self.fazer_login(usuario, senha)
+        return self.verificar_se_login_foi_bem_sucedido()
+    
+    def fazer_login_rapido(self, usuario, senha):
+        """
+        Autentica sem preencher o formulário, injetando o cookie de sessão
+        
+        O primeiro login de cada usuário passa pela interface (validando a
+        senha e o bloqueio do usuário) e guarda os cookies de sessão; os
+        seguintes só gravam esses cookies e abrem TestConfig.PRODUCTS_URL.
+        
+        Args:
+            usuario: Nome do usuário
+            senha: Senha do usuário
+        
+        Returns:
+            bool: True se a página de produtos foi aberta autenticada
+        """
+        cookies = self._sessoes_em_cache.get(usuario)
+        if cookies:
+            self._definir_cookies_sessao(cookies)
+            self.driver.get(TestConfig.PRODUCTS_URL)
+            if self._aguardar_pagina_produtos():
+                print(f"Login rápido realizado: {usuario}")
+                return True
+            # Sessão recusada (ex.: expirada): descarta o cache e refaz pela interface
+            print(f"Sessão em cache recusada para {usuario}, refazendo login pela interface")
+            self._sessoes_em_cache.pop(usuario, None)
+        
+        self.acessar_pagina_login(TestConfig.BASE_URL)
+        self.fazer_login(usuario, senha)
+        if not self._aguardar_pagina_produtos(TestConfig.LONG_TIMEOUT):
+            return False
+        
+        cookies_sessao = self._capturar_cookies_sessao()
+        if cookies_sessao:
+            self._sessoes_em_cache[usuario] = cookies_sessao
+        return True
+    
+    def _capturar_cookies_sessao(self):
+        """Copia os cookies da sessão autenticada (sem expiração, que o site renova)"""
+        cookies = [
+            {chave: valor for chave, valor in cookie.items() if chave in ("name", "value", "path")}
+            for cookie in self.driver.get_cookies()
+            if cookie.get("name") == TestConfig.COOKIE_SESSAO
+        ]
+        return cookies or None
+    
+    def _definir_cookies_sessao(self, cookies):
+        """
+        Grava os cookies de sessão no domínio do site
+        
+        Via CDP não é preciso estar no domínio; sem CDP, abre a página de
+        login (necessário para add_cookie) antes de gravar.
+        """
+        try:
+            for cookie in cookies:
+                self.driver.execute_cdp_cmd("Network.setCookie", {
+                    "name": cookie["name"],
+                    "value": cookie["value"],
+                    "path": cookie.get("path", "/"),
+                    "url": TestConfig.BASE_URL,
+                })
+            return
+        except Exception:
+            pass
+        
+        if not self.driver.current_url.startswith(TestConfig.BASE_URL):
+            self.driver.get(TestConfig.BASE_URL)
+        for cookie in cookies:
+            self.driver.add_cookie(cookie)
+    
+    def _aguardar_pagina_produtos(self, timeout=None):
+        """Aguarda a lista de produtos (sucesso) ou a mensagem de erro (falha)"""
+        try:
+            WebDriverWait(self.driver, timeout or TestConfig.DEFAULT_TIMEOUT).until(EC.any_of(
+                EC.presence_of_element_located(self.LISTA_PRODUTOS),
+                EC.presence_of_element_located(self.MENSAGEM_ERRO_ATIVA)
+            ))
+        except Exception:
+            return False
+        return bool(self.driver.find_elements(*self.LISTA_PRODUTOS))
+    
     def verificar_se_login_foi_bem_sucedido(self):
         """
         Verifica se o login foi bem-sucedido
@@ -94,11 +224,15 @@ class LoginPage:
             bool: True se o login foi bem-sucedido, False caso contrário
         """
         try:
-            # Se ainda estiver na página de login, o login falhou
-            self.wait.until(EC.presence_of_element_located(self.BOTAO_LOGIN))
-            return False
+            # Retorna assim que o formulário sumir (sucesso) ou um erro aparecer (falha)
+            self.wait.until(EC.any_of(
+                EC.invisibility_of_element_located(self.BOTAO_LOGIN),
+                EC.presence_of_element_located(self.MENSAGEM_ERRO_ATIVA)
+            ))
         except:
-            return True
+            pass
+        # Se ainda estiver na página de login, o login falhou
+        return TestHelpers.elemento_ausente(self.driver, self.BOTAO_LOGIN)
     
     def obter_mensagem_erro(self):
         """
@@ -107,11 +241,9 @@ class LoginPage:
         Returns:
             str: Mensagem de erro ou string vazia se não houver erro
         """
-        try:
-            elemento_erro = self.driver.find_element(*self.MENSAGEM_ERRO)
-            return elemento_erro.text
-        except:
-            return ""
+        # find_elements retorna imediatamente quando não há erro na página
+        elementos_erro = self.driver.find_elements(*self.MENSAGEM_ERRO)
+        return elementos_erro[0].text if elementos_erro else ""
     
     def verificar_se_usuario_bloqueado(self):
         """
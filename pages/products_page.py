@@ -6,9 +6,41 @@ Contém os elementos e métodos para interagir com a página de produtos
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from config.test_config import TestConfig
+from utils.catalogo_produtos import CatalogoProdutos
+from utils.metricas_navegador import MetricasNavegador
+from utils.test_helpers import TestHelpers
 import random
 
 
+class ProdutoInventario:
+    """Dados de um item do inventário extraídos em lote"""
+    
+    def __init__(self, nome, preco, data_test, texto_botao, elemento=None, botao=None):
+        """
+        Inicializa o item do inventário
+        
+        Args:
+            nome: Nome do produto
+            preco: Preço exibido (float)
+            data_test: data-test do botão (ex.: "add-to-cart-sauce-labs-backpack")
+            texto_botao: Texto do botão Add/Remove
+            elemento: WebElement do inventory_item
+            botao: WebElement do botão Add/Remove
+        """
+        self.nome = nome
+        self.preco = preco
+        self.data_test = data_test
+        self.texto_botao = texto_botao
+        self.elemento = elemento
+        self.botao = botao
+    
+    @property
+    def pode_adicionar(self):
+        """Indica se o botão do item ainda é 'Add to cart'"""
+        return self.data_test.startswith("add-to-cart") or "Add" in self.texto_botao
+
+
 class ProductsPage:
     """Classe que representa a página de produtos do Sauce Demo"""
     
@@ -20,6 +52,23 @@ class ProductsPage:
     BOTAO_REMOVER_PRODUTO_TEMPLATE = "remove-sauce-labs-{}"
     CONTADOR_ITENS_CARRINHO = (By.CLASS_NAME, "shopping_cart_badge")
     
+    # Extrai nome, preço, data-test e estado do botão de todos os itens em uma única chamada
+    SCRIPT_EXTRAIR_PRODUTOS = """
+        return Array.from(document.querySelectorAll('.inventory_item')).map(function (item) {
+            var nome = item.querySelector('.inventory_item_name');
+            var preco = item.querySelector('.inventory_item_price');
+            var botao = item.querySelector('button');
+            return {
+                nome: nome ? nome.textContent.trim() : '',
+                preco: preco ? preco.textContent.trim() : '',
+                data_test: botao ? (botao.getAttribute('data-test') || botao.id || '') : '',
+                texto_botao: botao ? botao.textContent.trim() : '',
+                elemento: item,
+                botao: botao
+            };
+        });
+    """
+    
     def __init__(self, driver):
         """
         Inicializa a página de produtos
@@ -28,7 +77,7 @@ class ProductsPage:
             driver: Instância do WebDriver
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = WebDriverWait(driver, TestConfig.DEFAULT_TIMEOUT)
     
     def verificar_se_esta_na_pagina_produtos(self):
         """
@@ -58,6 +107,34 @@ class ProductsPage:
         print(f"Encontrados {len(elementos)} produtos na página")
         return elementos
     
+    def obter_produtos_em_lote(self):
+        """
+        Obtém os dados de todos os produtos com uma única chamada execute_script
+        
+        Substitui os find_element por item (um roundtrip HTTP cada) por um
+        script que devolve nome, preço, data-test, texto do botão e as
+        referências aos elementos de uma só vez.
+        
+        Returns:
+            list[ProdutoInventario]: Produtos exibidos na página
+        """
+        # A própria condição de espera executa o script: sem roundtrip extra no caminho feliz
+        dados = self.wait.until(lambda d: d.execute_script(self.SCRIPT_EXTRAIR_PRODUTOS) or False)
+        
+        produtos = [
+            ProdutoInventario(
+                nome=item["nome"],
+                preco=TestHelpers.extrair_numero_de_texto(item["preco"]),
+                data_test=item["data_test"],
+                texto_botao=item["texto_botao"],
+                elemento=item["elemento"],
+                botao=item["botao"],
+            )
+            for item in dados
+        ]
+        print(f"Encontrados {len(produtos)} produtos na página")
+        return produtos
+    
     def obter_dados_produtos(self):
         """
         Obtém os dados estruturados dos produtos disponíveis
@@ -65,24 +142,16 @@ class ProductsPage:
         Returns:
             list: Lista de dicionários com dados dos produtos
         """
-        elementos = self.obter_elementos_produtos()
-        dados_produtos = []
-        
-        for elemento in elementos:
-            try:
-                nome = elemento.find_element(By.CLASS_NAME, "inventory_item_name").text.strip()
-                preco_texto = elemento.find_element(By.CLASS_NAME, "inventory_item_price").text.strip()
-                preco = float(preco_texto.replace("$", "").replace(",", ""))
-                
-                dados_produtos.append({
-                    "nome": nome,
-                    "preco": preco,
-                    "elemento": elemento
-                })
-            except Exception as e:
-                print(f"Erro ao obter dados do produto: {e}")
-        
-        return dados_produtos
+        return [
+            {
+                "nome": produto.nome,
+                "preco": produto.preco,
+                "data_test": produto.data_test,
+                "elemento": produto.elemento,
+                "botao": produto.botao,
+            }
+            for produto in self.obter_produtos_em_lote()
+        ]
 
     def adicionar_produtos_aleatorios(self, quantidade: int = 2):
         """
@@ -94,39 +163,52 @@ class ProductsPage:
         Returns: 
             list[dict]: Lista de produtos adicionados com nome e preço
         """
-        elementos = self.obter_elementos_produtos()
-        random.shuffle(elementos)
+        produtos = [p for p in self.obter_produtos_em_lote() if p.botao is not None and p.pode_adicionar]
+        random.shuffle(produtos)
         selecionados = []
 
-        for elemento in elementos:
+        for produto in produtos:
             if len(selecionados) >= quantidade:
                 break
             try:
-                nome = elemento.find_element(By.CLASS_NAME, "inventory_item_name").text.strip()
-                preco_texto = elemento.find_element(By.CLASS_NAME, "inventory_item_price").text.strip().replace("$", "").replace(",", "")
-                preco = float(preco_texto)
-                # Botão dentro do elemento
-                botao = elemento.find_element(By.TAG_NAME, "button")
-                if "Add to cart" in botao.text or "Add" in botao.text or botao.get_attribute("data-test").startswith("add-to-cart"):
-                    botao.click()
-                    selecionados.append({"nome": nome, "preco": preco})
-                    print(f"Produto aleatório adicionado: {nome} - ${preco}")
+                produto.botao.click()
+                selecionados.append({"nome": produto.nome, "preco": produto.preco})
+                print(f"Produto aleatório adicionado: {produto.nome} - ${produto.preco}")
             except Exception as e:
                 print(f"Falha ao adicionar item aleatório: {e}")
 
         print(f"Total aleatórios adicionados: {len(selecionados)}")
         return selecionados
     
+    def _id_botao(self, nome_produto, adicionar=True):
+        """
+        Obtém o id do botão Add/Remove de um produto pelo catálogo
+        
+        Args:
+            nome_produto: Nome completo, slug ou nome simplificado do produto
+            adicionar: True para o botão "Add to cart", False para "Remove"
+        
+        Returns:
+            str: Id do botão (ex.: "add-to-cart-sauce-labs-backpack")
+        """
+        try:
+            produto = CatalogoProdutos.obter(self.driver).buscar(nome_produto)
+            return produto.data_test_adicionar if adicionar else produto.data_test_remover
+        except KeyError:
+            # Produto fora do catálogo: monta o id pelo padrão "sauce-labs-<nome>"
+            template = self.BOTAO_ADICIONAR_PRODUTO_TEMPLATE if adicionar else self.BOTAO_REMOVER_PRODUTO_TEMPLATE
+            return template.format(nome_produto)
+    
     def adicionar_produto_ao_carrinho(self, nome_produto):
         """
         Adiciona um produto específico ao carrinho
         
         Args:
-            nome_produto: Nome do produto (ex: "backpack", "bike-light")
+            nome_produto: Nome do produto (ex: "backpack", "bike-light" ou "Sauce Labs Backpack")
         """
         try:
             # Primeiro, tentar pelo ID do botão (mais rápido)
-            id_botao = self.BOTAO_ADICIONAR_PRODUTO_TEMPLATE.format(nome_produto)
+            id_botao = self._id_botao(nome_produto, adicionar=True)
             locator_botao = (By.ID, id_botao)
             
             botao_adicionar = self.wait.until(
@@ -140,14 +222,12 @@ class ProductsPage:
             
             # Se falhar, tentar encontrar pelo nome do produto (mais robusto)
             try:
-                dados_produtos = self.obter_dados_produtos()
-                for produto in dados_produtos:
-                    if nome_produto.lower() in produto['nome'].lower():
-                        # Encontrar o botão dentro do elemento do produto
-                        botao = produto['elemento'].find_element(By.TAG_NAME, "button")
-                        if "Add to cart" in botao.text or "Add" in botao.text:
-                            botao.click()
-                            print(f"Produto '{produto['nome']}' adicionado ao carrinho (por nome)")
+                for produto in self.obter_produtos_em_lote():
+                    if nome_produto.lower() in produto.nome.lower():
+                        # Botão já vem na extração em lote
+                        if produto.botao is not None and produto.pode_adicionar:
+                            produto.botao.click()
+                            print(f"Produto '{produto.nome}' adicionado ao carrinho (por nome)")
                             return True
             except Exception as e2:
                 print(f"Erro ao adicionar produto '{nome_produto}' por nome: {e2}")
@@ -159,10 +239,10 @@ class ProductsPage:
         Remove um produto específico do carrinho
         
         Args:
-            nome_produto: Nome do produto (ex: "backpack", "bike-light")
+            nome_produto: Nome do produto (ex: "backpack", "bike-light" ou "Sauce Labs Backpack")
         """
         # Construir o ID do botão baseado no nome do produto
-        id_botao = self.BOTAO_REMOVER_CARRINHO.format(nome_produto)
+        id_botao = self._id_botao(nome_produto, adicionar=False)
         locator_botao = (By.ID, id_botao)
         
         try:
@@ -183,14 +263,14 @@ class ProductsPage:
         Returns:
             int: Quantidade de itens no carrinho (0 se vazio)
         """
-        try:
-            contador = self.driver.find_element(*self.CONTADOR_ITENS_CARRINHO)
-            quantidade = int(contador.text)
-            print(f"Quantidade de itens no carrinho: {quantidade}")
-            return quantidade
-        except:
+        # Sem espera: o contador só existe quando há itens no carrinho
+        contadores = self.driver.find_elements(*self.CONTADOR_ITENS_CARRINHO)
+        if not contadores:
             print("Carrinho está vazio")
             return 0
+        quantidade = int(contadores[0].text)
+        print(f"Quantidade de itens no carrinho: {quantidade}")
+        return quantidade
     
     def clicar_no_carrinho(self):
         """Clica no ícone do carrinho para acessá-lo"""
@@ -198,6 +278,7 @@ class ProductsPage:
             EC.element_to_be_clickable(self.BOTAO_CARRINHO)
         )
         botao_carrinho.click()
+        MetricasNavegador.coletar_apos_navegacao(self.driver, "cart.html")
         print("Carrinho acessado")
     
     def ir_para_carrinho(self):
@@ -250,21 +331,15 @@ class ProductsPage:
         Returns:
             list: Lista de produtos adicionados com seus nomes e preços
         """
-        elementos = self.obter_elementos_produtos()
         selecionados = []
 
-        for elemento in elementos:
+        for produto in self.obter_produtos_em_lote():
+            if produto.botao is None or not produto.pode_adicionar:
+                continue
             try:
-                nome = elemento.find_element(By.CLASS_NAME, "inventory_item_name").text.strip()
-                preco_texto = elemento.find_element(By.CLASS_NAME, "inventory_item_price").text.strip().replace("$", "").replace(",", "")
-                preco = float(preco_texto)
-                
-                # Botão dentro do elemento
-                botao = elemento.find_element(By.TAG_NAME, "button")
-                if "Add to cart" in botao.text or "Add" in botao.text or botao.get_attribute("data-test").startswith("add-to-cart"):
-                    botao.click()
-                    selecionados.append({"nome": nome, "preco": preco})
-                    print(f"Produto adicionado: {nome} - ${preco}")
+                produto.botao.click()
+                selecionados.append({"nome": produto.nome, "preco": produto.preco})
+                print(f"Produto adicionado: {produto.nome} - ${produto.preco}")
             except Exception as e:
                 print(f"Falha ao adicionar item: {e}")
 
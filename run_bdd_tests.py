@@ -4,12 +4,27 @@ Script para executar testes BDD com Behave
 Gera relatórios HTML e Allure com screenshots
 """
 
+import argparse
+import glob
+import importlib.util
+import json
 import os
+import shutil
+import statistics
 import sys
 import subprocess
 import time
 from datetime import datetime
 
+from config.test_config import TestConfig
+from run_tests import calcular_workers
+
+# Saídas de cada worker da execução paralela (consolidadas em reports/ ao final)
+DIRETORIO_WORKERS = os.path.join("reports", "behave_workers")
+
+# Duração assumida para cenários ainda sem histórico
+DURACAO_PADRAO_CENARIO = 30.0
+
 
 def criar_diretorios():
     """Cria os diretórios necessários para relatórios"""
@@ -33,6 +48,8 @@ def executar_testes_behave():
         "--verbose",
         "--format=pretty",
         "--outfile=reports/behave_report.txt",
+        "--format=json",
+        "--outfile=reports/behave_report.json",
         "--tags=~@skip"
     ]
     
@@ -41,7 +58,9 @@ def executar_testes_behave():
     
     try:
         # Executar os testes
+        inicio = time.time()
         resultado = subprocess.run(comando, capture_output=True, text=True)
+        _atualizar_duracoes("reports/behave_report.json", inicio)
         
         # Exibir saída
         if resultado.stdout:
@@ -61,6 +80,266 @@ def executar_testes_behave():
         return False
 
 
+def descobrir_cenarios(diretorio="features", tags_excluidas=("skip",)):
+    """
+    Lista os cenários dos arquivos .feature com o parser do Behave
+    
+    Args:
+        diretorio: Diretório dos arquivos .feature
+        tags_excluidas: Cenários com estas tags não são executados (como --tags=~@skip)
+    
+    Returns:
+        list[dict]: Cenários com "chave" (arquivo::nome) e "local" (arquivo:linha)
+    """
+    from behave.parser import parse_file
+    
+    cenarios = []
+    for arquivo in sorted(glob.glob(os.path.join(diretorio, "**", "*.feature"), recursive=True)):
+        feature = parse_file(arquivo)
+        if feature is None:
+            continue
+        # walk_scenarios já expande os exemplos de Scenario Outline em cenários individuais
+        for cenario in feature.walk_scenarios():
+            if set(tags_excluidas) & set(cenario.effective_tags):
+                continue
+            cenarios.append({
+                "chave": f"{arquivo}::{cenario.name}",
+                "local": f"{arquivo}:{cenario.line}",
+            })
+    return cenarios
+
+
+def carregar_duracoes():
+    """Carrega a duração (s) de cada cenário gravada pela última execução"""
+    try:
+        with open(TestConfig.BEHAVE_TIMINGS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def distribuir_cenarios(cenarios, workers, duracoes):
+    """
+    Distribui os cenários entre os workers, do mais longo para o mais curto
+    
+    Cada cenário vai para o worker com menor carga acumulada (LPT), o que
+    evita que um cenário lento fique por último em um worker já ocupado.
+    
+    Args:
+        cenarios: Cenários de descobrir_cenarios
+        workers: Quantidade de workers
+        duracoes: Duração conhecida de cada cenário (chave -> segundos)
+    
+    Returns:
+        list[list[dict]]: Cenários de cada worker (vazios são descartados)
+    """
+    duracao_padrao = statistics.median(duracoes.values()) if duracoes else DURACAO_PADRAO_CENARIO
+    ordenados = sorted(cenarios, key=lambda c: duracoes.get(c["chave"], duracao_padrao), reverse=True)
+    
+    grupos = [[] for _ in range(workers)]
+    cargas = [0.0] * workers
+    for cenario in ordenados:
+        indice = cargas.index(min(cargas))
+        grupos[indice].append(cenario)
+        cargas[indice] += duracoes.get(cenario["chave"], duracao_padrao)
+    return [grupo for grupo in grupos if grupo]
+
+
+def _comando_worker(indice, cenarios):
+    """
+    Monta o comando behave de um worker
+    
+    Cada --format tem o próprio -o: o behave pareia formatos e saídas pela
+    posição e recusa mais saídas que formatos. O format=pretty do behave.ini
+    vem antes dos da linha de comando e fica com a própria saída padrão.
+    """
+    diretorio_worker = os.path.join(DIRETORIO_WORKERS, f"bdd{indice}")
+    comando = ["behave", "--tags=~@skip"]
+    comando += [
+        "--format=pretty", "-o", os.path.join(diretorio_worker, "behave_report.txt"),
+        "--format=json", "-o", os.path.join(diretorio_worker, "behave_report.json"),
+    ]
+    if importlib.util.find_spec("allure_behave") is not None:
+        # Resultados Allure têm nomes únicos: todos os workers gravam no mesmo diretório
+        comando += ["--format=allure_behave.formatter:AllureFormatter", "-o", "reports/allure-results"]
+    comando += [cenario["local"] for cenario in cenarios]
+    return comando
+
+
+def executar_testes_behave_paralelo(workers=None):
+    """
+    Executa os cenários em N processos behave, cada um com o próprio Chrome
+    
+    Args:
+        workers: Quantidade de workers (calculada por CPU e memória se não especificada)
+    """
+    print("=" * 60)
+    print("🚀 INICIANDO EXECUÇÃO PARALELA DOS TESTES BDD")
+    print("=" * 60)
+    
+    cenarios = descobrir_cenarios()
+    if not cenarios:
+        print("❌ Nenhum cenário encontrado em features/")
+        return False
+    
+    workers = min(workers or calcular_workers(), len(cenarios))
+    grupos = distribuir_cenarios(cenarios, workers, carregar_duracoes())
+    
+    shutil.rmtree(DIRETORIO_WORKERS, ignore_errors=True)
+    inicio = time.time()
+    
+    # O servidor local (se ativo) sobe uma vez aqui e é compartilhado pelos workers
+    from servidor_local.servidor import garantir_servidor_local
+    servidor = garantir_servidor_local()
+    
+    processos = []
+    try:
+        for indice, grupo in enumerate(grupos):
+            os.makedirs(os.path.join(DIRETORIO_WORKERS, f"bdd{indice}"), exist_ok=True)
+            comando = _comando_worker(indice, grupo)
+            ambiente = os.environ.copy()
+            ambiente["SAUCE_WORKER_ID"] = f"bdd{indice}"
+            print(f"⚡ Worker bdd{indice}: {len(grupo)} cenários")
+            print(f"📋 Comando: {' '.join(comando)}")
+            log = open(os.path.join(DIRETORIO_WORKERS, f"bdd{indice}", "saida.log"), 'w', encoding='utf-8')
+            processos.append((subprocess.Popen(comando, stdout=log, stderr=subprocess.STDOUT, env=ambiente), log))
+        
+        codigos = []
+        for processo, log in processos:
+            codigos.append(processo.wait())
+            log.close()
+    finally:
+        if servidor:
+            servidor.parar()
+    
+    print("-" * 60)
+    consolidar_relatorios(len(grupos), inicio)
+    print(f"📊 Códigos de retorno: {codigos}")
+    return all(codigo == 0 for codigo in codigos)
+
+
+def consolidar_relatorios(workers, inicio=0):
+    """
+    Junta as saídas dos workers em reports/behave_report.txt e .json,
+    atualiza as durações dos cenários em TestConfig.BEHAVE_TIMINGS_FILE
+    e junta os tempos das ações (SAUCE_INSTRUMENTAR_ACOES=1), as linhas
+    do tempo (SAUCE_LINHA_DO_TEMPO=1), as métricas do navegador (SAUCE_METRICAS_NAVEGADOR=1)
+    e os logs JSON (SAUCE_FORMATO_LOGS=json) dos workers
+    
+    Args:
+        workers: Quantidade de workers executados
+        inicio: Início da execução (epoch); arquivos de workers anteriores a ele são ignorados
+    """
+    textos = []
+    features = {}
+    for indice in range(workers):
+        diretorio_worker = os.path.join(DIRETORIO_WORKERS, f"bdd{indice}")
+        
+        caminho_txt = os.path.join(diretorio_worker, "behave_report.txt")
+        if os.path.exists(caminho_txt):
+            with open(caminho_txt, 'r', encoding='utf-8') as f:
+                textos.append(f"# ===== Worker bdd{indice} =====\n{f.read()}")
+        
+        caminho_json = os.path.join(diretorio_worker, "behave_report.json")
+        try:
+            with open(caminho_json, 'r', encoding='utf-8') as f:
+                dados = json.load(f)
+        except (OSError, ValueError):
+            print(f"⚠️  Relatório JSON do worker bdd{indice} não encontrado")
+            continue
+        
+        # A mesma feature aparece em vários workers: junta os cenários em uma entrada
+        for feature in dados:
+            existente = features.setdefault(feature["location"], dict(feature, elements=[]))
+            existente["elements"].extend(feature.get("elements", []))
+            if feature.get("status") == "failed":
+                existente["status"] = "failed"
+    
+    for feature in features.values():
+        feature["elements"].sort(key=lambda e: int(e.get("location", ":0").rsplit(":", 1)[-1]))
+    
+    with open("reports/behave_report.txt", 'w', encoding='utf-8') as f:
+        f.write("\n".join(textos))
+    with open("reports/behave_report.json", 'w', encoding='utf-8') as f:
+        json.dump(list(features.values()), f, indent=2, ensure_ascii=False)
+    
+    _gravar_duracoes(features.values())
+    print("✅ Relatórios dos workers consolidados em reports/behave_report.txt e reports/behave_report.json")
+    
+    if TestConfig.INSTRUMENTAR_ACOES:
+        # Import local: só carrega o Selenium quando a instrumentação está ativa
+        from utils.instrumentacao import mesclar as mesclar_tempos_acoes
+        arquivos = _arquivos_workers(TestConfig.TEMPOS_ACOES_FILE, workers)
+        if arquivos:
+            mesclar_tempos_acoes(arquivos, desde=inicio)
+    
+    if TestConfig.LINHA_DO_TEMPO:
+        # Import local: só carrega o Selenium quando a linha do tempo está ativa
+        from utils.linha_do_tempo import mesclar
+        # Sem arquivos dos workers, mesclar([]) juntaria os de qualquer execução anterior
+        arquivos = _arquivos_workers(TestConfig.LINHA_DO_TEMPO_FILE, workers)
+        if arquivos:
+            mesclar(arquivos, desde=inicio)
+    
+    if TestConfig.COLETAR_METRICAS_NAVEGADOR:
+        # Import local: só carrega o Selenium quando as métricas estão ativas
+        from utils.metricas_navegador import mesclar as mesclar_metricas
+        arquivos = _arquivos_workers(TestConfig.METRICAS_NAVEGADOR_FILE, workers)
+        if arquivos:
+            mesclar_metricas(arquivos, desde=inicio)
+    
+    if TestConfig.FORMATO_LOGS == "json":
+        from utils.logger import mesclar_logs
+        # Cada worker grava logs/bdd<N>/eventos.jsonl
+        nome = os.path.basename(TestConfig.LOG_JSON_FILE)
+        arquivos = [os.path.join("logs", f"bdd{indice}", nome) for indice in range(workers)]
+        arquivos = [caminho for caminho in arquivos if os.path.exists(caminho)]
+        if arquivos:
+            saida, total = mesclar_logs(arquivos, desde=inicio)
+            print(f"📄 {total} registros de log dos workers mesclados em: {saida}")
+
+
+def _arquivos_workers(padrao, workers):
+    """
+    Arquivos por worker existentes, a partir do caminho de um arquivo de TestConfig
+
+    Ex.: reports/tempos_acoes.json -> reports/tempos_acoes_bdd0.json, reports/tempos_acoes_bdd1.json...
+    """
+    base, extensao = os.path.splitext(padrao)
+    caminhos = (f"{base}_bdd{indice}{extensao}" for indice in range(workers))
+    return [caminho for caminho in caminhos if os.path.exists(caminho)]
+
+
+def _atualizar_duracoes(caminho_json, inicio):
+    """Atualiza as durações dos cenários com o relatório JSON da execução serial"""
+    if not os.path.exists(caminho_json) or os.path.getmtime(caminho_json) < inicio:
+        return
+    try:
+        with open(caminho_json, 'r', encoding='utf-8') as f:
+            _gravar_duracoes(json.load(f))
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Durações dos cenários não atualizadas: {e}")
+
+
+def _gravar_duracoes(features):
+    """Atualiza TestConfig.BEHAVE_TIMINGS_FILE com a duração de cada cenário executado"""
+    duracoes = carregar_duracoes()
+    for feature in features:
+        arquivo = feature["location"].rsplit(":", 1)[0]
+        for elemento in feature["elements"]:
+            if elemento.get("type") == "background":
+                continue
+            duracao = sum(
+                passo.get("result", {}).get("duration", 0.0)
+                for passo in elemento.get("steps", [])
+            )
+            duracoes[f"{arquivo}::{elemento['name']}"] = round(duracao, 3)
+    
+    os.makedirs(os.path.dirname(TestConfig.BEHAVE_TIMINGS_FILE), exist_ok=True)
+    with open(TestConfig.BEHAVE_TIMINGS_FILE, 'w', encoding='utf-8') as f:
+        json.dump(duracoes, f, indent=2, ensure_ascii=False, sort_keys=True)
+
+
 def gerar_relatorio_allure():
     """Gera relatório Allure a partir dos resultados"""
     print("\n" + "=" * 60)
@@ -160,9 +439,14 @@ def mostrar_resumo():
         else:
             print(f"❌ {arquivo} (não encontrado)")
     
-    # Contar screenshots
+    # Contar screenshots (inclui os subdiretórios de cada worker)
     if os.path.exists("screenshots"):
-        screenshots = [f for f in os.listdir("screenshots") if f.endswith('.png')]
+        screenshots = [
+            arquivo
+            for _, _, arquivos in os.walk("screenshots")
+            for arquivo in arquivos
+            if arquivo.endswith('.png')
+        ]
         print(f"📸 Screenshots capturados: {len(screenshots)}")
     
     # Contar resultados Allure
@@ -173,6 +457,11 @@ def mostrar_resumo():
 
 def main():
     """Função principal"""
+    parser = argparse.ArgumentParser(description="Executa os testes BDD do Sauce Demo")
+    parser.add_argument("--paralelo", action="store_true", help="Distribui os cenários entre processos behave")
+    parser.add_argument("--workers", type=int, help="Quantidade de workers (padrão: calculada por CPU e memória)")
+    args = parser.parse_args()
+    
     print("🛒 AUTOMAÇÃO BDD - SAUCE DEMO")
     print("=" * 60)
     
@@ -180,7 +469,10 @@ def main():
     criar_diretorios()
     
     # Executar testes
-    sucesso = executar_testes_behave()
+    if args.paralelo or args.workers:
+        sucesso = executar_testes_behave_paralelo(args.workers)
+    else:
+        sucesso = executar_testes_behave()
     
     if sucesso:
         print("\n✅ Todos os testes BDD executados com sucesso!")
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Benchmarks da camada de automação
+Mede, contra a réplica local do Sauce Demo, o custo de iniciar o driver e das
+principais ações dos page objects, com iterações repetidas e estatísticas
+"""
+
+import os
+
+# Os benchmarks medem o framework, não a rede: usam a réplica local por padrão
+# (definido antes de importar TestConfig, que lê o ambiente na importação)
+os.environ.setdefault("SAUCE_SERVIDOR_LOCAL", "1")
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import datetime
+
+from selenium.webdriver.support import expected_conditions as EC
+
+from config.test_config import TestConfig
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from servidor_local.servidor import garantir_servidor_local
+from utils.test_helpers import MotorEspera, TestHelpers
+from utils.webdriver_config import WebDriverConfig
+
+USUARIO = "standard_user"
+SENHA = "secret_sauce"
+PRODUTOS_CARRINHO = ["backpack", "bike-light", "onesie"]
+
+
+def cronometrar(medir, preparar=None, iteracoes=10, aquecimento=2):
+    """
+    Executa uma operação repetidas vezes e retorna as durações medidas
+
+    Args:
+        medir: Operação medida
+        preparar: Executado antes de cada iteração, fora da medição (opcional)
+        iteracoes: Iterações medidas
+        aquecimento: Iterações iniciais descartadas
+
+    Returns:
+        list[float]: Duração de cada iteração medida, em segundos
+    """
+    duracoes = []
+    for iteracao in range(aquecimento + iteracoes):
+        if preparar:
+            preparar()
+        inicio = time.perf_counter()
+        medir()
+        duracao = time.perf_counter() - inicio
+        if iteracao >= aquecimento:
+            duracoes.append(duracao)
+    return duracoes
+
+
+# ------------------------------------------------------------------ benchmarks
+
+def benchmark_obter_driver(perfil, iteracoes, aquecimento):
+    """WebDriverConfig.obter_driver: inicialização do Chrome (o quit fica fora da medição)"""
+    drivers = []
+
+    def medir():
+        drivers.append(WebDriverConfig().obter_driver(perfil))
+
+    def preparar():
+        while drivers:
+            WebDriverConfig.fechar_driver(drivers.pop())
+
+    try:
+        return cronometrar(medir, preparar, iteracoes, aquecimento)
+    finally:
+        preparar()
+
+
+def benchmark_fazer_login(driver, iteracoes, aquecimento):
+    """LoginPage.fazer_login a partir da página de login, sem sessão"""
+    pagina = LoginPage(driver)
+
+    def preparar():
+        driver.delete_all_cookies()
+        driver.get(TestConfig.LOGIN_URL)
+        MotorEspera.aguardar(driver, EC.element_to_be_clickable(LoginPage.BOTAO_LOGIN), "botão de login")
+
+    def medir():
+        pagina.fazer_login(USUARIO, SENHA)
+
+    duracoes = cronometrar(medir, preparar, iteracoes, aquecimento)
+    MotorEspera.aguardar_url_conter(driver, "inventory")
+    return duracoes
+
+
+def benchmark_obter_dados_produtos(driver, iteracoes, aquecimento):
+    """ProductsPage.obter_dados_produtos na página de produtos"""
+    LoginPage(driver).entrar(USUARIO, SENHA)
+    pagina = ProductsPage(driver)
+    return cronometrar(pagina.obter_dados_produtos, None, iteracoes, aquecimento)
+
+
+def benchmark_obter_itens_carrinho(driver, iteracoes, aquecimento):
+    """CartPage.obter_itens_carrinho com três itens no carrinho"""
+    LoginPage(driver).entrar(USUARIO, SENHA)
+    pagina = CartPage(driver)
+    pagina.preparar_carrinho(PRODUTOS_CARRINHO)
+    return cronometrar(pagina.obter_itens_carrinho, None, iteracoes, aquecimento)
+
+
+def benchmark_obter_resumo_valores(driver, iteracoes, aquecimento):
+    """CheckoutPage.obter_resumo_valores na etapa 2 do checkout"""
+    LoginPage(driver).entrar(USUARIO, SENHA)
+    CartPage(driver).preparar_carrinho(PRODUTOS_CARRINHO)
+    CartPage(driver).ir_para_checkout()
+    pagina = CheckoutPage(driver)
+    pagina.preencher_informacoes("João", "Silva", "12345-678")
+    pagina.continuar_checkout()
+    MotorEspera.aguardar(driver, EC.presence_of_element_located(CheckoutPage.TOTAL_LABEL), "resumo do checkout")
+    return cronometrar(pagina.obter_resumo_valores, None, iteracoes, aquecimento)
+
+
+# Benchmarks que usam um driver compartilhado (obter_driver cria os próprios)
+BENCHMARKS_PAGINAS = {
+    "LoginPage.fazer_login": benchmark_fazer_login,
+    "ProductsPage.obter_dados_produtos": benchmark_obter_dados_produtos,
+    "CartPage.obter_itens_carrinho": benchmark_obter_itens_carrinho,
+    "CheckoutPage.obter_resumo_valores": benchmark_obter_resumo_valores,
+}
+BENCHMARK_DRIVER = "WebDriverConfig.obter_driver"
+
+
+def estatisticas(duracoes):
+    """Resumo estatístico das durações (segundos)"""
+    resumo = TestHelpers.resumir_duracoes(duracoes)
+    desvio = statistics.stdev(duracoes) if len(duracoes) > 1 else 0.0
+    resumo.update({
+        "min": round(min(duracoes), 4),
+        "desvio_padrao": round(desvio, 4),
+        # Coeficiente de variação: acima de ~10% a medição está ruidosa
+        "cv": round(desvio / resumo["media"], 4) if resumo["media"] else 0.0,
+    })
+    return resumo
+
+
+def executar_benchmarks(nomes, perfil, iteracoes, aquecimento):
+    """
+    Executa os benchmarks selecionados
+
+    Returns:
+        dict: nome -> estatísticas
+    """
+    resultados = {}
+    if BENCHMARK_DRIVER in nomes:
+        print(f"⏱️  {BENCHMARK_DRIVER}...")
+        resultados[BENCHMARK_DRIVER] = estatisticas(benchmark_obter_driver(perfil, iteracoes, aquecimento))
+
+    selecionados = [nome for nome in BENCHMARKS_PAGINAS if nome in nomes]
+    if not selecionados:
+        return resultados
+
+    driver = WebDriverConfig().obter_driver(perfil)
+    try:
+        for nome in selecionados:
+            print(f"⏱️  {nome}...")
+            # Cada benchmark parte de um navegador sem sessão nem carrinho
+            driver.delete_all_cookies()
+            driver.get(TestConfig.LOGIN_URL)
+            driver.execute_script("window.localStorage.clear();")
+            LoginPage.limpar_cache_sessoes()
+            resultados[nome] = estatisticas(BENCHMARKS_PAGINAS[nome](driver, iteracoes, aquecimento))
+    finally:
+        WebDriverConfig.fechar_driver(driver)
+    return resultados
+
+
+def mostrar_resultados(resultados, anterior=None):
+    """Exibe a tabela de resultados (em ms), com a variação da mediana se houver resultado anterior"""
+    print("\n" + "=" * 90)
+    print("📊 BENCHMARKS (ms)")
+    print("=" * 90)
+    print(f"{'Benchmark':<36}{'p50':>9}{'média':>9}{'p95':>9}{'min':>9}{'max':>9}{'cv':>7}  {'Δ p50':>8}")
+    for nome, resumo in resultados.items():
+        variacao = ""
+        base = (anterior or {}).get(nome)
+        if base and base["p50"]:
+            variacao = f"{(resumo['p50'] - base['p50']) / base['p50']:+.1%}"
+        print(f"{nome:<36}{resumo['p50'] * 1000:>9.1f}{resumo['media'] * 1000:>9.1f}{resumo['p95'] * 1000:>9.1f}"
+              f"{resumo['min'] * 1000:>9.1f}{resumo['max'] * 1000:>9.1f}{resumo['cv']:>7.1%}  {variacao:>8}")
+
+
+def main():
+    """Função principal"""
+    todos = [BENCHMARK_DRIVER] + list(BENCHMARKS_PAGINAS)
+    parser = argparse.ArgumentParser(description="Benchmarks da camada de automação (réplica local)")
+    parser.add_argument("--iteracoes", type=int, default=10, help="Iterações medidas por benchmark")
+    parser.add_argument("--aquecimento", type=int, default=2, help="Iterações iniciais descartadas")
+    parser.add_argument("--perfil", default="headless", help="Perfil de navegador (padrão: headless)")
+    parser.add_argument("--apenas", nargs="+", choices=todos, default=todos, metavar="BENCHMARK",
+                        help=f"Benchmarks a executar: {', '.join(todos)}")
+    parser.add_argument("--comparar", help="Resultado anterior (JSON) para calcular a variação")
+    parser.add_argument("--saida", help="Arquivo JSON do resultado (padrão: reports/benchmarks_<timestamp>.json)")
+    args = parser.parse_args()
+
+    print("🛒 BENCHMARKS - SAUCE DEMO")
+    print("=" * 60)
+    print(f"🌐 Alvo: {TestConfig.BASE_URL} - {args.iteracoes} iterações (+{args.aquecimento} de aquecimento)")
+
+    anterior = None
+    if args.comparar:
+        with open(args.comparar, 'r', encoding='utf-8') as f:
+            anterior = json.load(f)["resultados"]
+
+    servidor = garantir_servidor_local()
+    try:
+        resultados = executar_benchmarks(args.apenas, args.perfil, args.iteracoes, args.aquecimento)
+    finally:
+        if servidor:
+            servidor.parar()
+
+    mostrar_resultados(resultados, anterior)
+
+    saida = args.saida or os.path.join(
+        TestConfig.REPORTS_DIR, f"benchmarks_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(saida) or ".", exist_ok=True)
+    with open(saida, 'w', encoding='utf-8') as f:
+        json.dump({
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "base_url": TestConfig.BASE_URL,
+            "perfil": args.perfil,
+            "iteracoes": args.iteracoes,
+            "aquecimento": args.aquecimento,
+            "resultados": resultados,
+        }, f, indent=2, ensure_ascii=False)
+    print(f"📄 Resultado gravado em: {saida}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Teste de carga do Sauce Demo
+Repete o fluxo completo de compra como vários usuários virtuais e mede
+vazão, latência por etapa (p50/p95/p99) e taxa de erro
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+
+from config.test_config import TestConfig
+from servidor_local.servidor import garantir_servidor_local
+from utils.jornadas_assincronas import (
+    SENHA_SAUCE_DEMO,
+    USUARIO_BLOQUEADO,
+    USUARIOS_SAUCE_DEMO,
+    ExecutorJornadas,
+    jornada_compra_completa,
+    marcar_falha_esperada,
+)
+from utils.test_data_loader import TestDataLoader
+from utils.test_helpers import TestHelpers
+
+# Ordem das etapas no relatório ("fila" só existe no modo por taxa de chegada)
+ETAPAS = ["fila", "navegador", "login", "produtos", "carrinho", "checkout", "finalizacao"]
+
+
+def carregar_usuarios():
+    """
+    Usuários que fazem login, dos dados de teste
+
+    Só o tipo "bloqueado" fica de fora. As falhas propositais dos usuários de
+    FALHAS_ESPERADAS são contadas à parte e não entram na taxa de erro.
+
+    Returns:
+        list[tuple]: Pares (usuário, senha)
+    """
+    usuarios = [
+        (usuario["username"], usuario["password"])
+        for usuario in TestDataLoader().obter_usuarios_validos()
+    ]
+    if not usuarios:
+        print("⚠️  Nenhum usuário nos dados de teste, usando os usuários padrão do Sauce Demo")
+        usuarios = [(usuario, SENHA_SAUCE_DEMO) for usuario in USUARIOS_SAUCE_DEMO if usuario != USUARIO_BLOQUEADO]
+    return usuarios
+
+
+async def carga_por_concorrencia(executor, usuarios, duracao, max_jornadas=None):
+    """
+    Modelo fechado: cada usuário virtual repete o fluxo até o fim da duração
+
+    Args:
+        executor: ExecutorJornadas (a concorrência dele define os usuários virtuais)
+        usuarios: Pares (usuário, senha), usados em rodízio
+        duracao: Duração da carga em segundos
+        max_jornadas: Limite de jornadas iniciadas (opcional)
+
+    Returns:
+        list[ResultadoJornada]: Resultados de todas as jornadas
+    """
+    loop = asyncio.get_running_loop()
+    fim = loop.time() + duracao
+    sequencia = itertools.count()
+
+    async def usuario_virtual(indice):
+        resultados = []
+        while loop.time() < fim:
+            numero = next(sequencia)
+            if max_jornadas is not None and numero >= max_jornadas:
+                break
+            usuario, senha = usuarios[numero % len(usuarios)]
+            resultado = await executor.executar_jornada(
+                f"vu{indice}-{numero}", jornada_compra_completa, usuario, senha
+            )
+            resultados.append(marcar_falha_esperada(resultado, usuario))
+        return resultados
+
+    por_usuario = await asyncio.gather(*(usuario_virtual(indice) for indice in range(executor.concorrencia)))
+    return [resultado for resultados in por_usuario for resultado in resultados]
+
+
+async def carga_por_taxa(executor, usuarios, taxa, duracao, max_jornadas=None):
+    """
+    Modelo aberto: inicia jornadas a uma taxa fixa, independente das que estão em andamento
+
+    Chegadas acima da concorrência do executor aguardam um navegador; esse
+    tempo é registrado como a etapa "fila".
+
+    Args:
+        executor: ExecutorJornadas
+        usuarios: Pares (usuário, senha), usados em rodízio
+        taxa: Jornadas iniciadas por segundo
+        duracao: Duração da carga em segundos
+        max_jornadas: Limite de jornadas iniciadas (opcional)
+
+    Returns:
+        list[ResultadoJornada]: Resultados de todas as jornadas
+    """
+    loop = asyncio.get_running_loop()
+
+    async def chegada(numero):
+        usuario, senha = usuarios[numero % len(usuarios)]
+        inicio = time.perf_counter()
+        resultado = await executor.executar_jornada(f"chegada-{numero}", jornada_compra_completa, usuario, senha)
+        resultado.etapas["fila"] = max(0.0, time.perf_counter() - inicio - resultado.duracao)
+        return marcar_falha_esperada(resultado, usuario)
+
+    inicio = loop.time()
+    tarefas = []
+    for numero in itertools.count():
+        agendado = inicio + numero / taxa
+        if agendado - inicio >= duracao or (max_jornadas is not None and numero >= max_jornadas):
+            break
+        await asyncio.sleep(max(0.0, agendado - loop.time()))
+        tarefas.append(asyncio.create_task(chegada(numero)))
+    return list(await asyncio.gather(*tarefas))
+
+
+def resumir_carga(resultados, duracao_total, parametros):
+    """
+    Consolida os resultados da carga
+
+    Args:
+        resultados: Lista de ResultadoJornada
+        duracao_total: Duração real da carga em segundos
+        parametros: Parâmetros da execução (gravados no relatório)
+
+    Returns:
+        dict: Vazão, taxa de erro, percentis da jornada e de cada etapa, erros mais frequentes
+        e falhas esperadas (FALHAS_ESPERADAS), que ficam fora da taxa de erro
+    """
+    concluidas = [resultado for resultado in resultados if resultado.sucesso]
+    esperadas = [resultado for resultado in resultados if resultado.falha_esperada]
+    falhas = [resultado for resultado in resultados if not resultado.sucesso and not resultado.falha_esperada]
+
+    etapas = {}
+    for etapa in ETAPAS:
+        duracoes = [resultado.etapas[etapa] for resultado in resultados if etapa in resultado.etapas]
+        if duracoes:
+            etapas[etapa] = TestHelpers.resumir_duracoes(duracoes)
+            etapas[etapa]["falhas"] = sum(1 for resultado in falhas if resultado.etapa_falha == etapa)
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "base_url": TestConfig.BASE_URL,
+        "parametros": parametros,
+        "duracao_s": round(duracao_total, 3),
+        "jornadas": len(resultados),
+        "concluidas": len(concluidas),
+        "falhas": len(falhas),
+        "falhas_esperadas": len(esperadas),
+        "taxa_erro": round(len(falhas) / len(resultados), 4) if resultados else 0.0,
+        "vazao_jornadas_por_s": round(len(concluidas) / duracao_total, 4) if duracao_total else 0.0,
+        "jornada": TestHelpers.resumir_duracoes(resultado.duracao for resultado in concluidas),
+        "etapas": etapas,
+        "erros": [
+            {"etapa": etapa, "erro": erro, "ocorrencias": quantidade}
+            for (etapa, erro), quantidade in Counter(
+                (resultado.etapa_falha, resultado.erro.splitlines()[0]) for resultado in falhas
+            ).most_common(10)
+        ],
+        "erros_esperados": [
+            {"etapa": etapa, "motivo": motivo, "ocorrencias": quantidade}
+            for (etapa, motivo), quantidade in Counter(
+                (resultado.etapa_falha, resultado.falha_esperada) for resultado in esperadas
+            ).most_common()
+        ],
+    }
+
+
+def mostrar_resumo(resumo):
+    """Exibe o resumo da carga no console"""
+    print("\n" + "=" * 60)
+    print("📊 RESULTADO DA CARGA")
+    print("=" * 60)
+    print(f"🌐 Alvo: {resumo['base_url']}")
+    print(f"⏱️  Duração: {resumo['duracao_s']:.1f}s - {resumo['jornadas']} jornadas")
+    print(f"✅ Concluídas: {resumo['concluidas']}  ❌ Falhas: {resumo['falhas']} "
+          f"(taxa de erro {resumo['taxa_erro']:.1%})  ⚠️  Falhas esperadas: {resumo['falhas_esperadas']}")
+    print(f"🚀 Vazão: {resumo['vazao_jornadas_por_s']:.2f} jornadas/s")
+    print("-" * 60)
+    print(f"{'Etapa':<14}{'n':>6}{'p50':>9}{'p95':>9}{'p99':>9}{'falhas':>8}")
+    for etapa, estatisticas in resumo["etapas"].items():
+        print(f"{etapa:<14}{estatisticas['amostras']:>6}{estatisticas['p50']:>9.3f}"
+              f"{estatisticas['p95']:>9.3f}{estatisticas['p99']:>9.3f}{estatisticas['falhas']:>8}")
+    jornada = resumo["jornada"]
+    print(f"{'jornada':<14}{jornada['amostras']:>6}{jornada['p50']:>9.3f}{jornada['p95']:>9.3f}{jornada['p99']:>9.3f}")
+    for erro in resumo["erros"]:
+        print(f"❌ [{erro['etapa']}] {erro['erro']} ({erro['ocorrencias']}x)")
+    for erro in resumo["erros_esperados"]:
+        print(f"⚠️  [{erro['etapa']}] falha esperada: {erro['motivo']} ({erro['ocorrencias']}x)")
+
+
+async def executar_carga(args, usuarios):
+    """Executa a carga no modelo escolhido e retorna (resultados, duração)"""
+    async with ExecutorJornadas(args.concorrencia, perfil=args.perfil) as executor:
+        inicio = time.perf_counter()
+        if args.taxa:
+            resultados = await carga_por_taxa(executor, usuarios, args.taxa, args.duracao, args.jornadas)
+        else:
+            resultados = await carga_por_concorrencia(executor, usuarios, args.duracao, args.jornadas)
+        return resultados, time.perf_counter() - inicio
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Teste de carga com o fluxo completo de compra")
+    parser.add_argument("--concorrencia", type=int, default=TestConfig.CONCORRENCIA_JORNADAS,
+                        help="Usuários virtuais / navegadores simultâneos")
+    parser.add_argument("--taxa", type=float, help="Jornadas iniciadas por segundo (modelo aberto)")
+    parser.add_argument("--duracao", type=float, default=60, help="Duração da carga em segundos")
+    parser.add_argument("--jornadas", type=int, help="Limite de jornadas iniciadas")
+    parser.add_argument("--perfil", help="Perfil de navegador (ex.: headless, leve)")
+    parser.add_argument("--saida", help="Arquivo JSON do resultado (padrão: reports/carga_<timestamp>.json)")
+    args = parser.parse_args()
+
+    print("🛒 TESTE DE CARGA - SAUCE DEMO")
+    print("=" * 60)
+    modelo = f"taxa de {args.taxa}/s" if args.taxa else f"{args.concorrencia} usuários virtuais"
+    print(f"⚡ {modelo}, até {args.concorrencia} navegadores, {args.duracao:.0f}s")
+
+    usuarios = carregar_usuarios()
+    print(f"👥 Usuários: {', '.join(usuario for usuario, _ in usuarios)}")
+
+    servidor = garantir_servidor_local()
+    try:
+        resultados, duracao_total = asyncio.run(executar_carga(args, usuarios))
+    finally:
+        if servidor:
+            servidor.parar()
+
+    resumo = resumir_carga(resultados, duracao_total, {
+        "concorrencia": args.concorrencia,
+        "taxa": args.taxa,
+        "duracao": args.duracao,
+        "jornadas": args.jornadas,
+        "perfil": args.perfil,
+        "usuarios": [usuario for usuario, _ in usuarios],
+    })
+    mostrar_resumo(resumo)
+
+    saida = args.saida or os.path.join(
+        TestConfig.REPORTS_DIR, f"carga_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(saida) or ".", exist_ok=True)
+    with open(saida, 'w', encoding='utf-8') as f:
+        json.dump(resumo, f, indent=2, ensure_ascii=False)
+    print(f"📄 Resultado gravado em: {saida}")
+
+    sys.exit(1 if resumo["falhas"] else 0)
+
+
+if __name__ == "__main__":
+    main()
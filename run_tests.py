@@ -4,12 +4,22 @@ Script para executar testes automatizados do Sauce Demo
 Gera relatórios HTML e Allure com screenshots
 """
 
+import argparse
+import importlib.util
 import os
 import sys
 import subprocess
 import time
 from datetime import datetime
 
+from config.test_config import TestConfig
+from utils.baseline_desempenho import verificar_regressoes
+
+try:
+    import psutil
+except ImportError:  # psutil é opcional: sem ele a memória disponível vem de /proc/meminfo
+    psutil = None
+
 
 def criar_diretorios():
     """Cria os diretórios necessários para relatórios"""
@@ -20,8 +30,51 @@ def criar_diretorios():
             print(f"📁 Diretório criado: {diretorio}")
 
 
-def executar_testes_pytest():
-    """Executa os testes usando pytest"""
+def _memoria_disponivel_mb():
+    """Retorna a memória disponível em MB (None se não for possível medir)"""
+    if psutil is not None:
+        return psutil.virtual_memory().available // (1024 * 1024)
+    try:
+        with open("/proc/meminfo", encoding="utf-8") as f:
+            for linha in f:
+                if linha.startswith("MemAvailable:"):
+                    return int(linha.split()[1]) // 1024
+    except OSError:
+        pass
+    return None
+
+
+def calcular_workers():
+    """
+    Calcula quantos workers do pytest-xdist a máquina comporta
+    
+    Cada worker mantém um Chrome aberto, então o limite é o menor entre
+    a quantidade de CPUs e a memória disponível dividida por
+    TestConfig.MEMORIA_POR_WORKER_MB (e TestConfig.MAX_WORKERS, se definido).
+    
+    Returns:
+        int: Quantidade de workers (mínimo 1)
+    """
+    workers = os.cpu_count() or 1
+    
+    memoria_mb = _memoria_disponivel_mb()
+    if memoria_mb is not None:
+        workers = min(workers, memoria_mb // TestConfig.MEMORIA_POR_WORKER_MB)
+    
+    if TestConfig.MAX_WORKERS:
+        workers = min(workers, TestConfig.MAX_WORKERS)
+    
+    return max(1, workers)
+
+
+def executar_testes_pytest(paralelo=False, workers=None):
+    """
+    Executa os testes usando pytest
+    
+    Args:
+        paralelo: Distribui os testes entre workers do pytest-xdist
+        workers: Quantidade de workers (calculada por CPU e memória se não especificada)
+    """
     print("=" * 60)
     print("🚀 INICIANDO EXECUÇÃO DOS TESTES AUTOMATIZADOS")
     print("=" * 60)
@@ -37,13 +90,28 @@ def executar_testes_pytest():
         "--alluredir=reports/allure-results",
         "--junitxml=reports/junit.xml"
     ]
+    ambiente = os.environ.copy()
+    
+    if paralelo and importlib.util.find_spec("xdist") is None:
+        print("⚠️  pytest-xdist não instalado, executando em série (pip install pytest-xdist)")
+        paralelo = False
+    
+    if paralelo:
+        workers = workers or calcular_workers()
+        # O controlador do xdist consolida report.html e junit.xml; os workers gravam
+        # os resultados Allure (arquivos com UUID) no mesmo diretório
+        comando += ["-n", str(workers), "--dist", "load"]
+        # Um Chrome por worker, reutilizado pelo pool entre os testes daquele worker
+        ambiente["SAUCE_TAMANHO_POOL_DRIVERS"] = "1"
+        ambiente["SAUCE_REUTILIZAR_DRIVERS"] = "1"
+        print(f"⚡ Execução paralela com {workers} workers")
     
     print(f"📋 Comando: {' '.join(comando)}")
     print("-" * 60)
     
     try:
         # Executar os testes
-        resultado = subprocess.run(comando, capture_output=True, text=True)
+        resultado = subprocess.run(comando, capture_output=True, text=True, env=ambiente)
         
         # Exibir saída
         if resultado.stdout:
@@ -162,9 +230,14 @@ def mostrar_resumo():
         else:
             print(f"❌ {arquivo} (não encontrado)")
     
-    # Contar screenshots
+    # Contar screenshots (inclui os subdiretórios de cada worker)
     if os.path.exists("screenshots"):
-        screenshots = [f for f in os.listdir("screenshots") if f.endswith('.png')]
+        screenshots = [
+            arquivo
+            for _, _, arquivos in os.walk("screenshots")
+            for arquivo in arquivos
+            if arquivo.endswith('.png')
+        ]
         print(f"📸 Screenshots capturados: {len(screenshots)}")
     
     # Contar resultados Allure
@@ -175,6 +248,13 @@ def mostrar_resumo():
 
 def main():
     """Função principal"""
+    parser = argparse.ArgumentParser(description="Executa os testes Pytest do Sauce Demo")
+    parser.add_argument("--paralelo", action="store_true", help="Distribui os testes entre workers (pytest-xdist)")
+    parser.add_argument("--workers", type=int, help="Quantidade de workers (padrão: calculada por CPU e memória)")
+    parser.add_argument("--gate-desempenho", action="store_true",
+                        help="Falha a execução se algum teste/etapa ficar mais lento que o baseline")
+    args = parser.parse_args()
+    
     print("🛒 AUTOMAÇÃO DE TESTES - SAUCE DEMO")
     print("=" * 60)
     
@@ -182,21 +262,25 @@ def main():
     criar_diretorios()
     
     # Executar testes
-    sucesso = executar_testes_pytest()
+    inicio_execucao = time.time()
+    sucesso = executar_testes_pytest(paralelo=args.paralelo or bool(args.workers), workers=args.workers)
     
     if sucesso:
         print("\n✅ Todos os testes executados com sucesso!")
     else:
         print("\n⚠️  Alguns testes falharam, mas continuando...")
     
+    # Comparar durações com o baseline (mediana das últimas execuções) e registrar esta execução
+    regressoes = verificar_regressoes(inicio_execucao)
+    
     # Gerar relatório Allure
     allure_sucesso = gerar_relatorio_allure()
     
     # Mostrar resumo
     mostrar_resumo()
     
-    # Perguntar se quer abrir o relatório
-    if allure_sucesso:
+    # Perguntar se quer abrir o relatório (só em terminal interativo: no CI, input() falharia antes do gate)
+    if allure_sucesso and not args.gate_desempenho and sys.stdin.isatty():
         resposta = input("\n🌐 Deseja abrir o relatório Allure no navegador? (s/n): ").lower()
         if resposta in ['s', 'sim', 'y', 'yes']:
             abrir_relatorio_allure()
@@ -209,6 +293,10 @@ def main():
     print("   - Allure: reports/allure-report/index.html")
     print("   - Screenshots: screenshots/")
     print("=" * 60)
+    
+    if args.gate_desempenho and regressoes:
+        print(f"❌ Gate de desempenho: {len(regressoes)} regressões acima do baseline")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
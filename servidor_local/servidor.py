@@ -0,0 +1,238 @@
+"""
+Servidor local que imita o Sauce Demo (Swag Labs)
+Permite executar os testes sem depender do site público: sem rede,
+sem limite de requisições e com centenas de sessões em paralelo
+"""
+
+import argparse
+import json
+import os
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from config.test_config import TestConfig
+
+DIRETORIO_ESTATICO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+# Páginas atendidas pelo mesmo HTML; o app.js escolhe o que renderizar pelo caminho
+PAGINAS = {
+    "/",
+    "/index.html",
+    "/inventory.html",
+    "/cart.html",
+    "/checkout-step-one.html",
+    "/checkout-step-two.html",
+    "/checkout-complete.html",
+}
+
+TIPOS_CONTEUDO = {
+    ".js": "application/javascript; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".svg": "image/svg+xml",
+}
+
+HTML_PAGINA = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Swag Labs</title>
+<link rel="stylesheet" href="/static/app.css">
+</head>
+<body>
+<div id="root"></div>
+<script>
+window.SAUCE_CONFIG = {config};
+window.SAUCE_CATALOGO = {catalogo};
+</script>
+<script src="/static/app.js"></script>
+</body>
+</html>
+"""
+
+SVG_PRODUTO = """<svg xmlns="http://www.w3.org/2000/svg" width="96" height="96">
+<rect width="96" height="96" fill="{cor}"/>
+<text x="48" y="56" font-size="20" text-anchor="middle" fill="#fff">{texto}</text>
+</svg>
+"""
+
+CORES_PRODUTOS = ["#e2231a", "#18583a", "#3ddc91", "#132322", "#484c55", "#9c27b0"]
+
+
+def carregar_catalogo(caminho: str = None) -> list:
+    """
+    Carrega os produtos servidos pela réplica local
+
+    Args:
+        caminho: Caminho do snapshot (usa TestConfig.CATALOGO_PRODUTOS_FILE se não especificado)
+
+    Returns:
+        list: Produtos com id, nome, slug, preço e descrição
+    """
+    with open(caminho or TestConfig.CATALOGO_PRODUTOS_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)["produtos"]
+
+
+class ManipuladorSauceDemo(BaseHTTPRequestHandler):
+    """Atende as páginas, os arquivos estáticos e as imagens da réplica"""
+
+    # Preenchido pelo ServidorSauceDemoLocal antes de iniciar
+    html_pagina = b""
+
+    def do_GET(self):
+        caminho = self.path.split("?", 1)[0].split("#", 1)[0]
+
+        if caminho in PAGINAS:
+            self._responder(200, "text/html; charset=utf-8", self.html_pagina)
+        elif caminho.startswith("/static/img/"):
+            self._responder(200, TIPOS_CONTEUDO[".svg"], self._imagem(caminho))
+        elif caminho.startswith("/static/"):
+            self._servir_estatico(caminho[len("/static/"):])
+        elif caminho == "/favicon.ico":
+            self._responder(204, "image/x-icon", b"")
+        else:
+            self._responder(404, "text/plain; charset=utf-8", b"Not Found")
+
+    def _servir_estatico(self, nome: str):
+        """Serve app.js/app.css sem permitir sair do diretório estático"""
+        caminho = os.path.normpath(os.path.join(DIRETORIO_ESTATICO, nome))
+        if not caminho.startswith(DIRETORIO_ESTATICO + os.sep) or not os.path.isfile(caminho):
+            self._responder(404, "text/plain; charset=utf-8", b"Not Found")
+            return
+        tipo = TIPOS_CONTEUDO.get(os.path.splitext(caminho)[1], "application/octet-stream")
+        with open(caminho, 'rb') as f:
+            self._responder(200, tipo, f.read())
+
+    @staticmethod
+    def _imagem(caminho: str) -> bytes:
+        """Gera a imagem do produto (problem_user recebe sempre a sl-404)"""
+        nome = os.path.splitext(os.path.basename(caminho))[0]
+        if nome == "sl-404":
+            return SVG_PRODUTO.format(cor="#484c55", texto="404").encode("utf-8")
+        indice = nome.rsplit("-", 1)[-1]
+        cor = CORES_PRODUTOS[int(indice) % len(CORES_PRODUTOS)] if indice.isdigit() else CORES_PRODUTOS[0]
+        return SVG_PRODUTO.format(cor=cor, texto=indice).encode("utf-8")
+
+    def _responder(self, status: int, tipo: str, corpo: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", tipo)
+        self.send_header("Content-Length", str(len(corpo)))
+        # Arquivos estáticos podem ficar em cache: o navegador não os baixa a cada teste
+        self.send_header("Cache-Control", "max-age=3600" if self.path.startswith("/static/") else "no-store")
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, formato, *args):
+        """Silencia o log por requisição (centenas de sessões geram ruído demais)"""
+
+
+class ServidorSauceDemoLocal:
+    """Servidor HTTP em thread daemon que imita o Sauce Demo"""
+
+    def __init__(self, porta: int = None, host: str = "127.0.0.1", atraso_glitch_ms: int = None):
+        """
+        Inicializa o servidor
+
+        Args:
+            porta: Porta TCP (usa TestConfig.PORTA_SERVIDOR_LOCAL se não especificada; 0 = porta livre)
+            host: Endereço de escuta
+            atraso_glitch_ms: Atraso do login do performance_glitch_user
+        """
+        self.host = host
+        self.porta = TestConfig.PORTA_SERVIDOR_LOCAL if porta is None else porta
+        self.atraso_glitch_ms = TestConfig.ATRASO_GLITCH_LOCAL_MS if atraso_glitch_ms is None else atraso_glitch_ms
+        self._servidor: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """URL base do servidor (com barra final, como TestConfig.BASE_URL)"""
+        return f"http://{self.host}:{self.porta}/"
+
+    def _montar_html(self) -> bytes:
+        """Injeta configuração e catálogo no HTML compartilhado pelas páginas"""
+        config = {
+            "atrasoPerformanceMs": self.atraso_glitch_ms,
+            "taxaImposto": TestConfig.TAXA_IMPOSTO_ESPERADA,
+        }
+        return HTML_PAGINA.format(
+            config=json.dumps(config),
+            catalogo=json.dumps(carregar_catalogo()),
+        ).encode("utf-8")
+
+    def iniciar(self) -> str:
+        """
+        Inicia o servidor em uma thread daemon
+
+        Returns:
+            str: URL base do servidor
+        """
+        manipulador = type("ManipuladorConfigurado", (ManipuladorSauceDemo,), {"html_pagina": self._montar_html()})
+        self._servidor = ThreadingHTTPServer((self.host, self.porta), manipulador)
+        self._servidor.daemon_threads = True
+        self.porta = self._servidor.server_address[1]
+        self._thread = threading.Thread(target=self._servidor.serve_forever, name="servidor-sauce-local", daemon=True)
+        self._thread.start()
+        print(f"🌐 Servidor local do Sauce Demo em: {self.url}")
+        return self.url
+
+    def parar(self):
+        """Encerra o servidor e libera a porta"""
+        if self._servidor:
+            self._servidor.shutdown()
+            self._servidor.server_close()
+            self._servidor = None
+            print("🛑 Servidor local do Sauce Demo encerrado")
+
+
+def porta_em_uso(porta: int, host: str = "127.0.0.1") -> bool:
+    """Verifica se já existe algo escutando na porta"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.settimeout(0.5)
+        return s.connect_ex((host, porta)) == 0
+
+
+def garantir_servidor_local() -> Optional[ServidorSauceDemoLocal]:
+    """
+    Inicia o servidor local quando TestConfig.USAR_SERVIDOR_LOCAL está ativo
+
+    Se a porta já estiver ocupada (outro processo ou `python -m
+    servidor_local.servidor` em execução), reutiliza o servidor existente.
+
+    Returns:
+        ServidorSauceDemoLocal | None: Servidor iniciado por esta chamada
+    """
+    if not TestConfig.USAR_SERVIDOR_LOCAL:
+        return None
+    if porta_em_uso(TestConfig.PORTA_SERVIDOR_LOCAL):
+        print(f"🌐 Reutilizando servidor local em: {TestConfig.BASE_URL}")
+        return None
+    servidor = ServidorSauceDemoLocal()
+    try:
+        servidor.iniciar()
+    except OSError:
+        # Outro processo (ex.: worker paralelo) ocupou a porta entre a verificação e o bind
+        print(f"🌐 Reutilizando servidor local em: {TestConfig.BASE_URL}")
+        return None
+    return servidor
+
+
+def main():
+    """Executa o servidor em primeiro plano: python -m servidor_local.servidor"""
+    parser = argparse.ArgumentParser(description="Réplica local do Sauce Demo")
+    parser.add_argument("--porta", type=int, default=TestConfig.PORTA_SERVIDOR_LOCAL)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--atraso-glitch-ms", type=int, default=TestConfig.ATRASO_GLITCH_LOCAL_MS)
+    args = parser.parse_args()
+
+    servidor = ServidorSauceDemoLocal(porta=args.porta, host=args.host, atraso_glitch_ms=args.atraso_glitch_ms)
+    servidor.iniciar()
+    try:
+        servidor._thread.join()
+    except KeyboardInterrupt:
+        servidor.parar()
+
+
+if __name__ == "__main__":
+    main()
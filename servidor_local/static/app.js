@@ -0,0 +1,443 @@
+/*
+ * Réplica local do Sauce Demo (Swag Labs) para execuções herméticas.
+ *
+ * Usa os mesmos ids, classes e atributos data-test que os page objects
+ * procuram, guarda a sessão no cookie "session-username" e o carrinho no
+ * localStorage "cart-contents", como o site original.
+ */
+(function () {
+    "use strict";
+
+    var CONFIG = window.SAUCE_CONFIG || {};
+    var CATALOGO = window.SAUCE_CATALOGO || [];
+    var CHAVE_CARRINHO = "cart-contents";
+    var COOKIE_SESSAO = "session-username";
+    var SENHA = "secret_sauce";
+    var USUARIOS = [
+        "standard_user", "locked_out_user", "problem_user",
+        "performance_glitch_user", "error_user", "visual_user"
+    ];
+    // Itens cujo botão falha para problem_user/error_user (como no site original)
+    var ITENS_COM_FALHA = [1, 3, 5];
+
+    var raiz = document.getElementById("root");
+
+    // ----------------------------------------------------------- estado
+
+    function usuarioLogado() {
+        var partes = document.cookie.split("; ");
+        for (var i = 0; i < partes.length; i++) {
+            var par = partes[i].split("=");
+            if (par[0] === COOKIE_SESSAO) {
+                return decodeURIComponent(par.slice(1).join("="));
+            }
+        }
+        return null;
+    }
+
+    function iniciarSessao(usuario) {
+        // O site original expira a sessão em 10 minutos
+        document.cookie = COOKIE_SESSAO + "=" + encodeURIComponent(usuario) + "; path=/; max-age=600";
+    }
+
+    function encerrarSessao() {
+        document.cookie = COOKIE_SESSAO + "=; path=/; max-age=0";
+        localStorage.removeItem(CHAVE_CARRINHO);
+    }
+
+    function lerCarrinho() {
+        try {
+            var ids = JSON.parse(localStorage.getItem(CHAVE_CARRINHO) || "[]");
+            return Array.isArray(ids) ? ids : [];
+        } catch (e) {
+            return [];
+        }
+    }
+
+    function gravarCarrinho(ids) {
+        localStorage.setItem(CHAVE_CARRINHO, JSON.stringify(ids));
+    }
+
+    function produtoPorId(id) {
+        for (var i = 0; i < CATALOGO.length; i++) {
+            if (CATALOGO[i].id === id) {
+                return CATALOGO[i];
+            }
+        }
+        return null;
+    }
+
+    function formatarPreco(valor) {
+        return "$" + valor.toFixed(2);
+    }
+
+    function ir(pagina) {
+        window.location.href = "/" + pagina;
+    }
+
+    // ------------------------------------------------------- utilitários
+
+    function el(tag, atributos, filhos) {
+        var elemento = document.createElement(tag);
+        Object.keys(atributos || {}).forEach(function (nome) {
+            if (nome === "texto") {
+                elemento.textContent = atributos[nome];
+            } else if (nome.indexOf("on") === 0) {
+                elemento.addEventListener(nome.substring(2), atributos[nome]);
+            } else {
+                elemento.setAttribute(nome, atributos[nome]);
+            }
+        });
+        (filhos || []).forEach(function (filho) {
+            if (filho) {
+                elemento.appendChild(filho);
+            }
+        });
+        return elemento;
+    }
+
+    function botao(id, classe, texto, aoClicar) {
+        return el("button", {
+            "class": "btn " + classe, id: id, name: id, "data-test": id, texto: texto, onclick: aoClicar
+        });
+    }
+
+    function cabecalho(titulo, usuario) {
+        var quantidade = lerCarrinho().length;
+        var classeCarrinho = "shopping_cart_container" + (usuario === "visual_user" ? " visual_failure" : "");
+        var linkCarrinho = el("a", {
+            "class": "shopping_cart_link", "data-test": "shopping-cart-link", href: "/cart.html"
+        }, [
+            quantidade > 0
+                ? el("span", { "class": "shopping_cart_badge", "data-test": "shopping-cart-badge", texto: String(quantidade) })
+                : null
+        ]);
+        return el("div", { id: "header_container", "class": "header_container" }, [
+            el("div", { "class": "primary_header" }, [
+                el("button", { id: "react-burger-menu-btn", texto: "Open Menu", onclick: function () {
+                    encerrarSessao();
+                    ir("");
+                } }),
+                el("div", { "class": "app_logo", texto: "Swag Labs" }),
+                el("div", { id: "shopping_cart_container", "class": classeCarrinho }, [linkCarrinho])
+            ]),
+            el("div", { "class": "header_secondary_container" }, [
+                el("span", { "class": "title", "data-test": "title", texto: titulo })
+            ])
+        ]);
+    }
+
+    function atualizarContador() {
+        var link = document.querySelector(".shopping_cart_link");
+        var contador = link.querySelector(".shopping_cart_badge");
+        var quantidade = lerCarrinho().length;
+        if (quantidade === 0 && contador) {
+            contador.remove();
+        } else if (quantidade > 0) {
+            if (!contador) {
+                contador = el("span", { "class": "shopping_cart_badge", "data-test": "shopping-cart-badge" });
+                link.appendChild(contador);
+            }
+            contador.textContent = String(quantidade);
+        }
+    }
+
+    function erroFormulario(container, mensagem) {
+        container.className = "error-message-container" + (mensagem ? " error" : "");
+        container.innerHTML = "";
+        if (mensagem) {
+            container.appendChild(el("h3", { "data-test": "error", texto: mensagem }));
+        }
+    }
+
+    function exigirLogin(pagina) {
+        var usuario = usuarioLogado();
+        if (!usuario) {
+            sessionStorage.setItem(
+                "erro-login", "Epic sadface: You can only access '/" + pagina + "' when you are logged in."
+            );
+            ir("");
+            return null;
+        }
+        return usuario;
+    }
+
+    // ------------------------------------------------------------ páginas
+
+    function paginaLogin() {
+        var campoUsuario = el("input", { "class": "input_error form_input", id: "user-name", name: "user-name", "data-test": "username", type: "text", placeholder: "Username" });
+        var campoSenha = el("input", { "class": "input_error form_input", id: "password", name: "password", "data-test": "password", type: "password", placeholder: "Password" });
+        var erro = el("div", { "class": "error-message-container" });
+
+        var mensagemPendente = sessionStorage.getItem("erro-login");
+        if (mensagemPendente) {
+            sessionStorage.removeItem("erro-login");
+            erroFormulario(erro, mensagemPendente);
+        }
+
+        function entrar(evento) {
+            evento.preventDefault();
+            var usuario = campoUsuario.value;
+            var senha = campoSenha.value;
+            if (!usuario) {
+                return erroFormulario(erro, "Epic sadface: Username is required");
+            }
+            if (!senha) {
+                return erroFormulario(erro, "Epic sadface: Password is required");
+            }
+            if (USUARIOS.indexOf(usuario) < 0 || senha !== SENHA) {
+                return erroFormulario(erro, "Epic sadface: Username and password do not match any user in this service");
+            }
+            if (usuario === "locked_out_user") {
+                return erroFormulario(erro, "Epic sadface: Sorry, this user has been locked out.");
+            }
+            iniciarSessao(usuario);
+            var atraso = usuario === "performance_glitch_user" ? (CONFIG.atrasoPerformanceMs || 0) : 0;
+            setTimeout(function () { ir("inventory.html"); }, atraso);
+        }
+
+        raiz.appendChild(el("div", { "class": "login_container" }, [
+            el("div", { "class": "login_logo", texto: "Swag Labs" }),
+            el("form", { onsubmit: entrar }, [
+                campoUsuario,
+                campoSenha,
+                erro,
+                el("input", { type: "submit", "class": "submit-button btn_action", id: "login-button", name: "login-button", "data-test": "login-button", value: "Login" })
+            ])
+        ]));
+    }
+
+    function botaoInventario(produto, usuario, naLista) {
+        var noCarrinho = lerCarrinho().indexOf(produto.id) >= 0;
+        var id = (noCarrinho ? "remove-" : "add-to-cart-") + produto.slug;
+        var classe = noCarrinho ? "btn_secondary btn_small btn_inventory" : "btn_primary btn_small btn_inventory";
+        var elemento = botao(id, classe, noCarrinho ? "Remove" : "Add to cart", function () {
+            var falha = ITENS_COM_FALHA.indexOf(produto.id) >= 0;
+            if (usuario === "error_user" && falha) {
+                console.error("Failed to add item to the cart.");
+                return;
+            }
+            if (usuario === "problem_user" && (falha || noCarrinho)) {
+                return;
+            }
+            var ids = lerCarrinho();
+            if (noCarrinho) {
+                ids = ids.filter(function (item) { return item !== produto.id; });
+            } else {
+                ids.push(produto.id);
+            }
+            gravarCarrinho(ids);
+            // Mesmo nó com id, texto e classe novos, como a re-renderização do React
+            var novo = botaoInventario(produto, usuario, naLista);
+            elemento.id = novo.id;
+            elemento.name = novo.name;
+            elemento.setAttribute("data-test", novo.id);
+            elemento.className = novo.className;
+            elemento.textContent = novo.textContent;
+            noCarrinho = !noCarrinho;
+            atualizarContador();
+        });
+        return elemento;
+    }
+
+    function paginaInventario() {
+        var usuario = exigirLogin("inventory.html");
+        if (!usuario) {
+            return;
+        }
+        var itens = CATALOGO.map(function (produto) {
+            var preco = produto.preco;
+            if (usuario === "visual_user") {
+                preco = Math.round(Math.random() * 9999) / 100;
+            }
+            var imagem = usuario === "problem_user" ? "/static/img/sl-404.svg" : "/static/img/produto-" + produto.id + ".svg";
+            return el("div", { "class": "inventory_item", "data-test": "inventory-item" }, [
+                el("div", { "class": "inventory_item_img" }, [
+                    el("img", { "class": "inventory_item_img", alt: produto.nome, src: imagem })
+                ]),
+                el("div", { "class": "inventory_item_description" }, [
+                    el("div", { "class": "inventory_item_label" }, [
+                        el("a", { href: "#", id: "item_" + produto.id + "_title_link" }, [
+                            el("div", { "class": "inventory_item_name", "data-test": "inventory-item-name", texto: produto.nome })
+                        ]),
+                        el("div", { "class": "inventory_item_desc", "data-test": "inventory-item-desc", texto: produto.descricao })
+                    ]),
+                    el("div", { "class": "pricebar" }, [
+                        el("div", { "class": "inventory_item_price", "data-test": "inventory-item-price", texto: formatarPreco(preco) }),
+                        botaoInventario(produto, usuario, true)
+                    ])
+                ])
+            ]);
+        });
+        raiz.appendChild(el("div", { id: "page_wrapper", "class": "page_wrapper" }, [
+            cabecalho("Products", usuario),
+            el("div", { id: "inventory_container", "class": "inventory_container" }, [
+                el("div", { "class": "inventory_list", "data-test": "inventory-list" }, itens)
+            ])
+        ]));
+    }
+
+    function itemCarrinho(produto, comBotao, usuario) {
+        return el("div", { "class": "cart_item", "data-test": "inventory-item" }, [
+            el("div", { "class": "cart_quantity", "data-test": "item-quantity", texto: "1" }),
+            el("div", { "class": "cart_item_label" }, [
+                el("a", { href: "#", id: "item_" + produto.id + "_title_link" }, [
+                    el("div", { "class": "inventory_item_name", "data-test": "inventory-item-name", texto: produto.nome })
+                ]),
+                el("div", { "class": "inventory_item_desc", "data-test": "inventory-item-desc", texto: produto.descricao }),
+                el("div", { "class": "item_pricebar" }, [
+                    el("div", { "class": "inventory_item_price", "data-test": "inventory-item-price", texto: formatarPreco(produto.preco) }),
+                    comBotao ? botao("remove-" + produto.slug, "btn_secondary btn_small cart_button", "Remove", function (evento) {
+                        if (usuario === "problem_user") {
+                            return;
+                        }
+                        gravarCarrinho(lerCarrinho().filter(function (id) { return id !== produto.id; }));
+                        evento.target.closest(".cart_item").remove();
+                        atualizarContador();
+                    }) : null
+                ])
+            ])
+        ]);
+    }
+
+    function produtosDoCarrinho() {
+        return lerCarrinho().map(produtoPorId).filter(function (produto) { return produto; });
+    }
+
+    function paginaCarrinho() {
+        var usuario = exigirLogin("cart.html");
+        if (!usuario) {
+            return;
+        }
+        raiz.appendChild(el("div", { id: "page_wrapper", "class": "page_wrapper" }, [
+            cabecalho("Your Cart", usuario),
+            el("div", { id: "cart_contents_container", "class": "cart_contents_container" }, [
+                el("div", { "class": "cart_list", "data-test": "cart-list" }, [
+                    el("div", { "class": "cart_quantity_label", texto: "QTY" }),
+                    el("div", { "class": "cart_desc_label", texto: "Description" })
+                ].concat(produtosDoCarrinho().map(function (produto) {
+                    return itemCarrinho(produto, true, usuario);
+                }))),
+                el("div", { "class": "cart_footer" }, [
+                    botao("continue-shopping", "btn_secondary back btn_medium", "Continue Shopping", function () { ir("inventory.html"); }),
+                    botao("checkout", "btn_action btn_medium checkout_button", "Checkout", function () { ir("checkout-step-one.html"); })
+                ])
+            ])
+        ]));
+    }
+
+    function paginaCheckoutPasso1() {
+        var usuario = exigirLogin("checkout-step-one.html");
+        if (!usuario) {
+            return;
+        }
+        var nome = el("input", { "class": "input_error form_input", id: "first-name", name: "firstName", "data-test": "firstName", type: "text", placeholder: "First Name" });
+        var sobrenome = el("input", { "class": "input_error form_input", id: "last-name", name: "lastName", "data-test": "lastName", type: "text", placeholder: "Last Name" });
+        var cep = el("input", { "class": "input_error form_input", id: "postal-code", name: "postalCode", "data-test": "postalCode", type: "text", placeholder: "Zip/Postal Code" });
+        var erro = el("div", { "class": "error-message-container" });
+
+        if (usuario === "error_user") {
+            // O campo de sobrenome não aceita digitação para error_user
+            sobrenome.addEventListener("input", function () { sobrenome.value = ""; });
+        }
+
+        function continuar(evento) {
+            evento.preventDefault();
+            if (!nome.value) {
+                return erroFormulario(erro, "Error: First Name is required");
+            }
+            if (!sobrenome.value && usuario !== "error_user") {
+                return erroFormulario(erro, "Error: Last Name is required");
+            }
+            if (!cep.value) {
+                return erroFormulario(erro, "Error: Postal Code is required");
+            }
+            ir("checkout-step-two.html");
+        }
+
+        raiz.appendChild(el("div", { id: "page_wrapper", "class": "page_wrapper" }, [
+            cabecalho("Checkout: Your Information", usuario),
+            el("div", { id: "checkout_info_container", "class": "checkout_info_container" }, [
+                el("form", { onsubmit: continuar }, [
+                    el("div", { "class": "checkout_info" }, [nome, sobrenome, cep, erro]),
+                    el("div", { "class": "checkout_buttons" }, [
+                        botao("cancel", "btn_secondary back btn_medium cart_cancel_link", "Cancel", function (evento) {
+                            evento.preventDefault();
+                            ir("cart.html");
+                        }),
+                        el("input", { type: "submit", "class": "submit-button btn btn_primary cart_button btn_action", id: "continue", name: "continue", "data-test": "continue", value: "Continue" })
+                    ])
+                ])
+            ])
+        ]));
+    }
+
+    function paginaCheckoutPasso2() {
+        var usuario = exigirLogin("checkout-step-two.html");
+        if (!usuario) {
+            return;
+        }
+        var produtos = produtosDoCarrinho();
+        var subtotal = produtos.reduce(function (soma, produto) { return soma + produto.preco; }, 0);
+        var imposto = Math.round(subtotal * (CONFIG.taxaImposto || 0.08) * 100) / 100;
+        var total = Math.round((subtotal + imposto) * 100) / 100;
+
+        raiz.appendChild(el("div", { id: "page_wrapper", "class": "page_wrapper" }, [
+            cabecalho("Checkout: Overview", usuario),
+            el("div", { id: "checkout_summary_container", "class": "checkout_summary_container" }, [
+                el("div", { "class": "cart_list", "data-test": "cart-list" }, produtos.map(function (produto) {
+                    return itemCarrinho(produto, false, usuario);
+                })),
+                el("div", { "class": "summary_info", "data-test": "summary-info" }, [
+                    el("div", { "class": "summary_info_label", texto: "Payment Information:" }),
+                    el("div", { "class": "summary_value_label", texto: "SauceCard #31337" }),
+                    el("div", { "class": "summary_info_label", texto: "Shipping Information:" }),
+                    el("div", { "class": "summary_value_label", texto: "Free Pony Express Delivery!" }),
+                    el("div", { "class": "summary_info_label", texto: "Price Total" }),
+                    el("div", { "class": "summary_subtotal_label", "data-test": "subtotal-label", texto: "Item total: " + formatarPreco(subtotal) }),
+                    el("div", { "class": "summary_tax_label", "data-test": "tax-label", texto: "Tax: " + formatarPreco(imposto) }),
+                    el("div", { "class": "summary_info_label summary_total_label", "data-test": "total-label", texto: "Total: " + formatarPreco(total) }),
+                    el("div", { "class": "cart_footer" }, [
+                        botao("cancel", "btn_secondary back btn_medium cart_cancel_link", "Cancel", function () { ir("inventory.html"); }),
+                        botao("finish", "btn_action btn_medium cart_button", "Finish", function () {
+                            if (usuario === "error_user") {
+                                console.error("Failed to finish the order.");
+                                return;
+                            }
+                            gravarCarrinho([]);
+                            ir("checkout-complete.html");
+                        })
+                    ])
+                ])
+            ])
+        ]));
+    }
+
+    function paginaCheckoutCompleto() {
+        var usuario = exigirLogin("checkout-complete.html");
+        if (!usuario) {
+            return;
+        }
+        raiz.appendChild(el("div", { id: "page_wrapper", "class": "page_wrapper" }, [
+            cabecalho("Checkout: Complete!", usuario),
+            el("div", { id: "checkout_complete_container", "class": "checkout_complete_container" }, [
+                el("h2", { "class": "complete-header", "data-test": "complete-header", texto: "Thank you for your order!" }),
+                el("div", { "class": "complete-text", "data-test": "complete-text", texto: "Your order has been dispatched, and will arrive just as fast as the pony can get there!" }),
+                botao("back-to-products", "btn_primary btn_small", "Back Home", function () { ir("inventory.html"); })
+            ])
+        ]));
+    }
+
+    var PAGINAS = {
+        "": paginaLogin,
+        "index.html": paginaLogin,
+        "inventory.html": paginaInventario,
+        "cart.html": paginaCarrinho,
+        "checkout-step-one.html": paginaCheckoutPasso1,
+        "checkout-step-two.html": paginaCheckoutPasso2,
+        "checkout-complete.html": paginaCheckoutCompleto
+    };
+
+    var pagina = window.location.pathname.replace(/^\//, "");
+    (PAGINAS[pagina] || paginaLogin)();
+})();
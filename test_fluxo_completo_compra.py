@@ -9,17 +9,17 @@ no site Sauce Demo, incluindo login, seleção de produtos, carrinho e checkout.
 import pytest
 import allure
 import time
-import random
 from datetime import datetime
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
 from config.test_config import TestConfig
 from utils.webdriver_config import WebDriverConfig
 from utils.report_utils import ReportUtils
+from utils.evidencias_falha import BufferEvidencias
+from utils.fluxo_compra import FluxoCompra
 from utils.test_data_loader import TestDataLoader
 from utils.logger import TestLogger
-from utils.test_helpers import TestHelpers
-from utils.test_assertions import TestAssertions
+from utils.test_helpers import TestHelpers, MotorEspera
 from pages.login_page import LoginPage
 from pages.products_page import ProductsPage
 from pages.cart_page import CartPage
@@ -39,7 +39,7 @@ class TestFluxoCompletoCompra:
     def setup_method(self):
         """Configuração inicial para cada teste"""
         self.driver_config = WebDriverConfig()
-        self.driver = self.driver_config.obter_driver()
+        self.driver = self.driver_config.obter_driver_do_pool()
         self.report_utils = ReportUtils(self.driver)
         self.data_loader = TestDataLoader()
         
@@ -49,72 +49,19 @@ class TestFluxoCompletoCompra:
         self.cart_page = CartPage(self.driver)
         self.checkout_page = CheckoutPage(self.driver)
         
+        # Etapas do fluxo de compra (compartilhadas com as jornadas concorrentes)
+        self.fluxo = FluxoCompra(
+            self.driver,
+            lambda etapa: self.report_utils.capturar_screenshot_etapa(etapa, "fluxo")
+        )
+        
         # Inicializar logger
         self.logger = TestLogger("TestFluxoCompletoCompra")
     
     def teardown_method(self):
         """Limpeza após cada teste"""
         if hasattr(self, 'driver') and self.driver:
-            self.driver.quit()
-    
-    def _extrair_nome_simplificado(self, nome_completo):
-        """
-        Extrai o nome simplificado do produto para usar no ID do botão.
-        
-        Este método converte nomes completos de produtos em identificadores
-        que correspondem aos IDs dos botões na página.
-        
-        Args:
-            nome_completo: Nome completo do produto (ex: "Sauce Labs Backpack")
-            
-        Returns:
-            str: Nome simplificado (ex: "backpack")
-        """
-        # Mapeamento de nomes completos para nomes simplificados
-        mapeamento = {
-            "Sauce Labs Backpack": "backpack",
-            "Sauce Labs Bike Light": "bike-light", 
-            "Sauce Labs Bolt T-Shirt": "bolt-t-shirt",
-            "Sauce Labs Fleece Jacket": "fleece-jacket",
-            "Sauce Labs Onesie": "onesie",
-            "Test.allTheThings() T-Shirt (Red)": "test.allthethings()-t-shirt-(red)"
-        }
-        
-        # Se não encontrar no mapeamento, usar o nome completo
-        if nome_completo in mapeamento:
-            return mapeamento[nome_completo]
-        else:
-            # Fallback: usar o nome completo como está
-            return nome_completo
-    
-    def _adicionar_produto_com_fallback(self, produto):
-        """
-        Adiciona um produto ao carrinho com fallback para diferentes estratégias.
-        
-        Args:
-            produto: Dicionário com dados do produto
-            
-        Returns:
-            bool: True se adicionado com sucesso
-        """
-        nome_completo = produto['nome']
-        nome_simplificado = self._extrair_nome_simplificado(nome_completo)
-        
-        # Tentar adicionar pelo nome simplificado
-        if self.products_page.adicionar_produto_ao_carrinho(nome_simplificado):
-            return True
-        
-        # Se falhar, tentar adicionar diretamente pelo elemento
-        try:
-            botao = produto['elemento'].find_element(By.TAG_NAME, "button")
-            if "Add to cart" in botao.text or "Add" in botao.text:
-                botao.click()
-                print(f"Produto '{nome_completo}' adicionado ao carrinho (por elemento)")
-                return True
-        except Exception as e:
-            print(f"Erro ao adicionar produto '{nome_completo}' por elemento: {e}")
-        
-        return False
+            WebDriverConfig.devolver_driver(self.driver)
     
     @pytest.fixture
     def capturar_falha(self, request):
@@ -122,9 +69,18 @@ class TestFluxoCompletoCompra:
         Fixture para capturar screenshot em caso de falha
         """
         yield
+        nome_teste = request.node.name
+        if BufferEvidencias.ativo():
+            # Evidências das etapas em memória: gravadas só se o teste falhou
+            relatorio = getattr(request.node, "relatorio_call", None)
+            if relatorio is not None and relatorio.failed:
+                try:
+                    BufferEvidencias.descarregar(self.driver, nome_teste)
+                except Exception as e:
+                    print(f"Erro ao gravar evidências da falha: {e}")
+            return
         # Capturar screenshot sempre para demonstrar a funcionalidade
         try:
-            nome_teste = request.node.name
             self.report_utils.capturar_screenshot_etapa("final_teste", nome_teste)
         except Exception as e:
             print(f"Erro ao capturar screenshot: {e}")
@@ -162,14 +118,14 @@ class TestFluxoCompletoCompra:
             )
             
             # Navegar para a página de login
-            self.driver.get("https://www.saucedemo.com/")
+            self.driver.get(TestConfig.BASE_URL)
             self.report_utils.capturar_screenshot_etapa("pagina_login", f"login_{tipo_usuario}")
             
             # Realizar login
             self.login_page.fazer_login(usuario['username'], usuario['password'])
             
             # Aguardar carregamento da página de produtos
-            time.sleep(2)
+            MotorEspera.aguardar_url_conter(self.driver, "inventory", lancar_erro=False)
             self.report_utils.capturar_screenshot_etapa("apos_login", f"login_{tipo_usuario}")
             
             # Verificar se o login foi bem-sucedido
@@ -190,20 +146,12 @@ class TestFluxoCompletoCompra:
                 "json"
             )
             
-            # Navegar para a página de login
-            self.driver.get("https://www.saucedemo.com/")
-            self.report_utils.capturar_screenshot_etapa("pagina_login", "usuario_bloqueado")
-            
-            # Realizar login
-            self.login_page.fazer_login(usuario['username'], usuario['password'])
-            
-            # Aguardar e capturar mensagem de erro
-            time.sleep(1)
-            self.report_utils.capturar_screenshot_etapa("mensagem_erro", "usuario_bloqueado")
-            
-            # Verificar se a mensagem de erro está presente
-            mensagem_erro = self.login_page.obter_mensagem_erro()
-            assert "locked out" in mensagem_erro.lower(), "Mensagem de erro de usuário bloqueado não encontrada"
+            # Login recusado com a mensagem de usuário bloqueado
+            fluxo = FluxoCompra(
+                self.driver,
+                lambda etapa: self.report_utils.capturar_screenshot_etapa(etapa, "usuario_bloqueado")
+            )
+            mensagem_erro = fluxo.verificar_login_bloqueado(usuario['username'], usuario['password'])
             
             self.report_utils.adicionar_evidencia_allure(
                 "Mensagem de Erro",
@@ -233,6 +181,24 @@ class TestFluxoCompletoCompra:
             self._executar_checkout()
             self._validar_compra_finalizada()
 
+    @allure.story("Checkout com Carrinho Preparado")
+    @pytest.mark.login_rapido
+    def test_checkout_carrinho_preparado(self, capturar_falha):
+        """Checkout a partir de um carrinho montado direto no localStorage"""
+        with allure.step("Executando checkout com carrinho preparado"):
+            self._fazer_login("valido")
+            
+            produtos_carrinho = self.cart_page.preparar_carrinho_aleatorio()
+            self.report_utils.adicionar_evidencia_allure(
+                "Carrinho Preparado",
+                str(produtos_carrinho),
+                "json"
+            )
+            
+            self._verificar_carrinho()
+            self._executar_checkout()
+            self._validar_compra_finalizada()
+
     def _fazer_login(self, tipo_usuario):
         """Executa o login do usuário"""
         with allure.step("Etapa 1: Login"):
@@ -244,67 +210,31 @@ class TestFluxoCompletoCompra:
                 "json"
             )
             
-            self.driver.get(TestConfig.BASE_URL)
-            self.report_utils.capturar_screenshot_etapa("01_login", f"fluxo_{tipo_usuario}")
-            
-            self.login_page.fazer_login(usuario['username'], usuario['password'])
-            TestHelpers.aguardar_pausa_padrao()
-            self.report_utils.capturar_screenshot_etapa("02_apos_login", f"fluxo_{tipo_usuario}")
-            
-            TestAssertions.assert_login_sucesso(self.driver)
+            self.fluxo.fazer_login(usuario['username'], usuario['password'])
             self.logger.step("Login realizado com sucesso")
 
     def _selecionar_e_adicionar_produtos(self):
         """Seleciona e adiciona produtos ao carrinho"""
         with allure.step("Etapa 2: Seleção de Produtos"):
-            # Obter dados de produtos disponíveis
-            dados_produtos = self.products_page.obter_dados_produtos()
+            dados_produtos, produtos_selecionados = self.fluxo.selecionar_e_adicionar_produtos()
+            
             self.report_utils.adicionar_evidencia_allure(
                 "Produtos Disponíveis",
                 str([p['nome'] for p in dados_produtos]),
                 "json"
             )
-            
-            # Selecionar produtos aleatórios
-            quantidade_produtos = TestConfig.QUANTIDADE_PRODUTOS_PADRAO
-            produtos_selecionados = random.sample(dados_produtos, min(quantidade_produtos, len(dados_produtos)))
-            
             self.report_utils.adicionar_evidencia_allure(
                 "Produtos Selecionados",
                 str([p['nome'] for p in produtos_selecionados]),
                 "json"
             )
             
-            # Adicionar produtos ao carrinho
-            produtos_adicionados = 0
-            for produto in produtos_selecionados:
-                if self._adicionar_produto_com_fallback(produto):
-                    produtos_adicionados += 1
-                TestHelpers.aguardar_pequena_pausa()
-            
-            # Atualizar lista de produtos selecionados apenas com os que foram adicionados
-            produtos_selecionados = produtos_selecionados[:produtos_adicionados]
-            
-            self.report_utils.capturar_screenshot_etapa("03_produtos_adicionados", "fluxo")
-            
-            # Verificar quantidade no carrinho
-            quantidade_carrinho = self.products_page.obter_quantidade_itens_carrinho()
-            TestAssertions.assert_quantidade_carrinho_correta(len(produtos_selecionados), quantidade_carrinho)
-            
             self.logger.step(f"{len(produtos_selecionados)} produtos adicionados ao carrinho")
 
     def _verificar_carrinho(self):
         """Verifica o carrinho de compras"""
         with allure.step("Etapa 3: Verificação do Carrinho"):
-            self.products_page.ir_para_carrinho()
-            TestHelpers.aguardar_pequena_pausa()
-            self.report_utils.capturar_screenshot_etapa("04_carrinho", "fluxo")
-            
-            # Verificar produtos no carrinho
-            produtos_carrinho = self.cart_page.obter_produtos_carrinho()
-            
-            # Calcular preço total
-            preco_total = self.cart_page.obter_preco_total()
+            preco_total = self.fluxo.verificar_carrinho()
             self.report_utils.adicionar_evidencia_allure(
                 "Preço Total do Carrinho",
                 TestHelpers.formatar_preco(preco_total),
@@ -316,27 +246,7 @@ class TestFluxoCompletoCompra:
     def _executar_checkout(self):
         """Executa o processo de checkout"""
         with allure.step("Etapa 4: Checkout"):
-            self.cart_page.ir_para_checkout()
-            TestHelpers.aguardar_pequena_pausa()
-            self.report_utils.capturar_screenshot_etapa("05_checkout_info", "fluxo")
-            
-            # Preencher informações de checkout
-            self.checkout_page.preencher_informacoes("João", "Silva", "12345-678")
-            TestHelpers.aguardar_pequena_pausa()
-            self.report_utils.capturar_screenshot_etapa("06_checkout_preenchido", "fluxo")
-            
-            self.checkout_page.continuar_checkout()
-            TestHelpers.aguardar_pequena_pausa()
-            self.report_utils.capturar_screenshot_etapa("07_checkout_review", "fluxo")
-            
-            # Verificar valores
-            subtotal = self.checkout_page.obter_subtotal()
-            taxa_imposto = self.checkout_page.obter_taxa_imposto()
-            total_final = self.checkout_page.obter_total_final()
-            
-            # Validar cálculos
-            TestAssertions.assert_taxa_imposto_correta(subtotal, taxa_imposto)
-            TestAssertions.assert_total_final_correto(subtotal, taxa_imposto, total_final)
+            subtotal, taxa_imposto, total_final = self.fluxo.executar_checkout()
             
             self.report_utils.adicionar_evidencia_allure(
                 "Valores do Checkout",
@@ -351,13 +261,7 @@ class TestFluxoCompletoCompra:
     def _validar_compra_finalizada(self):
         """Valida a finalização da compra"""
         with allure.step("Etapa 5: Finalização da Compra"):
-            self.checkout_page.finalizar_compra()
-            TestHelpers.aguardar_pausa_padrao()
-            self.report_utils.capturar_screenshot_etapa("08_compra_finalizada", "fluxo")
-            
-            # Verificar mensagem de sucesso
-            mensagem_sucesso = self.checkout_page.obter_mensagem_sucesso()
-            TestAssertions.assert_mensagem_sucesso_presente(mensagem_sucesso)
+            mensagem_sucesso = self.fluxo.finalizar_compra()
             
             self.report_utils.adicionar_evidencia_allure(
                 "Mensagem de Sucesso",
@@ -376,13 +280,13 @@ class TestFluxoCompletoCompra:
             # Medir tempo de login
             inicio = time.time()
             
-            self.driver.get("https://www.saucedemo.com/")
+            self.driver.get(TestConfig.BASE_URL)
             self.report_utils.capturar_screenshot_etapa("inicio_performance", "performance_user")
             
             self.login_page.fazer_login(usuario['username'], usuario['password'])
             
             # Aguardar carregamento com timeout maior
-            time.sleep(5)
+            MotorEspera.aguardar_url_conter(self.driver, "inventory", timeout=TestConfig.LONG_TIMEOUT, lancar_erro=False)
             self.report_utils.capturar_screenshot_etapa("apos_login_performance", "performance_user")
             
             tempo_login = time.time() - inicio
@@ -404,11 +308,11 @@ class TestFluxoCompletoCompra:
         with allure.step("Testando usuário com problemas de interface"):
             usuario = self.data_loader.obter_usuario_por_tipo("problema")
             
-            self.driver.get("https://www.saucedemo.com/")
+            self.driver.get(TestConfig.BASE_URL)
             self.report_utils.capturar_screenshot_etapa("inicio_problema", "problem_user")
             
             self.login_page.fazer_login(usuario['username'], usuario['password'])
-            time.sleep(2)
+            MotorEspera.aguardar_url_conter(self.driver, "inventory", lancar_erro=False)
             self.report_utils.capturar_screenshot_etapa("apos_login_problema", "problem_user")
             
             # Verificar se conseguiu fazer login
@@ -418,7 +322,9 @@ class TestFluxoCompletoCompra:
                     produtos = self.products_page.obter_lista_produtos()
                     if produtos:
                         self.products_page.adicionar_produto_ao_carrinho(produtos[0]['nome'])
-                        time.sleep(1)
+                        MotorEspera.aguardar_quantidade_carrinho(
+                            self.driver, 1, timeout=TestConfig.SHORT_TIMEOUT, lancar_erro=False
+                        )
                         self.report_utils.capturar_screenshot_etapa("produto_adicionado_problema", "problem_user")
                 except Exception as e:
                     self.report_utils.adicionar_evidencia_allure(
@@ -435,11 +341,11 @@ class TestFluxoCompletoCompra:
         with allure.step("Testando usuário que gera erros"):
             usuario = self.data_loader.obter_usuario_por_tipo("erro")
             
-            self.driver.get("https://www.saucedemo.com/")
+            self.driver.get(TestConfig.BASE_URL)
             self.report_utils.capturar_screenshot_etapa("inicio_erro", "error_user")
             
             self.login_page.fazer_login(usuario['username'], usuario['password'])
-            time.sleep(2)
+            MotorEspera.aguardar_url_conter(self.driver, "inventory", lancar_erro=False)
             self.report_utils.capturar_screenshot_etapa("apos_login_erro", "error_user")
             
             # Verificar se conseguiu fazer login
@@ -447,7 +353,7 @@ class TestFluxoCompletoCompra:
                 # Tentar navegar (pode gerar erros)
                 try:
                     self.products_page.ir_para_carrinho()
-                    time.sleep(1)
+                    MotorEspera.aguardar_url_conter(self.driver, "cart.html", lancar_erro=False)
                     self.report_utils.capturar_screenshot_etapa("carrinho_erro", "error_user")
                 except Exception as e:
                     self.report_utils.adicionar_evidencia_allure(
@@ -464,11 +370,11 @@ class TestFluxoCompletoCompra:
         with allure.step("Testando usuário com problemas visuais"):
             usuario = self.data_loader.obter_usuario_por_tipo("visual")
             
-            self.driver.get("https://www.saucedemo.com/")
+            self.driver.get(TestConfig.BASE_URL)
             self.report_utils.capturar_screenshot_etapa("inicio_visual", "visual_user")
             
             self.login_page.fazer_login(usuario['username'], usuario['password'])
-            time.sleep(2)
+            MotorEspera.aguardar_url_conter(self.driver, "inventory", lancar_erro=False)
             self.report_utils.capturar_screenshot_etapa("apos_login_visual", "visual_user")
             
             # Verificar se conseguiu fazer login
@@ -479,38 +385,28 @@ class TestFluxoCompletoCompra:
             print(f"✅ Usuário visual testado")
     
     @allure.story("Validação de Preços e Impostos")
+    @pytest.mark.login_rapido
     def test_validacao_precos_impostos(self, capturar_falha):
         """Teste específico para validar cálculos de preços e impostos"""
         with allure.step("Validando cálculos de preços e impostos"):
             usuario = self.data_loader.obter_usuario_por_tipo("valido")
             
             # Login
-            self.driver.get("https://www.saucedemo.com/")
-            self.login_page.fazer_login(usuario['username'], usuario['password'])
-            time.sleep(2)
-            
-            # Adicionar produtos
-            dados_produtos = self.products_page.obter_dados_produtos()
-            if len(dados_produtos) >= 2:
-                for i in range(2):
-                    # Extrair o nome simplificado do produto para o ID do botão
-                    nome_simplificado = self._extrair_nome_simplificado(dados_produtos[i]['nome'])
-                    self.products_page.adicionar_produto_ao_carrinho(nome_simplificado)
-                    time.sleep(0.5)
-                
-                # Ir para carrinho
-                self.products_page.ir_para_carrinho()
-                time.sleep(1)
+            assert self.login_page.entrar(usuario['username'], usuario['password']), "Login falhou"
+            
+            # Montar o carrinho direto no localStorage (a inclusão de itens é coberta pelo fluxo completo)
+            produtos_carrinho = self.cart_page.preparar_carrinho_aleatorio(2)
+            if len(produtos_carrinho) >= 2:
                 self.report_utils.capturar_screenshot_etapa("carrinho_validacao", "validacao_precos")
                 
                 # Ir para checkout
                 self.cart_page.ir_para_checkout()
-                time.sleep(1)
+                MotorEspera.aguardar_url_conter(self.driver, "checkout-step-one")
                 
                 # Preencher checkout
                 self.checkout_page.preencher_informacoes("Teste", "Preços", "12345")
                 self.checkout_page.continuar_checkout()
-                time.sleep(1)
+                MotorEspera.aguardar_url_conter(self.driver, "checkout-step-two")
                 
                 self.report_utils.capturar_screenshot_etapa("checkout_validacao", "validacao_precos")
                 
@@ -519,6 +415,10 @@ class TestFluxoCompletoCompra:
                 taxa_imposto = self.checkout_page.obter_taxa_imposto()
                 total_final = self.checkout_page.obter_total_final()
                 
+                # O subtotal deve bater com os preços do catálogo
+                subtotal_catalogo = round(sum(p["preco"] for p in produtos_carrinho), 2)
+                assert abs(subtotal - subtotal_catalogo) < 0.01, f"Subtotal incorreto: {subtotal} vs {subtotal_catalogo}"
+                
                 # Calcular valores esperados
                 taxa_esperada = subtotal * 0.08
                 total_esperado = subtotal + taxa_esperada
@@ -4,8 +4,9 @@ Testes usando pytest para validar a automação
 """
 
 import pytest
-import time
+from config.test_config import TestConfig
 from utils.webdriver_config import WebDriverConfig
+from utils.test_helpers import MotorEspera
 from pages.login_page import LoginPage
 from pages.products_page import ProductsPage
 from pages.cart_page import CartPage
@@ -21,11 +22,10 @@ class TestSauceDemo:
         Fixture para configurar e limpar o ambiente de teste
         """
         # Setup - executado antes de cada teste
-        self.driver = WebDriverConfig.configurar_chrome_driver()
-        WebDriverConfig.configurar_driver_com_espera_implicita(self.driver)
+        self.driver = WebDriverConfig.obter_driver_do_pool()
         
         # Dados de teste
-        self.url_site = "https://www.saucedemo.com/"
+        self.url_site = TestConfig.BASE_URL
         self.usuario = "standard_user"
         self.senha = "secret_sauce"
         self.produtos_teste = ["backpack", "bike-light"]
@@ -34,8 +34,7 @@ class TestSauceDemo:
         
         # Teardown - executado após cada teste
         if self.driver:
-            time.sleep(2)  # Aguardar para visualizar o resultado
-            WebDriverConfig.fechar_driver(self.driver)
+            WebDriverConfig.devolver_driver(self.driver)
     
     def test_login_sucesso(self):
         """Testa se o login é realizado com sucesso"""
@@ -45,7 +44,7 @@ class TestSauceDemo:
         
         # Act
         pagina_login.fazer_login(self.usuario, self.senha)
-        time.sleep(2)
+        MotorEspera.aguardar_url_mudar(self.driver, self.url_site, lancar_erro=False)
         
         # Assert
         assert pagina_login.verificar_se_login_foi_bem_sucedido(), "Login falhou"
@@ -59,11 +58,12 @@ class TestSauceDemo:
         # Act
         pagina_login.acessar_pagina_login(self.url_site)
         pagina_login.fazer_login(self.usuario, self.senha)
-        time.sleep(2)
+        MotorEspera.aguardar_url_mudar(self.driver, self.url_site, lancar_erro=False)
         
         # Assert
         assert pagina_produtos.verificar_se_esta_na_pagina_produtos(), "Não conseguiu acessar a página de produtos"
     
+    @pytest.mark.login_rapido
     def test_adicionar_produtos_ao_carrinho(self):
         """Testa se consegue adicionar produtos ao carrinho"""
         # Arrange
@@ -71,15 +71,14 @@ class TestSauceDemo:
         pagina_produtos = ProductsPage(self.driver)
         
         # Act
-        pagina_login.acessar_pagina_login(self.url_site)
-        pagina_login.fazer_login(self.usuario, self.senha)
-        time.sleep(2)
+        assert pagina_login.entrar(self.usuario, self.senha), f"Login falhou para {self.usuario}"
         
         produtos_adicionados = pagina_produtos.adicionar_multiplos_produtos(self.produtos_teste)
         
         # Assert
         assert produtos_adicionados == len(self.produtos_teste), f"Esperado {len(self.produtos_teste)} produtos, adicionado {produtos_adicionados}"
     
+    @pytest.mark.login_rapido
     def test_verificar_quantidade_carrinho(self):
         """Testa se a quantidade de itens no carrinho está correta"""
         # Arrange
@@ -87,9 +86,7 @@ class TestSauceDemo:
         pagina_produtos = ProductsPage(self.driver)
         
         # Act
-        pagina_login.acessar_pagina_login(self.url_site)
-        pagina_login.fazer_login(self.usuario, self.senha)
-        time.sleep(2)
+        assert pagina_login.entrar(self.usuario, self.senha), f"Login falhou para {self.usuario}"
         
         pagina_produtos.adicionar_multiplos_produtos(self.produtos_teste)
         quantidade_carrinho = pagina_produtos.obter_quantidade_itens_carrinho()
@@ -106,7 +103,7 @@ class TestSauceDemo:
         # Act - Login
         pagina_login.acessar_pagina_login(self.url_site)
         pagina_login.fazer_login(self.usuario, self.senha)
-        time.sleep(2)
+        MotorEspera.aguardar_url_mudar(self.driver, self.url_site, lancar_erro=False)
         
         # Assert - Verificar login
         assert pagina_login.verificar_se_login_foi_bem_sucedido(), "Login falhou"
@@ -125,7 +122,7 @@ class TestSauceDemo:
         
         # Act - Acessar carrinho
         pagina_produtos.clicar_no_carrinho()
-        time.sleep(2)
+        MotorEspera.aguardar_url_conter(self.driver, "cart", lancar_erro=False)
         
         # Assert - Verificar se conseguiu acessar o carrinho
         assert "cart" in self.driver.current_url.lower(), "Não conseguiu acessar o carrinho"
@@ -142,9 +139,7 @@ class TestSauceDemo:
         produtos_page = ProductsPage(self.driver)
         
         # Login
-        pagina_login.acessar_pagina_login(self.url_site)
-        pagina_login.fazer_login(self.usuario, self.senha)
-        time.sleep(2)
+        pagina_login.entrar(self.usuario, self.senha)
         assert produtos_page.verificar_se_esta_na_pagina_produtos()
         
         # Selecionar 2 produtos aleatórios e adicionar ao carrinho
@@ -0,0 +1,394 @@
+"""
+Testes dos utilitários do framework
+Não abrem o navegador: validam os cálculos e a montagem de comandos
+"""
+
+import base64
+import json
+import os
+from collections import OrderedDict, deque
+
+import pytest
+import webdriver_manager.chrome
+from behave.configuration import Configuration
+
+from config.test_config import TestConfig
+from run_bdd_tests import DIRETORIO_WORKERS, _comando_worker, distribuir_cenarios
+from utils import chromedriver_resolver, gravador_screenshots, metricas_navegador
+from utils.armazem_screenshots import ArmazemScreenshots
+from utils.baseline_desempenho import ETAPA_TESTE, BaselineDesempenho, verificar_regressoes
+from utils.chromedriver_resolver import ResolvedorChromeDriver
+from utils.gravador_screenshots import GravadorScreenshots
+from utils.logger import mesclar_logs
+from utils.test_helpers import TestHelpers
+
+
+class TestComandoWorkerBehave:
+    """Comando behave montado para cada worker da execução paralela"""
+
+    CENARIOS = [
+        {"local": "features/login.feature:7", "chave": "features/login.feature:7"},
+        {"local": "features/carrinho.feature:12", "chave": "features/carrinho.feature:12"},
+    ]
+
+    def test_comando_valido_para_o_behave(self):
+        """O comando é aceito pelo behave, com uma saída para cada formato"""
+        comando = _comando_worker(0, self.CENARIOS)
+        configuracao = Configuration(comando[1:])
+
+        assert len(configuracao.outputs) == len(configuracao.format)
+        assert configuracao.paths == [cenario["local"] for cenario in self.CENARIOS]
+
+    def test_saidas_no_diretorio_do_worker(self):
+        """Os relatórios texto e JSON de cada worker ficam no próprio diretório"""
+        for indice in range(2):
+            configuracao = Configuration(_comando_worker(indice, self.CENARIOS)[1:])
+            saidas = dict(zip(configuracao.format, (saida.name for saida in configuracao.outputs)))
+
+            diretorio_worker = os.path.join(DIRETORIO_WORKERS, f"bdd{indice}")
+            assert saidas["pretty"].startswith(diretorio_worker)
+            assert saidas["json"].startswith(diretorio_worker)
+
+
+def _cenarios(*chaves):
+    return [{"local": chave, "chave": chave} for chave in chaves]
+
+
+class TestDistribuicaoCenarios:
+    """Divisão dos cenários entre os workers do behave, do mais longo para o mais curto"""
+
+    @staticmethod
+    def _cargas(grupos, duracoes):
+        return sorted(sum(duracoes[cenario["chave"]] for cenario in grupo) for grupo in grupos)
+
+    def test_mais_longo_primeiro_equilibra_os_workers(self):
+        """Cada cenário vai para o worker menos carregado, começando pelos mais longos"""
+        duracoes = {"a": 7, "b": 5, "c": 4, "d": 3, "e": 3, "f": 2}
+        grupos = distribuir_cenarios(_cenarios(*duracoes), 2, duracoes)
+
+        assert [[cenario["chave"] for cenario in grupo] for grupo in grupos] == [["a", "d", "f"], ["b", "c", "e"]]
+        assert self._cargas(grupos, duracoes) == [12, 12]
+
+    def test_cenario_lento_fica_sozinho(self):
+        """Um cenário mais longo que todos os outros juntos ocupa um worker inteiro"""
+        duracoes = {"lento": 60, "a": 5, "b": 5, "c": 5}
+        grupos = distribuir_cenarios(_cenarios("a", "b", "lento", "c"), 2, duracoes)
+
+        assert [cenario["chave"] for cenario in grupos[0]] == ["lento"]
+        assert self._cargas(grupos, duracoes) == [15, 60]
+
+    def test_cenario_sem_duracao_usa_a_mediana(self):
+        """Cenários novos contam com a mediana das durações conhecidas"""
+        duracoes = {"a": 10, "b": 2, "c": 4}
+        grupos = distribuir_cenarios(_cenarios("a", "b", "c", "novo"), 2, duracoes)
+
+        # novo (mediana 4) empata com c e vai para o worker de b, o menos carregado
+        assert [[cenario["chave"] for cenario in grupo] for grupo in grupos] == [["a"], ["c", "novo", "b"]]
+
+    def test_sem_historico_e_mais_workers_que_cenarios(self):
+        """Sem durações conhecidas todos valem o padrão; workers vazios são descartados"""
+        grupos = distribuir_cenarios(_cenarios("a", "b"), 4, {})
+
+        assert len(grupos) == 2
+        assert all(len(grupo) == 1 for grupo in grupos)
+
+
+class TestPercentis:
+    """Percentis e resumo de durações usados nos relatórios de desempenho"""
+
+    def test_percentil_interpola_entre_amostras(self):
+        """Posições fracionárias interpolam linearmente entre as amostras vizinhas"""
+        valores = [4.0, 1.0, 3.0, 2.0]
+
+        assert TestHelpers.calcular_percentil(valores, 0) == 1.0
+        assert TestHelpers.calcular_percentil(valores, 50) == pytest.approx(2.5)
+        assert TestHelpers.calcular_percentil(valores, 95) == pytest.approx(3.85)
+        assert TestHelpers.calcular_percentil(valores, 100) == 4.0
+
+    def test_percentil_sem_amostras(self):
+        """Sem amostras o percentil é 0.0"""
+        assert TestHelpers.calcular_percentil([], 95) == 0.0
+
+    def test_resumo_sem_amostras(self):
+        """O resumo de uma lista vazia tem todos os campos zerados"""
+        assert TestHelpers.resumir_duracoes([]) == {
+            "amostras": 0, "media": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0,
+        }
+
+    def test_resumo_com_uma_amostra(self):
+        """Com uma amostra, média, percentis e máximo são a própria amostra"""
+        assert TestHelpers.resumir_duracoes([1.23456]) == {
+            "amostras": 1, "media": 1.2346, "p50": 1.2346, "p95": 1.2346, "p99": 1.2346, "max": 1.2346,
+        }
+
+    def test_resumo_aceita_gerador(self):
+        """As durações podem vir de um gerador (ex.: resultados de jornadas)"""
+        resumo = TestHelpers.resumir_duracoes(valor / 10 for valor in range(1, 11))
+
+        assert resumo["amostras"] == 10
+        assert resumo["media"] == pytest.approx(0.55)
+        assert resumo["p50"] == pytest.approx(0.55)
+        assert resumo["max"] == 1.0
+
+
+class TestMesclarLogs:
+    """Intercalação dos logs JSON-lines dos workers"""
+
+    @staticmethod
+    def _gravar(caminho, eventos):
+        with open(caminho, 'w', encoding='utf-8') as f:
+            for evento in eventos:
+                f.write(json.dumps(evento) + "\n")
+
+    def test_intercala_os_arquivos_pelo_timestamp(self, tmp_path):
+        """Eventos de arquivos diferentes saem em ordem global de timestamp"""
+        gw0, gw1 = tmp_path / "gw0.jsonl", tmp_path / "gw1.jsonl"
+        self._gravar(gw0, [{"timestamp": 1.0, "worker": "gw0"}, {"timestamp": 3.0, "worker": "gw0"},
+                           {"timestamp": 6.0, "worker": "gw0"}])
+        self._gravar(gw1, [{"timestamp": 2.0, "worker": "gw1"}, {"timestamp": 4.0, "worker": "gw1"},
+                           {"timestamp": 5.0, "worker": "gw1"}])
+
+        saida, total = mesclar_logs([str(gw0), str(gw1)], str(tmp_path / "mesclado.jsonl"))
+
+        with open(saida, 'r', encoding='utf-8') as f:
+            eventos = [json.loads(linha) for linha in f]
+        assert total == 6
+        assert [evento["timestamp"] for evento in eventos] == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        assert [evento["worker"] for evento in eventos] == ["gw0", "gw1", "gw0", "gw1", "gw1", "gw0"]
+
+    def test_ignora_linhas_vazias_e_incompletas(self, tmp_path):
+        """Uma linha cortada (processo interrompido) não impede a mesclagem"""
+        log = tmp_path / "gw0.jsonl"
+        log.write_text('{"timestamp": 1.0}\n\n{"timestamp": 2.0}\n{"timestamp": 3.', encoding='utf-8')
+
+        _, total = mesclar_logs([str(log)], str(tmp_path / "mesclado.jsonl"))
+
+        assert total == 2
+
+    def test_ignora_arquivos_de_execucoes_anteriores(self, tmp_path):
+        """Com desde, o arquivo de um worker que não rodou nesta execução fica de fora"""
+        antigo, atual = tmp_path / "gw3.jsonl", tmp_path / "gw0.jsonl"
+        self._gravar(antigo, [{"timestamp": 1.0, "worker": "gw3"}])
+        self._gravar(atual, [{"timestamp": 2.0, "worker": "gw0"}])
+        os.utime(antigo, (100, 100))
+
+        saida, total = mesclar_logs([str(antigo), str(atual)], str(tmp_path / "mesclado.jsonl"), desde=200)
+
+        with open(saida, 'r', encoding='utf-8') as f:
+            assert [json.loads(linha)["worker"] for linha in f] == ["gw0"]
+        assert total == 1
+
+
+class TestBaselineDesempenho:
+    """Comparação das durações com a mediana das execuções anteriores"""
+
+    @pytest.fixture
+    def baseline(self, tmp_path):
+        baseline = BaselineDesempenho(str(tmp_path / "baseline.sqlite"))
+        for duracao_teste, duracao_login in [(10.0, 0.5), (9.0, 0.4), (11.0, 0.6)]:
+            baseline.registrar_execucao({
+                ("m.C::test_fluxo", ETAPA_TESTE): duracao_teste,
+                ("m.C::test_fluxo", "Etapa 1: Login"): duracao_login,
+            })
+        baseline.registrar_execucao({("m.C::test_novo", ETAPA_TESTE): 1.0})
+        yield baseline
+        baseline.fechar()
+
+    @staticmethod
+    def _comparar(baseline, duracoes):
+        comparacoes = baseline.comparar(duracoes, limite=0.2, ruido_s=1.0, minimo_amostras=3)
+        return {(comparacao["teste"], comparacao["etapa"]): comparacao for comparacao in comparacoes}
+
+    def test_regressao_acima_do_limite_e_do_ruido(self, baseline):
+        """Mais lento que a mediana além do limite relativo e do ruído: regressão"""
+        comparacao = self._comparar(baseline, {("m.C::test_fluxo", ETAPA_TESTE): 12.5})[("m.C::test_fluxo", ETAPA_TESTE)]
+
+        assert comparacao["mediana_s"] == 10.0
+        assert comparacao["variacao"] == 0.25
+        assert comparacao["regressao"]
+
+    def test_piora_dentro_do_limite_relativo(self, baseline):
+        """Acima do ruído mas dentro do limite relativo (20% de 10s): não é regressão"""
+        comparacao = self._comparar(baseline, {("m.C::test_fluxo", ETAPA_TESTE): 11.5})[("m.C::test_fluxo", ETAPA_TESTE)]
+
+        assert not comparacao["regressao"]
+
+    def test_piora_dentro_do_ruido(self, baseline):
+        """Etapas curtas: +100% em 0,5s fica abaixo do ruído de 1s e não é regressão"""
+        chave = ("m.C::test_fluxo", "Etapa 1: Login")
+        comparacao = self._comparar(baseline, {chave: 1.0})[chave]
+
+        assert comparacao["variacao"] == 1.0
+        assert not comparacao["regressao"]
+
+    def test_sem_amostras_suficientes_nao_compara(self, baseline):
+        """Testes com menos execuções que o mínimo, ou sem histórico, ficam de fora"""
+        comparacoes = self._comparar(baseline, {
+            ("m.C::test_novo", ETAPA_TESTE): 30.0,
+            ("m.C::test_inexistente", ETAPA_TESTE): 30.0,
+        })
+
+        assert comparacoes == {}
+
+    def test_ordena_da_maior_variacao_para_a_menor(self, baseline):
+        """As comparações vêm da maior variação para a menor"""
+        comparacoes = baseline.comparar({
+            ("m.C::test_fluxo", ETAPA_TESTE): 12.0,
+            ("m.C::test_fluxo", "Etapa 1: Login"): 1.0,
+        }, limite=0.2, ruido_s=1.0, minimo_amostras=3)
+
+        assert [comparacao["etapa"] for comparacao in comparacoes] == ["Etapa 1: Login", ETAPA_TESTE]
+
+    @pytest.mark.parametrize("duracao, registrada", [(10.2, True), (20.0, False)])
+    def test_execucao_com_regressao_nao_entra_no_historico(self, baseline, tmp_path, monkeypatch, duracao, registrada):
+        """Só execuções sem regressões são registradas no histórico usado pela mediana"""
+        junit = tmp_path / "junit.xml"
+        junit.write_text(f'<testsuite><testcase classname="m.C" name="test_fluxo" time="{duracao}"/></testsuite>',
+                         encoding='utf-8')
+        monkeypatch.setattr(TestConfig, "BASELINE_DESEMPENHO_FILE", baseline.caminho)
+        monkeypatch.setattr(TestConfig, "REPORTS_DIR", str(tmp_path))
+        execucoes = baseline.conexao.execute("SELECT COUNT(*) FROM execucoes").fetchone()[0]
+
+        regressoes = verificar_regressoes(0, junit=str(junit), allure_results=str(tmp_path / "allure-results"))
+
+        assert bool(regressoes) != registrada
+        total = baseline.conexao.execute("SELECT COUNT(*) FROM execucoes").fetchone()[0]
+        assert total == execucoes + registrada
+
+
+class TestResolvedorChromeDriver:
+    """Descarte do ChromeDriver em cache quando o Chrome não inicia com ele"""
+
+    def test_descarta_o_cache_e_resolve_de_novo(self, tmp_path, monkeypatch):
+        """Um caminho em cache que falha sai do cache e o driver é resolvido uma vez mais"""
+        antigo, novo = tmp_path / "chromedriver_antigo", tmp_path / "chromedriver_novo"
+        antigo.touch()
+        novo.touch()
+        arquivo_cache = tmp_path / "cache.json"
+        arquivo_cache.write_text(json.dumps({"120": {"caminho": str(antigo)}}), encoding='utf-8')
+
+        iniciados = []
+
+        class ChromeFalso:
+            def __init__(self, service=None, options=None):
+                iniciados.append(service.path)
+                if service.path == str(antigo):
+                    raise RuntimeError("session not created: This version of ChromeDriver only supports Chrome version 119")
+
+        monkeypatch.delenv(ResolvedorChromeDriver.VARIAVEL_CAMINHO, raising=False)
+        monkeypatch.setattr(TestConfig, "CHROMEDRIVER_CACHE_FILE", str(arquivo_cache))
+        monkeypatch.setattr(ResolvedorChromeDriver, "_caminho_resolvido", None)
+        monkeypatch.setattr(ResolvedorChromeDriver, "_resolvido", False)
+        monkeypatch.setattr(ResolvedorChromeDriver, "_obter_versao_chrome", staticmethod(lambda: "120"))
+        monkeypatch.setattr(ResolvedorChromeDriver, "_resolver_sem_cache", staticmethod(lambda: str(novo)))
+        monkeypatch.setattr(chromedriver_resolver.webdriver, "Chrome", ChromeFalso)
+
+        assert isinstance(ResolvedorChromeDriver.iniciar_chrome(None), ChromeFalso)
+        assert iniciados == [str(antigo), str(novo)]
+        assert json.loads(arquivo_cache.read_text(encoding='utf-8'))["120"]["caminho"] == str(novo)
+
+    @pytest.fixture
+    def sem_driver(self, tmp_path, monkeypatch):
+        """Nenhum ChromeDriver disponível: sem CHROMEDRIVER_PATH, cache vazio e nada no PATH"""
+        monkeypatch.delenv(ResolvedorChromeDriver.VARIAVEL_CAMINHO, raising=False)
+        monkeypatch.setattr(TestConfig, "CHROMEDRIVER_CACHE_FILE", str(tmp_path / "cache.json"))
+        monkeypatch.setattr(TestConfig, "OFFLINE", False)
+        monkeypatch.setattr(ResolvedorChromeDriver, "_caminho_resolvido", None)
+        monkeypatch.setattr(ResolvedorChromeDriver, "_resolvido", False)
+        monkeypatch.setattr(ResolvedorChromeDriver, "_gerenciador_falhou", False)
+        monkeypatch.setattr(ResolvedorChromeDriver, "_obter_versao_chrome", staticmethod(lambda: "120"))
+        monkeypatch.setattr(chromedriver_resolver.shutil, "which", lambda nome: None)
+
+        instalacoes = []
+
+        class GerenciadorSemRede:
+            def install(self):
+                instalacoes.append(1)
+                raise ConnectionError("sem rede")
+        monkeypatch.setattr(webdriver_manager.chrome, "ChromeDriverManager", GerenciadorSemRede)
+        return instalacoes
+
+    def test_resultado_vazio_fica_em_memoria(self, sem_driver):
+        """Sem driver, a busca pela rede acontece uma única vez no processo"""
+        assert ResolvedorChromeDriver.resolver() is None
+        assert ResolvedorChromeDriver.resolver() is None
+        assert sem_driver == [1]
+
+    def test_gerenciador_nao_repete_apos_falha(self, sem_driver):
+        """Depois de uma falha do ChromeDriverManager, novas resoluções vão direto ao PATH"""
+        ResolvedorChromeDriver.resolver()
+        ResolvedorChromeDriver._resolvido = False
+        ResolvedorChromeDriver.resolver()
+        assert sem_driver == [1]
+
+    def test_offline_nao_usa_o_gerenciador(self, sem_driver, monkeypatch):
+        """Com SAUCE_OFFLINE=1 o ChromeDriverManager nunca é chamado"""
+        monkeypatch.setattr(TestConfig, "OFFLINE", True)
+        assert ResolvedorChromeDriver.resolver() is None
+        assert sem_driver == []
+
+
+class TestGravadorScreenshots:
+    """Anexos do Allure gravados pela thread do GravadorScreenshots"""
+
+    class DriverFalso:
+        def get_screenshot_as_base64(self):
+            return base64.b64encode(b"png-falso").decode()
+
+    def test_sem_reporter_anexa_na_thread_do_teste(self, tmp_path, monkeypatch):
+        """Sem o plugin do Allure, o anexo vai por allure.attach em vez de ser descartado"""
+        monkeypatch.setattr(TestConfig, "SCREENSHOTS_DIR", str(tmp_path))
+        # Armazém isolado: o índice deste teste não é regravado no final da sessão
+        monkeypatch.setattr(ArmazemScreenshots, "_carregado", False)
+        monkeypatch.setattr(ArmazemScreenshots, "_objetos", OrderedDict())
+        monkeypatch.setattr(ArmazemScreenshots, "_recentes", deque(maxlen=ArmazemScreenshots._recentes.maxlen))
+        monkeypatch.setattr(ArmazemScreenshots, "_total_bytes", 0)
+        monkeypatch.setattr(gravador_screenshots.plugin_manager, "get_plugins", lambda: [])
+        anexos = []
+        monkeypatch.setattr(
+            gravador_screenshots.allure, "attach",
+            lambda corpo, name, attachment_type: anexos.append((corpo, name))
+        )
+
+        caminho = GravadorScreenshots.enfileirar(self.DriverFalso(), "etapa.png", "Etapa")
+        GravadorScreenshots.aguardar()
+
+        assert anexos == [(b"png-falso", "Etapa")]
+        assert os.path.exists(caminho)
+
+    def test_anexo_reservado_uma_unica_vez(self):
+        """A reserva do anexo é atômica e pode ser desfeita se a gravação falhar"""
+        arquivo = "anexo-de-teste-attachment.png"
+        try:
+            assert GravadorScreenshots._reservar_anexo(arquivo)
+            assert not GravadorScreenshots._reservar_anexo(arquivo)
+            GravadorScreenshots._liberar_anexo(arquivo)
+            assert GravadorScreenshots._reservar_anexo(arquivo)
+        finally:
+            GravadorScreenshots._liberar_anexo(arquivo)
+
+
+class TestMesclarMetricasNavegador:
+    """Junção das métricas do navegador dos workers de uma execução"""
+
+    @staticmethod
+    def _gravar_worker(diretorio, worker, duracao):
+        caminho = diretorio / f"metricas_navegador_{worker}.json"
+        amostra = {"teste": "t", "pagina": "inventory", "load": duracao}
+        caminho.write_text(json.dumps({"worker": worker, "amostras": [amostra]}), encoding='utf-8')
+        return caminho
+
+    def test_ignora_workers_de_execucoes_anteriores(self, tmp_path, monkeypatch):
+        """Só os workers gravados depois do início entram no arquivo lido por ler_execucao"""
+        monkeypatch.setattr(TestConfig, "REPORTS_DIR", str(tmp_path))
+        monkeypatch.setattr(TestConfig, "BASELINE_METRICAS_NAVEGADOR_FILE", str(tmp_path / "baseline.json"))
+        antigo = self._gravar_worker(tmp_path, "gw3", 9.0)
+        os.utime(antigo, (100, 100))
+        self._gravar_worker(tmp_path, "gw0", 1.0)
+        self._gravar_worker(tmp_path, "gw1", 3.0)
+
+        metricas_navegador.mesclar(desde=200)
+
+        amostras = metricas_navegador.ler_execucao()
+        assert sorted(amostra["load"] for amostra in amostras) == [1.0, 3.0]
+        assert metricas_navegador.MetricasNavegador.agregar(amostras)["t"]["inventory"]["load"] == 2.0
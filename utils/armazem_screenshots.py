@@ -0,0 +1,210 @@
+"""
+Armazém de screenshots endereçado por conteúdo
+Cada imagem é gravada uma única vez, com o hash do conteúdo como nome; os
+nomes lógicos (ex.: "fluxo_01_login_20240101_101010.png") ficam no índice
+"""
+
+import base64
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import List, Optional, Tuple
+
+from config.test_config import TestConfig
+
+try:
+    from PIL import Image
+    PILLOW_DISPONIVEL = True
+except ImportError:
+    PILLOW_DISPONIVEL = False
+
+# Formato gravado -> (extensão, mime type do anexo no Allure)
+FORMATOS = {
+    "png": ("png", "image/png"),
+    "png-otimizado": ("png", "image/png"),
+    "webp": ("webp", "image/webp"),
+}
+
+# Nomes lógicos mantidos no índice para a consulta de screenshots recentes
+MAXIMO_RECENTES = 50
+
+
+class ArmazemScreenshots:
+    """
+    Screenshots deduplicados por hash em TestConfig.SCREENSHOTS_DIR
+
+    Quadros idênticos (comuns entre execuções parametrizadas) apontam para o
+    mesmo arquivo, no disco e no allure-results. Os objetos são mantidos em
+    ordem de uso: ao passar de TestConfig.SCREENSHOTS_LIMITE_MB, os menos
+    usados recentemente são removidos.
+
+    O índice (indice.json) guarda os objetos e os últimos nomes lógicos
+    capturados; é lido no primeiro uso e gravado ao esvaziar a fila do
+    GravadorScreenshots, no final da sessão.
+    """
+
+    ARQUIVO_INDICE = "indice.json"
+
+    _lock = threading.RLock()
+    _carregado = False
+    # chave -> {"arquivo", "bytes"}, do menos para o mais usado recentemente
+    _objetos: "OrderedDict[str, dict]" = OrderedDict()
+    _recentes: deque = deque(maxlen=MAXIMO_RECENTES)
+    _total_bytes = 0
+    _formato_avisado = False
+
+    @classmethod
+    def formato(cls) -> str:
+        """Formato configurado (SAUCE_FORMATO_SCREENSHOTS), ou png se o Pillow não estiver instalado"""
+        formato = TestConfig.FORMATO_SCREENSHOTS if TestConfig.FORMATO_SCREENSHOTS in FORMATOS else "png"
+        if formato != "png" and not PILLOW_DISPONIVEL:
+            if not cls._formato_avisado:
+                print(f"⚠️ Pillow não instalado: screenshots gravados em PNG em vez de {formato}")
+                cls._formato_avisado = True
+            return "png"
+        return formato
+
+    @staticmethod
+    def calcular_chave(conteudo_base64: str) -> str:
+        """Chave do conteúdo (hash do PNG em base64, sem decodificar)"""
+        return hashlib.sha256(conteudo_base64.encode("ascii")).hexdigest()[:24]
+
+    @classmethod
+    def caminho_objeto(cls, chave: str) -> str:
+        return os.path.join(TestConfig.SCREENSHOTS_DIR, f"{chave}.{FORMATOS[cls.formato()][0]}")
+
+    @classmethod
+    def registrar_nome(cls, nome: str, chave: str) -> str:
+        """
+        Associa um nome lógico ao conteúdo (chamado na captura, antes da gravação)
+
+        Returns:
+            str: Caminho do objeto no armazém
+        """
+        caminho = cls.caminho_objeto(chave)
+        with cls._lock:
+            cls._carregar()
+            cls._recentes.append({"nome": nome, "arquivo": caminho, "timestamp": time.time()})
+        return caminho
+
+    @classmethod
+    def recentes(cls, quantidade: int = 5) -> List[dict]:
+        """Últimos screenshots capturados, do mais recente para o mais antigo"""
+        with cls._lock:
+            cls._carregar()
+            return list(reversed(cls._recentes))[:quantidade]
+
+    @classmethod
+    def gravar(cls, conteudo_base64: str, chave: str) -> Tuple[str, Optional[bytes]]:
+        """
+        Grava o objeto se ainda não existir no armazém
+
+        Returns:
+            tuple: (caminho do objeto, bytes gravados ou None se o objeto já existia)
+        """
+        caminho = cls.caminho_objeto(chave)
+        with cls._lock:
+            cls._carregar()
+            if chave in cls._objetos and os.path.exists(caminho):
+                cls._objetos.move_to_end(chave)
+                return caminho, None
+
+        imagem = cls._codificar(base64.b64decode(conteudo_base64))
+        os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+        with open(caminho, 'wb') as f:
+            f.write(imagem)
+
+        with cls._lock:
+            anterior = cls._objetos.pop(chave, None)
+            if anterior:
+                cls._total_bytes -= anterior["bytes"]
+                # Formato trocado entre execuções: o arquivo antigo sairia do índice e escaparia do limite
+                if anterior["arquivo"] != caminho:
+                    cls._remover_arquivo(anterior["arquivo"])
+            cls._objetos[chave] = {"arquivo": caminho, "bytes": len(imagem)}
+            cls._total_bytes += len(imagem)
+            cls._aplicar_limite()
+        return caminho, imagem
+
+    @classmethod
+    def ler(cls, chave: str) -> Optional[bytes]:
+        """Conteúdo de um objeto já gravado (None se não existir)"""
+        try:
+            with open(cls.caminho_objeto(chave), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    @classmethod
+    def _codificar(cls, png: bytes) -> bytes:
+        formato = cls.formato()
+        if formato == "png":
+            return png
+        imagem = Image.open(io.BytesIO(png))
+        saida = io.BytesIO()
+        if formato == "webp":
+            imagem.save(saida, format="WEBP", lossless=True, method=4)
+        else:
+            imagem.save(saida, format="PNG", optimize=True)
+        return saida.getvalue()
+
+    @classmethod
+    def _aplicar_limite(cls):
+        """Remove os objetos menos usados recentemente até caber no limite de disco"""
+        limite = TestConfig.SCREENSHOTS_LIMITE_MB * 1024 * 1024
+        # O objeto recém-gravado (último) nunca é removido
+        while cls._total_bytes > limite and len(cls._objetos) > 1:
+            _, objeto = cls._objetos.popitem(last=False)
+            cls._total_bytes -= objeto["bytes"]
+            cls._remover_arquivo(objeto["arquivo"])
+
+    @staticmethod
+    def _remover_arquivo(caminho: str):
+        try:
+            os.remove(caminho)
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------ índice
+
+    @classmethod
+    def _caminho_indice(cls) -> str:
+        return os.path.join(TestConfig.SCREENSHOTS_DIR, cls.ARQUIVO_INDICE)
+
+    @classmethod
+    def _carregar(cls):
+        if cls._carregado:
+            return
+        cls._carregado = True
+        try:
+            with open(cls._caminho_indice(), 'r', encoding='utf-8') as f:
+                indice = json.load(f)
+        except (OSError, ValueError):
+            return
+        for objeto in indice.get("objetos", []):
+            if os.path.exists(objeto["arquivo"]):
+                cls._objetos[objeto["chave"]] = {"arquivo": objeto["arquivo"], "bytes": objeto["bytes"]}
+                cls._total_bytes += objeto["bytes"]
+        cls._recentes.extend(indice.get("recentes", []))
+
+    @classmethod
+    def gravar_indice(cls):
+        """Grava o índice do armazém (objetos em ordem de uso e nomes recentes)"""
+        with cls._lock:
+            if not cls._carregado:
+                return
+            existentes = {objeto["arquivo"] for objeto in cls._objetos.values()}
+            indice = {
+                "formato": cls.formato(),
+                "total_bytes": cls._total_bytes,
+                "objetos": [dict(objeto, chave=chave) for chave, objeto in cls._objetos.items()],
+                # Nomes cujo objeto já foi removido pelo limite de disco saem do índice
+                "recentes": [recente for recente in cls._recentes if recente["arquivo"] in existentes],
+            }
+        os.makedirs(TestConfig.SCREENSHOTS_DIR, exist_ok=True)
+        with open(cls._caminho_indice(), 'w', encoding='utf-8') as f:
+            json.dump(indice, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,252 @@
+"""
+Baseline de desempenho dos testes
+Guarda em SQLite a duração de cada teste e de cada etapa (allure.step) das
+execuções anteriores e aponta os que ficaram mais lentos que a mediana
+"""
+
+import glob
+import json
+import os
+import re
+import sqlite3
+import statistics
+import time
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional, Tuple
+
+from config.test_config import TestConfig
+
+# Etapa usada para a duração do teste inteiro
+ETAPA_TESTE = "(teste)"
+
+# Profundidade máxima de allure.step registrada (ex.: "Executando fluxo > Etapa 1: Login")
+PROFUNDIDADE_ETAPAS = 2
+
+# Nomes de etapa com timestamp (ex.: "Capturando screenshot: 02_apos_login_20240101_101010.png")
+# mudam a cada execução e nunca formariam um baseline
+PADRAO_TIMESTAMP = re.compile(r"\d{8}_\d{6}")
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS execucoes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    inicio REAL NOT NULL,
+    worker TEXT,
+    origem TEXT
+);
+CREATE TABLE IF NOT EXISTS duracoes (
+    execucao_id INTEGER NOT NULL REFERENCES execucoes(id),
+    teste TEXT NOT NULL,
+    etapa TEXT NOT NULL,
+    duracao REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_duracoes_teste ON duracoes (teste, etapa);
+"""
+
+Duracoes = Dict[Tuple[str, str], float]
+
+
+def ler_duracoes_junit(caminho: str, desde: float = 0) -> Duracoes:
+    """
+    Duração dos testes aprovados no junit.xml do pytest
+
+    Args:
+        caminho: Arquivo junit.xml
+        desde: Ignora o arquivo se foi modificado antes deste instante (epoch), ex.: de uma execução anterior
+
+    Returns:
+        dict: (teste, "(teste)") -> segundos, com teste no formato "modulo.Classe::test_nome[param]"
+    """
+    duracoes: Duracoes = {}
+    try:
+        if os.path.getmtime(caminho) < desde:
+            return duracoes
+        raiz = ET.parse(caminho).getroot()
+    except (OSError, ET.ParseError):
+        return duracoes
+    for caso in raiz.iter("testcase"):
+        # Falhas, erros e skips não entram no baseline
+        if any(filho.tag in ("failure", "error", "skipped") for filho in caso):
+            continue
+        teste = f"{caso.get('classname')}::{caso.get('name')}"
+        duracoes[(teste, ETAPA_TESTE)] = float(caso.get("time", 0))
+    return duracoes
+
+
+def ler_duracoes_allure(diretorio: str, desde: float = 0) -> Duracoes:
+    """
+    Duração das etapas (allure.step) dos testes aprovados
+
+    Args:
+        diretorio: Diretório allure-results
+        desde: Ignora resultados iniciados antes deste instante (epoch em segundos)
+
+    Returns:
+        dict: (teste, "etapa > subetapa") -> segundos
+    """
+    duracoes: Duracoes = {}
+    for arquivo in glob.glob(os.path.join(diretorio, "*-result.json")):
+        try:
+            with open(arquivo, 'r', encoding='utf-8') as f:
+                resultado = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if resultado.get("status") != "passed" or resultado.get("start", 0) < desde * 1000:
+            continue
+        teste = f"{resultado.get('fullName', '').split('#')[0]}::{resultado.get('name')}"
+        _coletar_etapas(resultado.get("steps", []), teste, [], duracoes)
+    return duracoes
+
+
+def _coletar_etapas(etapas: List[dict], teste: str, caminho: List[str], duracoes: Duracoes):
+    for etapa in etapas:
+        nome = etapa.get("name", "")
+        if PADRAO_TIMESTAMP.search(nome) or "start" not in etapa or "stop" not in etapa:
+            continue
+        caminho_etapa = caminho + [nome]
+        chave = (teste, " > ".join(caminho_etapa))
+        # Etapas repetidas no mesmo teste são somadas
+        duracoes[chave] = duracoes.get(chave, 0.0) + (etapa["stop"] - etapa["start"]) / 1000
+        if len(caminho_etapa) < PROFUNDIDADE_ETAPAS:
+            _coletar_etapas(etapa.get("steps", []), teste, caminho_etapa, duracoes)
+
+
+class BaselineDesempenho:
+    """
+    Histórico de durações por teste e etapa (SQLite em TestConfig.BASELINE_DESEMPENHO_FILE)
+
+    O baseline de cada teste/etapa é a mediana das últimas
+    TestConfig.BASELINE_JANELA_EXECUCOES execuções em que ele passou.
+    """
+
+    def __init__(self, caminho: str = None):
+        self.caminho = caminho or TestConfig.BASELINE_DESEMPENHO_FILE
+        os.makedirs(os.path.dirname(self.caminho) or ".", exist_ok=True)
+        self.conexao = sqlite3.connect(self.caminho)
+        self.conexao.executescript(ESQUEMA)
+
+    def fechar(self):
+        self.conexao.close()
+
+    def registrar_execucao(self, duracoes: Duracoes, origem: str = "pytest", inicio: float = None) -> int:
+        """
+        Adiciona as durações de uma execução ao histórico
+
+        Returns:
+            int: Id da execução registrada
+        """
+        with self.conexao:
+            cursor = self.conexao.execute(
+                "INSERT INTO execucoes (inicio, worker, origem) VALUES (?, ?, ?)",
+                (inicio or time.time(), TestConfig.WORKER_ID or None, origem),
+            )
+            execucao_id = cursor.lastrowid
+            self.conexao.executemany(
+                "INSERT INTO duracoes (execucao_id, teste, etapa, duracao) VALUES (?, ?, ?, ?)",
+                [(execucao_id, teste, etapa, duracao) for (teste, etapa), duracao in duracoes.items()],
+            )
+        return execucao_id
+
+    def baseline(self, janela: int = None) -> Dict[Tuple[str, str], Tuple[float, int]]:
+        """
+        Mediana das últimas execuções de cada teste/etapa
+
+        Args:
+            janela: Quantidade de execuções consideradas (usa TestConfig.BASELINE_JANELA_EXECUCOES se não especificado)
+
+        Returns:
+            dict: (teste, etapa) -> (mediana em segundos, amostras)
+        """
+        janela = janela or TestConfig.BASELINE_JANELA_EXECUCOES
+        historico: Dict[Tuple[str, str], List[float]] = {}
+        linhas = self.conexao.execute(
+            "SELECT teste, etapa, duracao FROM duracoes ORDER BY execucao_id DESC"
+        )
+        for teste, etapa, duracao in linhas:
+            valores = historico.setdefault((teste, etapa), [])
+            if len(valores) < janela:
+                valores.append(duracao)
+        return {chave: (statistics.median(valores), len(valores)) for chave, valores in historico.items()}
+
+    def comparar(self, duracoes: Duracoes, limite: float = None, ruido_s: float = None,
+                 minimo_amostras: int = None) -> List[dict]:
+        """
+        Compara as durações de uma execução com o baseline
+
+        Uma etapa regride quando fica mais lenta que a mediana além do limite
+        relativo e do ruído absoluto, e o baseline tem amostras suficientes.
+
+        Args:
+            duracoes: Durações da execução atual
+            limite: Piora relativa tolerada (usa TestConfig.LIMITE_REGRESSAO_DURACAO)
+            ruido_s: Diferença em segundos sempre tolerada (usa TestConfig.RUIDO_REGRESSAO_S)
+            minimo_amostras: Execuções necessárias no baseline (usa TestConfig.BASELINE_MINIMO_AMOSTRAS)
+
+        Returns:
+            list[dict]: Comparações com baseline, da maior variação para a menor
+        """
+        limite = TestConfig.LIMITE_REGRESSAO_DURACAO if limite is None else limite
+        ruido_s = TestConfig.RUIDO_REGRESSAO_S if ruido_s is None else ruido_s
+        minimo_amostras = minimo_amostras or TestConfig.BASELINE_MINIMO_AMOSTRAS
+
+        referencias = self.baseline()
+        comparacoes = []
+        for (teste, etapa), duracao in duracoes.items():
+            referencia = referencias.get((teste, etapa))
+            if referencia is None or referencia[1] < minimo_amostras:
+                continue
+            mediana, amostras = referencia
+            delta = duracao - mediana
+            comparacoes.append({
+                "teste": teste,
+                "etapa": etapa,
+                "mediana_s": round(mediana, 3),
+                "atual_s": round(duracao, 3),
+                "variacao": round(delta / mediana, 4) if mediana else None,
+                "amostras": amostras,
+                "regressao": delta > ruido_s and delta > mediana * limite,
+            })
+        comparacoes.sort(key=lambda c: -(c["variacao"] or 0))
+        return comparacoes
+
+
+def verificar_regressoes(inicio_execucao: float, junit: str = None, allure_results: str = None,
+                         registrar: bool = True) -> Optional[List[dict]]:
+    """
+    Compara a execução com o baseline e a registra no histórico
+
+    Args:
+        inicio_execucao: Início da execução (epoch), para ignorar o junit.xml e os resultados Allure antigos
+        junit: Caminho do junit.xml (padrão: reports/junit.xml)
+        allure_results: Diretório allure-results (padrão: reports/allure-results)
+        registrar: Se True, adiciona a execução ao histórico depois de comparar (execuções
+            com regressões não são registradas, para não deslocar a mediana)
+
+    Returns:
+        list[dict] | None: Regressões encontradas (None se não houve durações para comparar)
+    """
+    duracoes = ler_duracoes_junit(junit or os.path.join(TestConfig.REPORTS_DIR, "junit.xml"), inicio_execucao)
+    duracoes.update(ler_duracoes_allure(
+        allure_results or os.path.join(TestConfig.REPORTS_DIR, "allure-results"), inicio_execucao
+    ))
+    if not duracoes:
+        return None
+
+    baseline = BaselineDesempenho()
+    try:
+        comparacoes = baseline.comparar(duracoes)
+        regressoes = [comparacao for comparacao in comparacoes if comparacao["regressao"]]
+        if registrar and not regressoes:
+            baseline.registrar_execucao(duracoes, inicio=inicio_execucao)
+    finally:
+        baseline.fechar()
+
+    caminho = os.path.join(TestConfig.REPORTS_DIR, "regressoes_desempenho.json")
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump({"comparacoes": comparacoes, "regressoes": regressoes}, f, indent=2, ensure_ascii=False)
+    print(f"📊 Baseline de desempenho: {len(comparacoes)} comparações, {len(regressoes)} regressões ({caminho})")
+    if registrar and regressoes:
+        print("   ⚠️ Execução com regressões: não registrada no histórico do baseline")
+    for regressao in regressoes:
+        print(f"   🐢 {regressao['teste']} [{regressao['etapa']}]: mediana {regressao['mediana_s']:.2f}s -> "
+              f"{regressao['atual_s']:.2f}s ({regressao['variacao']:+.0%})")
+    return regressoes
@@ -0,0 +1,304 @@
+"""
+Catálogo de produtos do Sauce Demo
+Fornece nome, id, slug, data-test e preço esperados de cada produto sem
+reextrair o inventário a cada teste
+"""
+
+import argparse
+import json
+import os
+from datetime import datetime
+
+from config.test_config import TestConfig
+
+
+# Versão do formato do snapshot suportada por este módulo
+VERSAO_FORMATO = 1
+
+# Extrai id, nome, slug, preço e descrição de todos os itens em uma única chamada
+SCRIPT_EXTRAIR_CATALOGO = """
+    return Array.from(document.querySelectorAll('.inventory_item')).map(function (item) {
+        var link = item.querySelector('a[id$="_title_link"]');
+        var botao = item.querySelector('button');
+        var dataTest = botao ? (botao.getAttribute('data-test') || botao.id || '') : '';
+        return {
+            id: link ? parseInt(link.id.replace('item_', ''), 10) : null,
+            nome: item.querySelector('.inventory_item_name').textContent.trim(),
+            slug: dataTest.replace(/^(add-to-cart|remove)-/, ''),
+            preco: item.querySelector('.inventory_item_price').textContent.trim(),
+            descricao: (item.querySelector('.inventory_item_desc') || {textContent: ''}).textContent.trim()
+        };
+    });
+"""
+
+
+class ProdutoCatalogo:
+    """Produto do catálogo com os identificadores usados pelo site"""
+
+    def __init__(self, id, nome, slug, preco, descricao=""):
+        """
+        Inicializa o produto
+
+        Args:
+            id: Id usado em cart-contents (localStorage) e nos links item_<id>_title_link
+            nome: Nome do produto
+            slug: Sufixo dos data-test (ex.: "sauce-labs-backpack")
+            preco: Preço do produto (float)
+            descricao: Descrição exibida no inventário
+        """
+        self.id = id
+        self.nome = nome
+        self.slug = slug
+        self.preco = preco
+        self.descricao = descricao
+
+    @property
+    def data_test_adicionar(self):
+        """data-test do botão Add to cart"""
+        return f"add-to-cart-{self.slug}"
+
+    @property
+    def data_test_remover(self):
+        """data-test do botão Remove"""
+        return f"remove-{self.slug}"
+
+    def como_dict(self):
+        """
+        Converte o produto para o formato do snapshot
+
+        Returns:
+            dict: id, nome, slug, preço e descrição
+        """
+        return {
+            "id": self.id,
+            "nome": self.nome,
+            "slug": self.slug,
+            "preco": self.preco,
+            "descricao": self.descricao,
+        }
+
+
+class CatalogoProdutos:
+    """
+    Catálogo indexado por id, nome, slug, data-test e preço
+
+    A fonte é definida por TestConfig.CATALOGO_FONTE: "snapshot" lê o JSON
+    versionado (TestConfig.CATALOGO_PRODUTOS_FILE); "site" extrai o
+    inventário uma vez por execução e usa o snapshot como reserva.
+    """
+
+    # Catálogo da execução (carregado uma vez por processo)
+    _instancia = None
+    _extracao_tentada = False
+
+    def __init__(self, produtos, versao=VERSAO_FORMATO, origem=""):
+        """
+        Inicializa o catálogo e monta os índices
+
+        Args:
+            produtos: Lista de ProdutoCatalogo
+            versao: Versão do formato do snapshot
+            origem: Arquivo ou URL de onde o catálogo veio
+        """
+        self.produtos = list(produtos)
+        self.versao = versao
+        self.origem = origem
+        self._por_id = {p.id: p for p in self.produtos}
+        self._por_nome = {p.nome.lower(): p for p in self.produtos}
+        self._por_slug = {p.slug: p for p in self.produtos}
+        self._por_data_test = {}
+        self._por_preco = {}
+        for produto in self.produtos:
+            self._por_data_test[produto.data_test_adicionar] = produto
+            self._por_data_test[produto.data_test_remover] = produto
+            self._por_preco.setdefault(round(produto.preco, 2), []).append(produto)
+
+    # ------------------------------------------------------------------ fontes
+
+    @classmethod
+    def carregar(cls, arquivo=None):
+        """
+        Retorna o catálogo da execução, lendo o snapshot na primeira chamada
+
+        Args:
+            arquivo: Caminho do snapshot (usa TestConfig.CATALOGO_PRODUTOS_FILE se não especificado)
+
+        Returns:
+            CatalogoProdutos: Catálogo carregado
+
+        Raises:
+            ValueError: Se o snapshot usar um formato mais novo que VERSAO_FORMATO
+        """
+        if cls._instancia is None or arquivo:
+            cls._instancia = cls.ler_snapshot(arquivo or TestConfig.CATALOGO_PRODUTOS_FILE)
+        return cls._instancia
+
+    @classmethod
+    def obter(cls, driver=None):
+        """
+        Retorna o catálogo da execução conforme TestConfig.CATALOGO_FONTE
+
+        Com a fonte "site", a primeira chamada que recebe um driver na
+        página de produtos extrai o inventário; as demais reutilizam o resultado.
+
+        Args:
+            driver: Instância do WebDriver (opcional, usada apenas pela fonte "site")
+
+        Returns:
+            CatalogoProdutos: Catálogo da execução
+        """
+        # Extrai só a partir da página de produtos, para não navegar no meio de um teste
+        if (TestConfig.CATALOGO_FONTE == "site" and driver is not None and not cls._extracao_tentada
+                and "inventory.html" in driver.current_url):
+            cls._extracao_tentada = True
+            try:
+                cls._instancia = cls.extrair_do_site(driver)
+            except Exception as e:
+                print(f"⚠️  Falha ao extrair o catálogo do site, usando snapshot: {e}")
+        return cls.carregar()
+
+    @classmethod
+    def ler_snapshot(cls, arquivo):
+        """Lê um snapshot JSON do catálogo"""
+        with open(arquivo, 'r', encoding='utf-8') as f:
+            dados = json.load(f)
+        versao = dados.get("versao", 1)
+        if versao > VERSAO_FORMATO:
+            raise ValueError(f"Snapshot do catálogo na versão {versao}; suportada até {VERSAO_FORMATO}")
+        return cls([ProdutoCatalogo(**produto) for produto in dados["produtos"]], versao=versao, origem=arquivo)
+
+    @classmethod
+    def extrair_do_site(cls, driver):
+        """
+        Extrai o catálogo da página de produtos com uma única chamada execute_script
+
+        Args:
+            driver: Instância do WebDriver com sessão autenticada
+
+        Returns:
+            CatalogoProdutos: Catálogo extraído
+        """
+        # Import local: TestHelpers importa o Selenium, desnecessário para quem só lê o snapshot
+        from utils.test_helpers import TestHelpers
+
+        if "inventory.html" not in driver.current_url:
+            driver.get(TestConfig.PRODUCTS_URL)
+        dados = driver.execute_script(SCRIPT_EXTRAIR_CATALOGO)
+        if not dados:
+            raise ValueError(f"Nenhum produto encontrado em {driver.current_url}")
+
+        produtos = [
+            ProdutoCatalogo(
+                id=item["id"],
+                nome=item["nome"],
+                slug=item["slug"],
+                preco=TestHelpers.extrair_numero_de_texto(item["preco"]),
+                descricao=item["descricao"],
+            )
+            for item in dados
+        ]
+        print(f"📦 Catálogo extraído do site: {len(produtos)} produtos")
+        return cls(produtos, origem=TestConfig.PRODUCTS_URL)
+
+    def salvar(self, arquivo=None):
+        """
+        Grava o catálogo como snapshot versionado
+
+        Args:
+            arquivo: Caminho do snapshot (usa TestConfig.CATALOGO_PRODUTOS_FILE se não especificado)
+
+        Returns:
+            str: Caminho do arquivo gravado
+        """
+        arquivo = arquivo or TestConfig.CATALOGO_PRODUTOS_FILE
+        os.makedirs(os.path.dirname(arquivo) or ".", exist_ok=True)
+        dados = {
+            "versao": VERSAO_FORMATO,
+            "origem": self.origem,
+            "extraido_em": datetime.now().isoformat(timespec="seconds"),
+            "produtos": [produto.como_dict() for produto in self.produtos],
+        }
+        with open(arquivo, 'w', encoding='utf-8') as f:
+            json.dump(dados, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        return arquivo
+
+    @classmethod
+    def limpar_cache(cls):
+        """Descarta o catálogo da execução"""
+        cls._instancia = None
+        cls._extracao_tentada = False
+
+    # --------------------------------------------------------------- consultas
+
+    def buscar(self, chave):
+        """
+        Busca um produto por id, nome completo, slug, data-test ou nome simplificado
+
+        Args:
+            chave: Id, nome ("Sauce Labs Backpack"), slug ("sauce-labs-backpack"),
+                data-test ("add-to-cart-sauce-labs-backpack") ou nome simplificado ("backpack")
+
+        Returns:
+            ProdutoCatalogo: Produto encontrado
+
+        Raises:
+            KeyError: Se nenhum produto corresponder à chave
+        """
+        if isinstance(chave, int):
+            if chave in self._por_id:
+                return self._por_id[chave]
+            raise KeyError(f"Produto não encontrado no catálogo: {chave}")
+
+        chave_normalizada = chave.strip().lower()
+        produto = (
+            self._por_nome.get(chave_normalizada)
+            or self._por_slug.get(chave_normalizada)
+            or self._por_data_test.get(chave_normalizada)
+            or self._por_slug.get(f"sauce-labs-{chave_normalizada}")
+        )
+        if produto is None:
+            raise KeyError(f"Produto não encontrado no catálogo: {chave}")
+        return produto
+
+    def buscar_por_preco(self, preco):
+        """Retorna os produtos com o preço informado (podem ser vários)"""
+        return list(self._por_preco.get(round(preco, 2), []))
+
+    def preco_esperado(self, chave):
+        """Retorna o preço do produto no catálogo"""
+        return self.buscar(chave).preco
+
+    def subtotal_esperado(self, chaves):
+        """Soma os preços de catálogo dos produtos informados"""
+        return round(sum(self.preco_esperado(chave) for chave in chaves), 2)
+
+    def imposto_esperado(self, chaves):
+        """Calcula o imposto esperado (TestConfig.TAXA_IMPOSTO_ESPERADA) sobre o subtotal"""
+        return round(self.subtotal_esperado(chaves) * TestConfig.TAXA_IMPOSTO_ESPERADA, 2)
+
+
+def main():
+    """Atualiza o snapshot do catálogo a partir do site: python -m utils.catalogo_produtos"""
+    # Imports locais: só o utilitário de atualização precisa do navegador
+    from pages.login_page import LoginPage
+    from utils.webdriver_config import WebDriverConfig
+
+    parser = argparse.ArgumentParser(description="Atualiza o snapshot do catálogo de produtos")
+    parser.add_argument("--arquivo", default=TestConfig.CATALOGO_PRODUTOS_FILE)
+    parser.add_argument("--usuario", default="standard_user")
+    parser.add_argument("--senha", default="secret_sauce")
+    args = parser.parse_args()
+
+    driver = WebDriverConfig().obter_driver()
+    try:
+        if not LoginPage(driver).entrar(args.usuario, args.senha):
+            raise SystemExit(f"❌ Login falhou para {args.usuario}")
+        catalogo = CatalogoProdutos.extrair_do_site(driver)
+        print(f"📄 Snapshot gravado em: {catalogo.salvar(args.arquivo)}")
+    finally:
+        WebDriverConfig.fechar_driver(driver)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+Resolução do executável do ChromeDriver com cache entre processos
+Evita chamar ChromeDriverManager().install() a cada driver criado
+"""
+
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+from config.test_config import TestConfig
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class ResolvedorChromeDriver:
+    """
+    Localiza o ChromeDriver uma única vez e registra o caminho em disco
+    
+    Ordem de resolução:
+    1. Variável de ambiente CHROMEDRIVER_PATH (nunca acessa a rede)
+    2. Cache em memória do processo atual
+    3. Cache em disco, indexado pela versão do Chrome instalado
+    4. ChromeDriverManager (rede, exceto com SAUCE_OFFLINE=1) e, em seguida, chromedriver no PATH
+    
+    O resultado fica em memória até o fim do processo mesmo quando nenhum
+    driver é encontrado, e uma falha do ChromeDriverManager não é repetida:
+    sem rede, a busca (e o timeout) acontece uma única vez.
+    
+    O cache em disco é protegido por um lock de arquivo, então workers do
+    pytest-xdist e execuções do behave resolvem o driver uma única vez.
+    
+    iniciar_chrome() descarta o caminho em cache quando o Chrome não inicia
+    com ele (ex.: Chrome atualizado sem mudar a chave do cache) e resolve
+    o driver novamente uma vez.
+    """
+    
+    VARIAVEL_CAMINHO = "CHROMEDRIVER_PATH"
+    
+    _caminho_resolvido = None
+    # True após a primeira resolução do processo, inclusive quando nenhum caminho foi encontrado
+    _resolvido = False
+    _gerenciador_falhou = False
+    
+    @classmethod
+    def resolver(cls):
+        """
+        Retorna o caminho do executável do ChromeDriver
+        
+        Returns:
+            str: Caminho do ChromeDriver, ou None para deixar o Selenium decidir
+        """
+        caminho_env = os.getenv(cls.VARIAVEL_CAMINHO)
+        if caminho_env:
+            if not os.path.isfile(caminho_env):
+                raise FileNotFoundError(
+                    f"{cls.VARIAVEL_CAMINHO} aponta para um arquivo inexistente: {caminho_env}"
+                )
+            return caminho_env
+        
+        if cls._resolvido and (cls._caminho_resolvido is None or os.path.isfile(cls._caminho_resolvido)):
+            return cls._caminho_resolvido
+        
+        versao_chrome = cls._obter_versao_chrome()
+        arquivo_cache = TestConfig.CHROMEDRIVER_CACHE_FILE
+        
+        caminho = cls._ler_cache(arquivo_cache, versao_chrome)
+        if caminho is None:
+            with cls._lock_arquivo(f"{arquivo_cache}.lock"):
+                # Outro processo pode ter resolvido enquanto aguardávamos o lock
+                caminho = cls._ler_cache(arquivo_cache, versao_chrome)
+                if caminho is None:
+                    caminho = cls._resolver_sem_cache()
+                    if caminho:
+                        cls._gravar_cache(arquivo_cache, versao_chrome, caminho)
+        
+        cls._caminho_resolvido = caminho
+        cls._resolvido = True
+        return caminho
+    
+    @classmethod
+    def iniciar_chrome(cls, options):
+        """
+        Inicia o Chrome com o ChromeDriver resolvido, tentando de novo uma vez sem o cache
+        
+        Args:
+            options: Options do Chrome
+        
+        Returns:
+            WebDriver: Instância do Chrome
+        """
+        caminho = cls.resolver()
+        try:
+            return cls._iniciar(caminho, options)
+        except Exception as e:
+            # Sem caminho (Selenium decide) ou caminho fixado em CHROMEDRIVER_PATH: não há cache a descartar
+            if not caminho or os.getenv(cls.VARIAVEL_CAMINHO):
+                raise
+            print(f"⚠️ Falha ao iniciar o Chrome com {caminho} ({e}); resolvendo o ChromeDriver novamente")
+            cls.invalidar(caminho)
+        return cls._iniciar(cls.resolver(), options)
+    
+    @classmethod
+    def invalidar(cls, caminho):
+        """
+        Remove um caminho dos caches em memória e em disco
+        
+        Args:
+            caminho: Caminho do ChromeDriver que falhou
+        """
+        if cls._caminho_resolvido == caminho:
+            cls._caminho_resolvido = None
+            cls._resolvido = False
+        arquivo_cache = TestConfig.CHROMEDRIVER_CACHE_FILE
+        with cls._lock_arquivo(f"{arquivo_cache}.lock"):
+            try:
+                with open(arquivo_cache, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                return
+            restante = {versao: entrada for versao, entrada in cache.items() if entrada.get("caminho") != caminho}
+            if len(restante) != len(cache):
+                cls._gravar_json(arquivo_cache, restante)
+    
+    @staticmethod
+    def _iniciar(caminho, options):
+        if caminho:
+            return webdriver.Chrome(service=Service(caminho), options=options)
+        # Sem caminho conhecido: o Selenium procura o driver no PATH
+        return webdriver.Chrome(options=options)
+    
+    @staticmethod
+    def _obter_versao_chrome():
+        """Obtém a versão do Chrome instalado (chave do cache)"""
+        try:
+            from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+            versao = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+            return versao or "desconhecida"
+        except Exception:
+            return "desconhecida"
+    
+    @classmethod
+    def _resolver_sem_cache(cls):
+        """Resolve o ChromeDriver pelo ChromeDriverManager (se houver rede) ou pelo PATH"""
+        if not TestConfig.OFFLINE and not cls._gerenciador_falhou:
+            try:
+                from webdriver_manager.chrome import ChromeDriverManager
+                return ChromeDriverManager().install()
+            except Exception as e:
+                print(f"Erro ao resolver ChromeDriver com ChromeDriverManager: {e}")
+                cls._gerenciador_falhou = True
+        
+        caminho_path = shutil.which("chromedriver")
+        if caminho_path:
+            return caminho_path
+        
+        print("ChromeDriver não encontrado no PATH; o Selenium tentará localizá-lo")
+        return None
+    
+    @staticmethod
+    def _ler_cache(arquivo_cache, versao_chrome):
+        """Lê o caminho do cache em disco, se ainda for válido"""
+        try:
+            with open(arquivo_cache, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        caminho = cache.get(versao_chrome, {}).get("caminho")
+        if caminho and os.path.isfile(caminho):
+            return caminho
+        return None
+    
+    @classmethod
+    def _gravar_cache(cls, arquivo_cache, versao_chrome, caminho):
+        """Grava o caminho no cache em disco (chamado com o lock adquirido)"""
+        try:
+            with open(arquivo_cache, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        
+        cache[versao_chrome] = {"caminho": caminho, "resolvido_em": time.time()}
+        cls._gravar_json(arquivo_cache, cache)
+    
+    @staticmethod
+    def _gravar_json(arquivo_cache, cache):
+        """Grava o cache em disco (chamado com o lock adquirido)"""
+        # Escrita atômica para que leitores sem lock nunca vejam um JSON parcial
+        arquivo_temporario = f"{arquivo_cache}.{os.getpid()}.tmp"
+        with open(arquivo_temporario, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(arquivo_temporario, arquivo_cache)
+    
+    @staticmethod
+    @contextmanager
+    def _lock_arquivo(caminho_lock):
+        """Lock exclusivo entre processos baseado em arquivo"""
+        os.makedirs(os.path.dirname(caminho_lock) or ".", exist_ok=True)
+        with open(caminho_lock, 'a+') as arquivo:
+            if fcntl:
+                fcntl.flock(arquivo.fileno(), fcntl.LOCK_EX)
+            else:
+                arquivo.seek(0)
+                msvcrt.locking(arquivo.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(arquivo.fileno(), fcntl.LOCK_UN)
+                else:
+                    arquivo.seek(0)
+                    msvcrt.locking(arquivo.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,141 @@
+"""
+Evidências apenas em caso de falha
+Com SAUCE_MODO_EVIDENCIAS=falha, os screenshots de etapa ficam em memória
+(últimas N etapas) e só são gravados em disco e no Allure se o teste falhar
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import List
+
+import allure
+
+from config.test_config import TestConfig
+from utils.gravador_screenshots import GravadorScreenshots
+
+# Trecho do DOM guardado por etapa (início do documento, suficiente para localizar a tela)
+SCRIPT_TRECHO_DOM = "return document.documentElement.outerHTML.slice(0, arguments[0]);"
+
+
+class BufferEvidencias:
+    """
+    Buffer circular das últimas TestConfig.EVIDENCIAS_BUFFER_MAX etapas do teste
+
+    Cada snapshot guarda o screenshot (base64), a URL, um trecho do DOM e os
+    logs do console desde a etapa anterior. O buffer é limpo no início de cada
+    teste (conftest.py e features/environment.py) e descarregado pelo fixture
+    capturar_falha ou pelo after_scenario do Behave quando o teste falha.
+    """
+
+    _snapshots: deque = deque(maxlen=TestConfig.EVIDENCIAS_BUFFER_MAX)
+    _lock = threading.Lock()
+
+    @staticmethod
+    def ativo() -> bool:
+        """True quando as evidências de etapa são gravadas apenas em caso de falha"""
+        return TestConfig.MODO_EVIDENCIAS == "falha"
+
+    @classmethod
+    def iniciar_teste(cls):
+        """Descarta os snapshots do teste anterior"""
+        with cls._lock:
+            cls._snapshots.clear()
+
+    @classmethod
+    def registrar(cls, driver, etapa: str, nome_arquivo: str = None) -> dict:
+        """
+        Guarda em memória o estado atual da página
+
+        Args:
+            driver: Instância do WebDriver
+            etapa: Descrição da etapa
+            nome_arquivo: Nome do screenshot caso seja gravado (opcional)
+
+        Returns:
+            dict: Snapshot registrado
+        """
+        snapshot = cls._capturar(driver, etapa, nome_arquivo)
+        with cls._lock:
+            cls._snapshots.append(snapshot)
+        return snapshot
+
+    @classmethod
+    def descarregar(cls, driver, nome_teste: str) -> int:
+        """
+        Grava os snapshots em buffer e o estado no momento da falha
+
+        Args:
+            driver: Instância do WebDriver (None se o navegador já foi fechado)
+            nome_teste: Nome do teste ou cenário que falhou
+
+        Returns:
+            int: Quantidade de snapshots gravados
+        """
+        with cls._lock:
+            snapshots = list(cls._snapshots)
+            cls._snapshots.clear()
+        if driver is not None:
+            try:
+                snapshots.append(cls._capturar(driver, "falha", None))
+            except Exception as e:
+                print(f"⚠️ Não foi possível capturar o estado da falha: {e}")
+
+        with allure.step(f"Evidências da falha ({len(snapshots)} etapas)"):
+            for indice, snapshot in enumerate(snapshots, start=1):
+                cls._gravar(snapshot, indice, nome_teste, driver)
+        print(f"🧾 {len(snapshots)} evidências gravadas para {nome_teste}")
+        return len(snapshots)
+
+    @classmethod
+    def snapshots(cls) -> List[dict]:
+        """Snapshots em buffer, do mais antigo para o mais recente"""
+        with cls._lock:
+            return list(cls._snapshots)
+
+    @staticmethod
+    def _capturar(driver, etapa: str, nome_arquivo: str = None) -> dict:
+        snapshot = {
+            "etapa": etapa,
+            "nome_arquivo": nome_arquivo,
+            "timestamp": time.time(),
+            "url": driver.current_url,
+            "screenshot": driver.get_screenshot_as_base64(),
+            "dom": None,
+            "console": [],
+        }
+        try:
+            snapshot["dom"] = driver.execute_script(SCRIPT_TRECHO_DOM, TestConfig.EVIDENCIAS_TAMANHO_DOM)
+        except Exception:
+            pass
+        try:
+            # Logs do console desde a última leitura (requer goog:loggingPrefs, ver WebDriverConfig)
+            snapshot["console"] = driver.get_log("browser")
+        except Exception:
+            pass
+        return snapshot
+
+    @staticmethod
+    def _gravar(snapshot: dict, indice: int, nome_teste: str, driver):
+        etapa = snapshot["etapa"]
+        timestamp = datetime.fromtimestamp(snapshot["timestamp"]).strftime("%Y%m%d_%H%M%S")
+        nome_arquivo = snapshot["nome_arquivo"] or f"{nome_teste}_{etapa}_{timestamp}.png"
+        with allure.step(f"{indice:02d} - {etapa}"):
+            GravadorScreenshots.enfileirar(
+                driver, nome_arquivo, f"{etapa} - {nome_arquivo}", snapshot["screenshot"]
+            )
+            contexto = {
+                "etapa": etapa,
+                "url": snapshot["url"],
+                "timestamp": datetime.fromtimestamp(snapshot["timestamp"]).isoformat(timespec="milliseconds"),
+                "console": snapshot["console"],
+            }
+            allure.attach(
+                json.dumps(contexto, indent=2, ensure_ascii=False),
+                name=f"Contexto - {etapa}",
+                attachment_type=allure.attachment_type.JSON,
+            )
+            if snapshot["dom"]:
+                allure.attach(snapshot["dom"], name=f"DOM - {etapa}", attachment_type=allure.attachment_type.HTML)
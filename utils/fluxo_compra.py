@@ -0,0 +1,231 @@
+"""
+Etapas do fluxo completo de compra sobre os page objects
+Compartilhadas pelo TestFluxoCompletoCompra e pelas jornadas concorrentes
+(utils/jornadas_assincronas.py)
+"""
+
+import random
+
+from config.test_config import TestConfig
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from utils.test_assertions import TestAssertions
+from utils.test_helpers import MotorEspera
+
+
+class FluxoCompra:
+    """
+    Etapas do fluxo de compra: login, produtos, carrinho, checkout e finalização
+
+    Cada etapa executa as ações e as validações e devolve os dados que
+    produziu; evidências e relatórios ficam a cargo de quem chama.
+    """
+
+    def __init__(self, driver, capturar_etapa=None):
+        """
+        Inicializa o fluxo
+
+        Args:
+            driver: Instância do WebDriver
+            capturar_etapa: Função chamada com o nome de cada etapa para capturar screenshot (opcional)
+        """
+        self.driver = driver
+        self.login_page = LoginPage(driver)
+        self.products_page = ProductsPage(driver)
+        self.cart_page = CartPage(driver)
+        self.checkout_page = CheckoutPage(driver)
+        self._capturar_etapa = capturar_etapa
+
+    def _capturar(self, etapa):
+        """Captura o screenshot da etapa quando há uma função de captura"""
+        if self._capturar_etapa:
+            self._capturar_etapa(etapa)
+
+    def fazer_login(self, usuario, senha):
+        """
+        Autentica o usuário (login rápido quando o teste pediu)
+
+        Args:
+            usuario: Nome do usuário
+            senha: Senha do usuário
+
+        Raises:
+            AssertionError: Se a página de produtos não for aberta
+        """
+        if LoginPage.login_rapido_ativo():
+            # Sessão injetada por cookie: sem formulário para capturar
+            assert self.login_page.fazer_login_rapido(usuario, senha), f"Login rápido falhou para {usuario}"
+        else:
+            self.driver.get(TestConfig.BASE_URL)
+            self._capturar("01_login")
+
+            self.login_page.fazer_login(usuario, senha)
+            MotorEspera.aguardar_url_conter(self.driver, "inventory", timeout=TestConfig.LONG_TIMEOUT, lancar_erro=False)
+        self._capturar("02_apos_login")
+
+        TestAssertions.assert_login_sucesso(self.driver)
+
+    def verificar_login_bloqueado(self, usuario, senha):
+        """
+        Tenta o login de um usuário bloqueado e valida a mensagem de erro
+
+        Args:
+            usuario: Nome do usuário
+            senha: Senha do usuário
+
+        Returns:
+            str: Mensagem de erro exibida
+
+        Raises:
+            AssertionError: Se o login não for recusado com a mensagem de bloqueio
+        """
+        self.driver.get(TestConfig.BASE_URL)
+        self._capturar("pagina_login")
+
+        self.login_page.fazer_login(usuario, senha)
+        MotorEspera.aguardar_elemento_presente(self.driver, LoginPage.MENSAGEM_ERRO_ATIVA, lancar_erro=False)
+        self._capturar("mensagem_erro")
+
+        mensagem_erro = self.login_page.obter_mensagem_erro()
+        assert "locked out" in mensagem_erro.lower(), "Mensagem de erro de usuário bloqueado não encontrada"
+        return mensagem_erro
+
+    def _adicionar_produto_com_fallback(self, produto):
+        """
+        Adiciona um produto ao carrinho com fallback para diferentes estratégias.
+
+        Args:
+            produto: Dicionário com dados do produto
+
+        Returns:
+            bool: True se adicionado com sucesso
+        """
+        nome_completo = produto['nome']
+
+        # Tentar adicionar pelo id do botão (resolvido pelo catálogo de produtos)
+        if self.products_page.adicionar_produto_ao_carrinho(nome_completo):
+            return True
+
+        # Se falhar, tentar adicionar diretamente pelo botão extraído em lote
+        try:
+            botao = produto['botao']
+            if botao is not None and produto['data_test'].startswith("add-to-cart"):
+                botao.click()
+                print(f"Produto '{nome_completo}' adicionado ao carrinho (por elemento)")
+                return True
+        except Exception as e:
+            print(f"Erro ao adicionar produto '{nome_completo}' por elemento: {e}")
+
+        return False
+
+    def selecionar_e_adicionar_produtos(self, quantidade=None):
+        """
+        Valida os preços da listagem e adiciona produtos aleatórios ao carrinho
+
+        Args:
+            quantidade: Produtos a adicionar (usa TestConfig.QUANTIDADE_PRODUTOS_PADRAO se não especificado)
+
+        Returns:
+            tuple: (produtos disponíveis, produtos adicionados)
+
+        Raises:
+            AssertionError: Se algum preço divergir do catálogo ou o contador do carrinho não bater
+        """
+        dados_produtos = self.products_page.obter_dados_produtos()
+
+        # Preços exibidos devem bater com o catálogo
+        TestAssertions.assert_precos_conforme_catalogo(dados_produtos)
+
+        quantidade = quantidade or TestConfig.QUANTIDADE_PRODUTOS_PADRAO
+        produtos_selecionados = random.sample(dados_produtos, min(quantidade, len(dados_produtos)))
+
+        produtos_adicionados = 0
+        for produto in produtos_selecionados:
+            if self._adicionar_produto_com_fallback(produto):
+                produtos_adicionados += 1
+
+        # Aguardar o contador do carrinho refletir os cliques
+        MotorEspera.aguardar_quantidade_carrinho(self.driver, produtos_adicionados, lancar_erro=False)
+
+        # Manter apenas os produtos que foram adicionados
+        produtos_selecionados = produtos_selecionados[:produtos_adicionados]
+
+        self._capturar("03_produtos_adicionados")
+
+        quantidade_carrinho = self.products_page.obter_quantidade_itens_carrinho()
+        TestAssertions.assert_quantidade_carrinho_correta(len(produtos_selecionados), quantidade_carrinho)
+        return dados_produtos, produtos_selecionados
+
+    def verificar_carrinho(self):
+        """
+        Abre o carrinho e valida os preços dos itens
+
+        Returns:
+            float: Preço total dos itens do carrinho
+
+        Raises:
+            AssertionError: Se algum preço divergir do catálogo
+        """
+        # O carrinho preparado via localStorage já abre em cart.html
+        if "cart.html" not in self.driver.current_url:
+            self.products_page.ir_para_carrinho()
+            MotorEspera.aguardar_url_conter(self.driver, "cart.html")
+        self._capturar("04_carrinho")
+
+        produtos_carrinho = self.cart_page.obter_produtos_carrinho()
+        TestAssertions.assert_precos_conforme_catalogo(produtos_carrinho)
+        return self.cart_page.obter_preco_total()
+
+    def executar_checkout(self, nome="João", sobrenome="Silva", cep="12345-678"):
+        """
+        Preenche o checkout e valida imposto e total
+
+        Args:
+            nome: Primeiro nome do comprador
+            sobrenome: Sobrenome do comprador
+            cep: CEP do comprador
+
+        Returns:
+            tuple: (subtotal, taxa de imposto, total final)
+
+        Raises:
+            AssertionError: Se a taxa ou o total estiverem incorretos
+        """
+        self.cart_page.ir_para_checkout()
+        MotorEspera.aguardar_url_conter(self.driver, "checkout-step-one")
+        self._capturar("05_checkout_info")
+
+        self.checkout_page.preencher_informacoes(nome, sobrenome, cep)
+        self._capturar("06_checkout_preenchido")
+
+        self.checkout_page.continuar_checkout()
+        MotorEspera.aguardar_url_conter(self.driver, "checkout-step-two")
+        self._capturar("07_checkout_review")
+
+        subtotal = self.checkout_page.obter_subtotal()
+        taxa_imposto = self.checkout_page.obter_taxa_imposto()
+        total_final = self.checkout_page.obter_total_final()
+
+        TestAssertions.assert_taxa_imposto_correta(subtotal, taxa_imposto)
+        TestAssertions.assert_total_final_correto(subtotal, taxa_imposto, total_final)
+        return subtotal, taxa_imposto, total_final
+
+    def finalizar_compra(self):
+        """
+        Finaliza a compra e valida a mensagem de sucesso
+
+        Returns:
+            str: Mensagem de sucesso exibida
+
+        Raises:
+            AssertionError: Se a mensagem de sucesso não for exibida
+        """
+        self.checkout_page.finalizar_compra()
+        MotorEspera.aguardar_url_conter(self.driver, "checkout-complete", lancar_erro=False)
+        self._capturar("08_compra_finalizada")
+
+        mensagem_sucesso = self.checkout_page.obter_mensagem_sucesso()
+        TestAssertions.assert_mensagem_sucesso_presente(mensagem_sucesso)
+        return mensagem_sucesso
@@ -0,0 +1,157 @@
+"""
+Gravação de screenshots em segundo plano
+O teste só obtém o PNG em base64 (um roundtrip ao chromedriver); decodificar,
+gravar o arquivo e gravar o anexo do Allure ficam com uma thread do processo
+"""
+
+import base64
+import queue
+import threading
+from typing import Optional
+
+import allure
+from allure_commons import plugin_manager
+from allure_commons.model2 import ATTACHMENT_PATTERN, Attachment
+from allure_commons.reporter import AllureReporter
+
+from config.test_config import TestConfig
+from utils.armazem_screenshots import FORMATOS, ArmazemScreenshots
+
+
+class GravadorScreenshots:
+    """
+    Fila limitada de screenshots gravados por uma thread em segundo plano
+
+    O anexo do Allure é registrado na thread do teste, no passo atual (o
+    contexto do Allure é por thread), e só o conteúdo do arquivo é gravado
+    depois. Com a fila cheia, enfileirar bloqueia até a thread liberar espaço,
+    limitando a memória ocupada pelas imagens pendentes.
+
+    As imagens vão para o ArmazemScreenshots, endereçadas pelo hash do
+    conteúdo; o anexo do Allure usa o mesmo hash no nome do arquivo, então
+    quadros repetidos são gravados uma única vez também no allure-results.
+
+    Sem o plugin do Allure identificável (reporter do allure-pytest ou do
+    allure-behave), o anexo é gravado com allure.attach na própria thread do
+    teste, sem a deduplicação por hash.
+
+    A fila é esvaziada com aguardar() ao final da sessão (conftest.py e
+    features/environment.py), antes de o Allure gerar o relatório.
+    """
+
+    _fila: Optional[queue.Queue] = None
+    _thread: Optional[threading.Thread] = None
+    _lock = threading.Lock()
+    # Anexos já gravados no allure-results por este processo (protegido por _lock)
+    _anexos_gravados = set()
+
+    @classmethod
+    def enfileirar(cls, driver, nome_arquivo: str, titulo_allure: str = None, conteudo_base64: str = None) -> str:
+        """
+        Captura o screenshot e agenda a gravação
+
+        Args:
+            driver: Instância do WebDriver
+            nome_arquivo: Nome lógico do screenshot (registrado no índice do armazém)
+            titulo_allure: Nome do anexo no Allure (None para não anexar)
+            conteudo_base64: PNG já capturado (ex.: pelo CDP); se omitido, captura a área visível
+
+        Returns:
+            str: Caminho do arquivo no armazém (gravado em segundo plano)
+        """
+        conteudo = conteudo_base64 or driver.get_screenshot_as_base64()
+        chave = ArmazemScreenshots.calcular_chave(conteudo)
+        caminho = ArmazemScreenshots.registrar_nome(nome_arquivo, chave)
+        arquivo_allure = None
+        if titulo_allure:
+            arquivo_allure = cls._registrar_anexo_allure(titulo_allure, chave)
+            if arquivo_allure is None:
+                # Reporter não encontrado: anexo gravado direto, na thread do teste
+                allure.attach(
+                    base64.b64decode(conteudo), name=titulo_allure, attachment_type=allure.attachment_type.PNG
+                )
+        cls._obter_fila().put((conteudo, chave, arquivo_allure))
+        return caminho
+
+    @classmethod
+    def aguardar(cls):
+        """Bloqueia até todos os screenshots enfileirados serem gravados e atualiza o índice do armazém"""
+        if cls._fila is not None:
+            cls._fila.join()
+        ArmazemScreenshots.gravar_indice()
+
+    @classmethod
+    def _obter_fila(cls) -> queue.Queue:
+        with cls._lock:
+            if cls._fila is None:
+                cls._fila = queue.Queue(maxsize=TestConfig.FILA_SCREENSHOTS_MAX)
+                cls._thread = threading.Thread(
+                    target=cls._processar_fila, name="gravador-screenshots", daemon=True
+                )
+                cls._thread.start()
+            return cls._fila
+
+    @classmethod
+    def _processar_fila(cls):
+        while True:
+            conteudo, chave, arquivo_allure = cls._fila.get()
+            try:
+                cls._gravar(conteudo, chave, arquivo_allure)
+            except Exception as e:
+                print(f"❌ Erro ao gravar screenshot {chave}: {e}")
+            finally:
+                cls._fila.task_done()
+
+    @classmethod
+    def _gravar(cls, conteudo: str, chave: str, arquivo_allure: Optional[str]):
+        _, imagem = ArmazemScreenshots.gravar(conteudo, chave)
+        if not arquivo_allure or not cls._reservar_anexo(arquivo_allure):
+            return
+        imagem = imagem or ArmazemScreenshots.ler(chave)
+        if not imagem:
+            cls._liberar_anexo(arquivo_allure)
+            return
+        try:
+            # Grava o anexo no allure-results pelo mesmo hook usado por allure.attach
+            plugin_manager.hook.report_attached_data(body=imagem, file_name=arquivo_allure)
+        except Exception:
+            cls._liberar_anexo(arquivo_allure)
+            raise
+
+    @classmethod
+    def _reservar_anexo(cls, arquivo_allure: str) -> bool:
+        """Marca o anexo como gravado; False se outro screenshot já o gravou"""
+        with cls._lock:
+            if arquivo_allure in cls._anexos_gravados:
+                return False
+            cls._anexos_gravados.add(arquivo_allure)
+            return True
+
+    @classmethod
+    def _liberar_anexo(cls, arquivo_allure: str):
+        """Desfaz a reserva de um anexo que não pôde ser gravado"""
+        with cls._lock:
+            cls._anexos_gravados.discard(arquivo_allure)
+
+    @staticmethod
+    def _registrar_anexo_allure(titulo: str, chave: str) -> Optional[str]:
+        """
+        Adiciona o anexo ao passo/teste atual do Allure sem gravar o conteúdo
+
+        Returns:
+            str | None: Nome do arquivo do anexo em allure-results, ou None sem o reporter
+                do Allure ou sem teste/passo em andamento
+        """
+        for plugin in plugin_manager.get_plugins():
+            # allure-pytest guarda o reporter em allure_logger; allure-behave, em logger
+            reporter = getattr(plugin, "allure_logger", None) or getattr(plugin, "logger", None)
+            if not isinstance(reporter, AllureReporter):
+                continue
+            item = reporter.get_last_item()
+            if item is None:
+                return None
+            extensao, mime_type = FORMATOS[ArmazemScreenshots.formato()]
+            arquivo = ATTACHMENT_PATTERN.format(prefix=chave, ext=extensao)
+            item.attachments.append(Attachment(source=arquivo, name=titulo, type=mime_type))
+            return arquivo
+        return None
@@ -0,0 +1,275 @@
+"""
+Instrumentação opcional das ações dos page objects
+Mede cada método público das páginas separando o tempo gasto em comandos
+do WebDriver do tempo gasto em esperas (WebDriverWait/MotorEspera)
+"""
+
+import functools
+import glob
+import inspect
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.wait import WebDriverWait
+
+from config.test_config import TestConfig
+from utils.test_helpers import TestHelpers
+
+
+class _QuadroAcao:
+    """Ação em execução na thread atual (acumula comando e espera)"""
+
+    __slots__ = ("comando", "espera")
+
+    def __init__(self):
+        self.comando = 0.0
+        self.espera = 0.0
+
+
+class InstrumentacaoAcoes:
+    """
+    Cronometragem das ações dos page objects (desligada por padrão)
+
+    Ativada com SAUCE_INSTRUMENTAR_ACOES=1 (ou InstrumentacaoAcoes.ativar()),
+    envolve os métodos públicos das páginas sem alterar seus retornos e
+    mede, por chamada:
+
+    - total: duração do método
+    - comando: tempo em WebDriver.execute fora de esperas
+    - espera: tempo em WebDriverWait.until/until_not (inclui os comandos de polling)
+
+    Ações aninhadas (ex.: fazer_login chamando preencher_usuario) são
+    registradas separadamente e os tempos da interna também contam na externa.
+
+    Em execuções paralelas cada worker grava as próprias amostras e mesclar()
+    calcula os percentis sobre as amostras de todos os workers.
+    """
+
+    # Amostras por ação ("LoginPage.fazer_login"): [(total, comando, espera)]
+    _amostras: Dict[str, List[Tuple[float, float, float]]] = {}
+    _lock = threading.Lock()
+    _local = threading.local()
+
+    # Métodos originais substituídos por ativar(): (alvo, nome) -> função
+    _originais: Dict[tuple, object] = {}
+
+    @classmethod
+    def ativa(cls) -> bool:
+        """Indica se a instrumentação está aplicada"""
+        return bool(cls._originais)
+
+    @classmethod
+    def ativar(cls, classes_paginas=None):
+        """
+        Aplica a instrumentação (chamadas repetidas não têm efeito)
+
+        Args:
+            classes_paginas: Classes a instrumentar (padrão: as quatro páginas do Sauce Demo)
+        """
+        if cls.ativa():
+            return
+        if classes_paginas is None:
+            # Import local: evita ciclo com os page objects, que importam utils
+            from pages.cart_page import CartPage
+            from pages.checkout_page import CheckoutPage
+            from pages.login_page import LoginPage
+            from pages.products_page import ProductsPage
+            classes_paginas = [LoginPage, ProductsPage, CartPage, CheckoutPage]
+
+        cls._substituir(WebDriver, "execute", cls._envolver_comando)
+        cls._substituir(WebDriverWait, "until", cls._envolver_espera)
+        cls._substituir(WebDriverWait, "until_not", cls._envolver_espera)
+        for classe in classes_paginas:
+            for nome, metodo in list(vars(classe).items()):
+                # Só métodos de instância públicos; staticmethod/classmethod não são funções em vars()
+                if not nome.startswith("_") and inspect.isfunction(metodo):
+                    cls._substituir(classe, nome, functools.partial(cls._envolver_acao, f"{classe.__name__}.{nome}"))
+
+    @classmethod
+    def desativar(cls):
+        """Restaura os métodos originais (as amostras são mantidas)"""
+        for (alvo, nome), original in cls._originais.items():
+            setattr(alvo, nome, original)
+        cls._originais = {}
+
+    @classmethod
+    def limpar(cls):
+        """Descarta as amostras coletadas"""
+        with cls._lock:
+            cls._amostras = {}
+
+    @classmethod
+    def _substituir(cls, alvo, nome, fabrica):
+        original = vars(alvo)[nome]
+        cls._originais[(alvo, nome)] = original
+        setattr(alvo, nome, functools.wraps(original)(fabrica(original)))
+
+    # ------------------------------------------------------------ envoltórios
+
+    @classmethod
+    def _pilha(cls) -> List[_QuadroAcao]:
+        pilha = getattr(cls._local, "pilha", None)
+        if pilha is None:
+            pilha = cls._local.pilha = []
+            cls._local.em_espera = False
+        return pilha
+
+    @classmethod
+    def _envolver_acao(cls, acao, original):
+        def medido(*args, **kwargs):
+            pilha = cls._pilha()
+            quadro = _QuadroAcao()
+            pilha.append(quadro)
+            inicio = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                total = time.perf_counter() - inicio
+                pilha.pop()
+                with cls._lock:
+                    cls._amostras.setdefault(acao, []).append((total, quadro.comando, quadro.espera))
+        return medido
+
+    @classmethod
+    def _envolver_comando(cls, original):
+        def medido(self, *args, **kwargs):
+            pilha = cls._pilha()
+            # Comandos de polling de uma espera contam como espera
+            if not pilha or cls._local.em_espera:
+                return original(self, *args, **kwargs)
+            inicio = time.perf_counter()
+            try:
+                return original(self, *args, **kwargs)
+            finally:
+                duracao = time.perf_counter() - inicio
+                for quadro in pilha:
+                    quadro.comando += duracao
+        return medido
+
+    @classmethod
+    def _envolver_espera(cls, original):
+        def medido(self, *args, **kwargs):
+            pilha = cls._pilha()
+            if not pilha or cls._local.em_espera:
+                return original(self, *args, **kwargs)
+            cls._local.em_espera = True
+            inicio = time.perf_counter()
+            try:
+                return original(self, *args, **kwargs)
+            finally:
+                duracao = time.perf_counter() - inicio
+                cls._local.em_espera = False
+                for quadro in pilha:
+                    quadro.espera += duracao
+        return medido
+
+    # --------------------------------------------------------------- relatório
+
+    @classmethod
+    def amostras(cls) -> Dict[str, List[Tuple[float, float, float]]]:
+        """Cópia das amostras coletadas: ação -> [(total, comando, espera)]"""
+        with cls._lock:
+            return {acao: list(valores) for acao, valores in cls._amostras.items()}
+
+    @classmethod
+    def resumo(cls) -> dict:
+        """
+        Percentis por ação, da que mais consumiu tempo para a que menos consumiu
+
+        Returns:
+            dict: ação -> chamadas, tempo total e p50/p95/p99 de total, comando e espera
+        """
+        return resumir_amostras(cls.amostras())
+
+    @classmethod
+    def gravar_relatorio(cls, caminho: str = None):
+        """
+        Grava as amostras e o resumo em JSON (nada é gravado se não houver amostras)
+
+        Args:
+            caminho: Arquivo de saída (usa TestConfig.TEMPOS_ACOES_FILE se não especificado)
+
+        Returns:
+            str | None: Caminho gravado
+        """
+        amostras = cls.amostras()
+        if not amostras:
+            return None
+        caminho = caminho or TestConfig.TEMPOS_ACOES_FILE
+        _gravar(caminho, amostras, worker=TestConfig.WORKER_ID or None)
+        print(f"⏱️  Tempos das ações gravados em: {caminho}")
+        return caminho
+
+
+def resumir_amostras(amostras: Dict[str, List[Tuple[float, float, float]]]) -> dict:
+    """
+    Percentis por ação, da que mais consumiu tempo para a que menos consumiu
+
+    Args:
+        amostras: ação -> [(total, comando, espera)]
+
+    Returns:
+        dict: ação -> chamadas, tempo total e p50/p95/p99 de total, comando e espera
+    """
+    resumo = {}
+    for acao, valores in sorted(amostras.items(), key=lambda item: -sum(v[0] for v in item[1])):
+        totais, comandos, esperas = zip(*valores)
+        resumo[acao] = {
+            "chamadas": len(valores),
+            "tempo_total_s": round(sum(totais), 4),
+            "total": TestHelpers.resumir_duracoes(totais),
+            "comando": TestHelpers.resumir_duracoes(comandos),
+            "espera": TestHelpers.resumir_duracoes(esperas),
+        }
+    return resumo
+
+
+def _gravar(caminho: str, amostras: dict, **metadados):
+    """Grava o resumo e as amostras brutas (usadas por mesclar)"""
+    os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump({
+            **metadados,
+            "acoes": resumir_amostras(amostras),
+            "amostras": {acao: [list(valor) for valor in valores] for acao, valores in amostras.items()},
+        }, f, indent=2, ensure_ascii=False)
+
+
+def mesclar(arquivos: List[str] = None, saida: str = None, desde: float = 0):
+    """
+    Junta as amostras dos workers e recalcula os percentis sobre todas elas
+
+    Args:
+        arquivos: Arquivos dos workers (padrão: reports/tempos_acoes_*.json)
+        saida: Arquivo de saída (padrão: reports/tempos_acoes.json)
+        desde: Ignora arquivos modificados antes deste instante (epoch), ex.: de execuções anteriores
+
+    Returns:
+        str | None: Caminho gravado (None se não houver arquivos)
+    """
+    saida = saida or os.path.join(TestConfig.REPORTS_DIR, "tempos_acoes.json")
+    if not arquivos:
+        arquivos = sorted(glob.glob(os.path.join(TestConfig.REPORTS_DIR, "tempos_acoes_*.json")))
+    arquivos = [
+        arquivo for arquivo in arquivos
+        if os.path.abspath(arquivo) != os.path.abspath(saida) and os.path.getmtime(arquivo) >= desde
+    ]
+    if not arquivos:
+        return None
+
+    amostras = {}
+    workers = []
+    for arquivo in arquivos:
+        with open(arquivo, 'r', encoding='utf-8') as f:
+            dados = json.load(f)
+        workers.append(dados.get("worker"))
+        for acao, valores in dados.get("amostras", {}).items():
+            amostras.setdefault(acao, []).extend(tuple(valor) for valor in valores)
+
+    _gravar(saida, amostras, workers=workers)
+    print(f"⏱️  Tempos das ações de {len(arquivos)} workers mesclados em: {saida}")
+    return saida
@@ -0,0 +1,392 @@
+"""
+Jornadas de usuário concorrentes com asyncio
+Executa vários fluxos de compra no mesmo processo, cada um com o próprio
+navegador, sobre os page objects síncronos existentes
+"""
+
+import argparse
+import asyncio
+import functools
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from config.test_config import TestConfig
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from utils.perfis_navegador import PerfisNavegador
+from utils.fluxo_compra import FluxoCompra
+from utils.test_helpers import MotorEspera
+from utils.webdriver_config import PoolDrivers, WebDriverConfig
+
+
+# Usuários do Sauce Demo (padrão do smoke)
+USUARIOS_SAUCE_DEMO = [
+    "standard_user",
+    "locked_out_user",
+    "problem_user",
+    "performance_glitch_user",
+    "error_user",
+    "visual_user",
+]
+SENHA_SAUCE_DEMO = "secret_sauce"
+# Usuário recusado no login: o smoke valida só a mensagem de bloqueio
+USUARIO_BLOQUEADO = "locked_out_user"
+
+# Usuários cujas falhas propositais (servidor_local/static/app.js) interrompem o fluxo de compra
+FALHAS_ESPERADAS = {
+    "problem_user": "alguns produtos não entram no carrinho",
+    "error_user": "alguns produtos não entram no carrinho e o pedido não é finalizado",
+    "visual_user": "preços da listagem diferentes do catálogo",
+}
+# Usuários que concluem o fluxo de compra
+USUARIOS_FLUXO_COMPLETO = [
+    usuario for usuario in USUARIOS_SAUCE_DEMO
+    if usuario != USUARIO_BLOQUEADO and usuario not in FALHAS_ESPERADAS
+]
+
+
+class PaginaAssincrona:
+    """
+    Proxy assíncrono de um page object
+
+    Cada método do page object vira uma corrotina que executa a chamada
+    síncrona no pool de threads da sessão; atributos que não são métodos
+    (locators, driver) são devolvidos como estão.
+    """
+
+    def __init__(self, pagina, sessao: "SessaoAssincrona"):
+        self._pagina = pagina
+        self._sessao = sessao
+
+    def __getattr__(self, nome):
+        atributo = getattr(self._pagina, nome)
+        if not callable(atributo):
+            return atributo
+
+        @functools.wraps(atributo)
+        async def chamada(*args, **kwargs):
+            return await self._sessao.executar(atributo, *args, **kwargs)
+        return chamada
+
+
+class SessaoAssincrona:
+    """
+    Navegador de uma jornada com os page objects em versão assíncrona
+
+    As chamadas de uma sessão são sempre aguardadas em sequência, então o
+    driver nunca é usado por duas threads ao mesmo tempo.
+    """
+
+    def __init__(self, driver, executor: ThreadPoolExecutor):
+        """
+        Inicializa a sessão
+
+        Args:
+            driver: Instância do WebDriver exclusiva desta sessão
+            executor: Pool de threads onde as chamadas do Selenium são executadas
+        """
+        self.driver = driver
+        self._executor = executor
+        self.login = PaginaAssincrona(LoginPage(driver), self)
+        self.produtos = PaginaAssincrona(ProductsPage(driver), self)
+        self.carrinho = PaginaAssincrona(CartPage(driver), self)
+        self.checkout = PaginaAssincrona(CheckoutPage(driver), self)
+        # Mesmas etapas do TestFluxoCompletoCompra
+        self.fluxo = PaginaAssincrona(FluxoCompra(driver), self)
+        # Duração (s) de cada etapa concluída e etapa em que a jornada falhou
+        self.tempos_etapas: Dict[str, float] = {}
+        self.etapa_falha: Optional[str] = None
+
+    @contextmanager
+    def etapa(self, nome: str):
+        """
+        Mede uma etapa da jornada (pode envolver vários awaits)
+
+        Args:
+            nome: Nome da etapa (ex.: "login", "checkout")
+        """
+        inicio = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.etapa_falha = nome
+            raise
+        self.tempos_etapas[nome] = time.perf_counter() - inicio
+
+    async def executar(self, funcao: Callable, *args, **kwargs):
+        """
+        Executa uma chamada síncrona (Selenium, MotorEspera...) no pool de threads
+
+        Args:
+            funcao: Função síncrona a executar
+            *args, **kwargs: Argumentos repassados à função
+
+        Returns:
+            Valor retornado pela função
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(funcao, *args, **kwargs))
+
+    async def aguardar_url_conter(self, trecho: str, timeout=None):
+        """Versão assíncrona de MotorEspera.aguardar_url_conter"""
+        return await self.executar(MotorEspera.aguardar_url_conter, self.driver, trecho, timeout=timeout)
+
+
+@dataclass
+class ResultadoJornada:
+    """Resultado de uma jornada executada pelo ExecutorJornadas"""
+
+    nome: str
+    sucesso: bool
+    duracao: float
+    valor: Any = None
+    erro: Optional[str] = None
+    etapas: Dict[str, float] = field(default_factory=dict)
+    etapa_falha: Optional[str] = None
+    # Motivo, quando a falha é esperada para o usuário (FALHAS_ESPERADAS)
+    falha_esperada: Optional[str] = None
+
+
+def marcar_falha_esperada(resultado: ResultadoJornada, usuario: str) -> ResultadoJornada:
+    """Registra no resultado se a falha da jornada era esperada para o usuário"""
+    if not resultado.sucesso:
+        resultado.falha_esperada = FALHAS_ESPERADAS.get(usuario)
+    return resultado
+
+
+class ExecutorJornadas:
+    """
+    Executa jornadas assíncronas com limite de navegadores simultâneos
+
+    O semáforo limita quantas jornadas têm um navegador aberto; o pool de
+    threads (do mesmo tamanho) executa as chamadas bloqueantes do Selenium.
+    Os navegadores vêm de um PoolDrivers próprio e são reaproveitados
+    entre jornadas, com o estado limpo a cada devolução.
+
+    Uso:
+        async with ExecutorJornadas(concorrencia=8) as executor:
+            resultados = await executor.executar_lote(
+                [(f"compra_{u}", jornada_compra_completa, u) for u in USUARIOS_FLUXO_COMPLETO]
+            )
+    """
+
+    def __init__(self, concorrencia: int = None, perfil: str = None):
+        """
+        Inicializa o executor
+
+        Args:
+            concorrencia: Navegadores abertos ao mesmo tempo (usa TestConfig.CONCORRENCIA_JORNADAS se não especificado)
+            perfil: Nome do perfil de navegador (usa o perfil da execução se não especificado)
+        """
+        self.concorrencia = max(1, concorrencia or TestConfig.CONCORRENCIA_JORNADAS)
+        self.perfil = PerfisNavegador.obter(perfil).nome
+        self._executor = ThreadPoolExecutor(max_workers=self.concorrencia, thread_name_prefix="jornada")
+        self._pool = PoolDrivers(lambda nome: WebDriverConfig().obter_driver(nome), tamanho_maximo=self.concorrencia)
+        self._semaforo: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *excecao):
+        await asyncio.get_running_loop().run_in_executor(None, self.encerrar)
+
+    async def executar_jornada(self, nome: str, jornada: Callable[..., Awaitable], *args, **kwargs) -> ResultadoJornada:
+        """
+        Executa uma jornada em uma sessão própria, respeitando o limite de concorrência
+
+        Args:
+            nome: Identificação da jornada no resultado
+            jornada: Corrotina que recebe a SessaoAssincrona como primeiro argumento
+            *args, **kwargs: Argumentos repassados à jornada
+
+        Returns:
+            ResultadoJornada: Sucesso, duração e valor retornado (ou erro) da jornada
+        """
+        if self._semaforo is None:
+            # Criado dentro do loop em execução
+            self._semaforo = asyncio.Semaphore(self.concorrencia)
+
+        loop = asyncio.get_running_loop()
+        async with self._semaforo:
+            inicio = time.perf_counter()
+            driver = None
+            sessao = None
+            try:
+                driver = await loop.run_in_executor(self._executor, self._pool.adquirir, self.perfil)
+                sessao = SessaoAssincrona(driver, self._executor)
+                sessao.tempos_etapas["navegador"] = time.perf_counter() - inicio
+                valor = await jornada(sessao, *args, **kwargs)
+                return ResultadoJornada(
+                    nome, True, time.perf_counter() - inicio, valor=valor, etapas=sessao.tempos_etapas
+                )
+            except Exception as e:
+                return ResultadoJornada(
+                    nome, False, time.perf_counter() - inicio,
+                    erro=f"{type(e).__name__}: {e}",
+                    etapas=sessao.tempos_etapas if sessao else {},
+                    etapa_falha=sessao.etapa_falha if sessao else "navegador",
+                )
+            finally:
+                if driver is not None:
+                    await loop.run_in_executor(self._executor, self._pool.devolver, driver)
+
+    async def executar_lote(self, jornadas: List[tuple]) -> List[ResultadoJornada]:
+        """
+        Executa várias jornadas concorrentemente
+
+        Args:
+            jornadas: Tuplas (nome, jornada, *args)
+
+        Returns:
+            list[ResultadoJornada]: Resultados na mesma ordem das jornadas
+        """
+        return await asyncio.gather(*(self.executar_jornada(nome, jornada, *args) for nome, jornada, *args in jornadas))
+
+    def encerrar(self):
+        """Fecha os navegadores do executor e encerra o pool de threads"""
+        self._pool.encerrar()
+        self._executor.shutdown(wait=True)
+
+
+async def jornada_compra_completa(sessao: SessaoAssincrona, usuario: str, senha: str = SENHA_SAUCE_DEMO,
+                                  quantidade_produtos: int = None) -> dict:
+    """
+    Fluxo completo de compra com as etapas de FluxoCompra (as mesmas do TestFluxoCompletoCompra)
+
+    Args:
+        sessao: Sessão da jornada
+        usuario: Nome do usuário
+        senha: Senha do usuário
+        quantidade_produtos: Produtos adicionados ao carrinho (usa TestConfig.QUANTIDADE_PRODUTOS_PADRAO se não especificado)
+
+    Returns:
+        dict: Produtos comprados e valores do checkout
+
+    Raises:
+        AssertionError: Se alguma etapa do fluxo falhar
+    """
+    with sessao.etapa("login"):
+        await sessao.fluxo.fazer_login(usuario, senha)
+
+    with sessao.etapa("produtos"):
+        _, produtos = await sessao.fluxo.selecionar_e_adicionar_produtos(quantidade_produtos)
+
+    with sessao.etapa("carrinho"):
+        await sessao.fluxo.verificar_carrinho()
+
+    with sessao.etapa("checkout"):
+        subtotal, _, total_final = await sessao.fluxo.executar_checkout()
+
+    with sessao.etapa("finalizacao"):
+        await sessao.fluxo.finalizar_compra()
+
+    return {
+        "usuario": usuario,
+        "produtos": [produto["nome"] for produto in produtos],
+        "subtotal": subtotal,
+        "total": total_final,
+    }
+
+
+async def jornada_login_bloqueado(sessao: SessaoAssincrona, usuario: str, senha: str = SENHA_SAUCE_DEMO) -> dict:
+    """
+    Login de um usuário bloqueado: conclui quando a mensagem de bloqueio é exibida
+
+    Args:
+        sessao: Sessão da jornada
+        usuario: Nome do usuário
+        senha: Senha do usuário
+
+    Returns:
+        dict: Usuário e mensagem de erro exibida
+
+    Raises:
+        AssertionError: Se o login não for recusado
+    """
+    with sessao.etapa("login"):
+        mensagem = await sessao.fluxo.verificar_login_bloqueado(usuario, senha)
+    return {"usuario": usuario, "mensagem": mensagem}
+
+
+def jornada_do_usuario(usuario: str) -> Callable[..., Awaitable]:
+    """
+    Escolhe a jornada do smoke para o usuário
+
+    Args:
+        usuario: Nome do usuário
+
+    Returns:
+        Corrotina da jornada: só o login para o usuário bloqueado, o fluxo de compra para os demais
+    """
+    return jornada_login_bloqueado if usuario == USUARIO_BLOQUEADO else jornada_compra_completa
+
+
+async def executar_smoke(usuarios: List[str], repeticoes: int = 1, concorrencia: int = None) -> List[ResultadoJornada]:
+    """
+    Executa a jornada de cada usuário (jornada_do_usuario), concorrentemente
+
+    Args:
+        usuarios: Usuários do Sauce Demo
+        repeticoes: Fluxos por usuário
+        concorrencia: Navegadores abertos ao mesmo tempo
+
+    Returns:
+        list[ResultadoJornada]: Resultado de cada fluxo (falhas de FALHAS_ESPERADAS marcadas)
+    """
+    jornadas = [
+        (f"{usuario}#{repeticao + 1}", jornada_do_usuario(usuario), usuario)
+        for repeticao in range(repeticoes)
+        for usuario in usuarios
+    ]
+    async with ExecutorJornadas(concorrencia) as executor:
+        resultados = await executor.executar_lote(jornadas)
+    return [marcar_falha_esperada(resultado, usuario) for (_, _, usuario), resultado in zip(jornadas, resultados)]
+
+
+def main():
+    """Smoke concorrente com todos os usuários do Sauce Demo: python -m utils.jornadas_assincronas"""
+    # Import local: o servidor só é necessário quando o módulo roda como script
+    from servidor_local.servidor import garantir_servidor_local
+
+    parser = argparse.ArgumentParser(description="Fluxos de compra concorrentes no Sauce Demo")
+    parser.add_argument("--usuarios", nargs="+", default=USUARIOS_SAUCE_DEMO,
+                        help=f"Usuários do Sauce Demo (padrão: {', '.join(USUARIOS_SAUCE_DEMO)})")
+    parser.add_argument("--repeticoes", type=int, default=1, help="Fluxos por usuário")
+    parser.add_argument("--concorrencia", type=int, default=TestConfig.CONCORRENCIA_JORNADAS)
+    args = parser.parse_args()
+
+    servidor = garantir_servidor_local()
+    try:
+        inicio = time.perf_counter()
+        resultados = asyncio.run(executar_smoke(args.usuarios, args.repeticoes, args.concorrencia))
+        duracao_total = time.perf_counter() - inicio
+    finally:
+        if servidor:
+            servidor.parar()
+
+    for resultado in resultados:
+        if resultado.sucesso:
+            detalhe = resultado.valor.get("produtos", resultado.valor.get("mensagem"))
+            print(f"✅ {resultado.nome}: {resultado.duracao:.2f}s - {detalhe}")
+        elif resultado.falha_esperada:
+            print(f"⚠️  {resultado.nome}: {resultado.duracao:.2f}s - falha esperada ({resultado.falha_esperada}) "
+                  f"na etapa {resultado.etapa_falha}")
+        else:
+            print(f"❌ {resultado.nome}: {resultado.duracao:.2f}s - {resultado.erro}")
+
+    concluidos = sum(1 for resultado in resultados if resultado.sucesso)
+    esperadas = sum(1 for resultado in resultados if resultado.falha_esperada)
+    falhas = len(resultados) - concluidos - esperadas
+    print(f"📊 {concluidos}/{len(resultados)} fluxos concluídos em {duracao_total:.2f}s "
+          f"(concorrência {args.concorrencia}, {esperadas} falhas esperadas)")
+    sys.exit(1 if falhas else 0)
+
+
+if __name__ == "__main__":
+    main()
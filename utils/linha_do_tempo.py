@@ -0,0 +1,296 @@
+"""
+Linha do tempo da execução no formato Chrome trace (chrome://tracing, Perfetto)
+Registra testes, ações dos page objects, comandos WebDriver, esperas, sleeps
+e a inicialização do navegador como spans aninhados, um processo por worker
+"""
+
+import argparse
+import functools
+import glob
+import inspect
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, List
+
+from selenium.webdriver.chrome.webdriver import WebDriver as ChromeWebDriver
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.wait import WebDriverWait
+
+from config.test_config import TestConfig
+from utils.rastreamento_comandos import RastreadorComandos
+
+
+class LinhaDoTempo:
+    """
+    Spans da execução no formato Chrome trace (desligado por padrão)
+
+    Com SAUCE_LINHA_DO_TEMPO=1, ativar() envolve WebDriver.execute,
+    WebDriverWait.until/until_not, time.sleep, a criação do Chrome e os
+    métodos públicos das páginas. Os testes são marcados com
+    iniciar_teste/finalizar_teste (conftest.py e features/environment.py).
+
+    Cada worker grava TestConfig.LINHA_DO_TEMPO_FILE com pid próprio (uma
+    trilha por worker) e mesclar() junta os arquivos dos workers. Os instantes
+    usam o relógio do sistema, comum a todos os processos da máquina.
+    """
+
+    _eventos: List[dict] = []
+    _lock = threading.Lock()
+    _local = threading.local()
+    _originais: Dict[tuple, object] = {}
+    _threads: Dict[int, int] = {}
+
+    # Referência de tempo: epoch (µs) correspondente a _inicio_perf
+    _inicio_epoch_us = time.time() * 1_000_000
+    _inicio_perf = time.perf_counter()
+
+    @classmethod
+    def ativa(cls) -> bool:
+        return bool(cls._originais)
+
+    @classmethod
+    def ativar(cls, classes_paginas=None):
+        """
+        Passa a registrar os spans (chamadas repetidas não têm efeito)
+
+        Args:
+            classes_paginas: Classes cujas ações viram spans (padrão: as quatro páginas do Sauce Demo)
+        """
+        if cls.ativa():
+            return
+        if classes_paginas is None:
+            # Import local: evita ciclo com os page objects, que importam utils
+            from pages.cart_page import CartPage
+            from pages.checkout_page import CheckoutPage
+            from pages.login_page import LoginPage
+            from pages.products_page import ProductsPage
+            classes_paginas = [LoginPage, ProductsPage, CartPage, CheckoutPage]
+
+        cls._substituir(WebDriver, "execute", cls._envolver_comando)
+        cls._substituir(WebDriverWait, "until", functools.partial(cls._envolver_espera, "until"))
+        cls._substituir(WebDriverWait, "until_not", functools.partial(cls._envolver_espera, "until_not"))
+        cls._substituir(ChromeWebDriver, "__init__", cls._envolver_navegador)
+        cls._substituir(time, "sleep", cls._envolver_sleep)
+        for classe in classes_paginas:
+            for nome, metodo in list(vars(classe).items()):
+                if not nome.startswith("_") and inspect.isfunction(metodo):
+                    cls._substituir(classe, nome, functools.partial(cls._envolver_acao, f"{classe.__name__}.{nome}"))
+
+    @classmethod
+    def desativar(cls):
+        """Restaura os métodos originais (os eventos são mantidos)"""
+        for (alvo, nome), original in cls._originais.items():
+            setattr(alvo, nome, original)
+        cls._originais = {}
+
+    @classmethod
+    def _substituir(cls, alvo, nome, fabrica):
+        original = vars(alvo)[nome]
+        cls._originais[(alvo, nome)] = original
+        setattr(alvo, nome, functools.wraps(original)(fabrica(original)))
+
+    # ------------------------------------------------------------ eventos
+
+    @classmethod
+    def _agora_us(cls) -> float:
+        return cls._inicio_epoch_us + (time.perf_counter() - cls._inicio_perf) * 1_000_000
+
+    @classmethod
+    def registrar(cls, nome: str, categoria: str, inicio_us: float, fim_us: float, **args):
+        """Adiciona um span completo (ph "X") da thread atual"""
+        evento = {
+            "name": nome,
+            "cat": categoria,
+            "ph": "X",
+            "ts": round(inicio_us, 1),
+            "dur": round(fim_us - inicio_us, 1),
+            "pid": cls._pid(),
+            "tid": cls._tid(),
+        }
+        if args:
+            evento["args"] = args
+        with cls._lock:
+            cls._eventos.append(evento)
+
+    @staticmethod
+    def _pid() -> int:
+        """Trilha do worker: gw3 -> 4, bdd1 -> 2; execução serial -> 0"""
+        numero = re.search(r"\d+$", TestConfig.WORKER_ID or "")
+        return int(numero.group()) + 1 if numero else 0
+
+    @classmethod
+    def _tid(cls) -> int:
+        ident = threading.get_ident()
+        tid = cls._threads.get(ident)
+        if tid is None:
+            with cls._lock:
+                tid = cls._threads.setdefault(ident, len(cls._threads) + 1)
+        return tid
+
+    # ------------------------------------------------------------ por teste
+
+    @classmethod
+    def iniciar_teste(cls, nome_teste: str):
+        """Marca o início do span do teste na thread atual"""
+        cls._local.teste = (nome_teste, cls._agora_us())
+
+    @classmethod
+    def finalizar_teste(cls, status: str = None):
+        """Fecha o span do teste iniciado em iniciar_teste"""
+        teste = getattr(cls._local, "teste", None)
+        if teste is None:
+            return
+        cls._local.teste = None
+        nome_teste, inicio = teste
+        cls.registrar(nome_teste, "teste", inicio, cls._agora_us(), status=status)
+
+    # ------------------------------------------------------------ envoltórios
+
+    @classmethod
+    def _envolver_acao(cls, acao, original):
+        def medido(*args, **kwargs):
+            inicio = cls._agora_us()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                cls.registrar(acao, "acao", inicio, cls._agora_us())
+        return medido
+
+    @classmethod
+    def _envolver_comando(cls, original):
+        def medido(self, driver_command, params=None):
+            inicio = cls._agora_us()
+            try:
+                return original(self, driver_command, params)
+            finally:
+                alvo = RastreadorComandos._descrever_alvo(driver_command, params)
+                cls.registrar(driver_command, "comando", inicio, cls._agora_us(), **({"alvo": alvo} if alvo else {}))
+        return medido
+
+    @classmethod
+    def _envolver_espera(cls, metodo, original):
+        def medido(self, method, message=""):
+            # Os sleeps de polling da espera fazem parte dela e não viram spans próprios
+            cls._local.em_espera = getattr(cls._local, "em_espera", 0) + 1
+            inicio = cls._agora_us()
+            sucesso = False
+            try:
+                resultado = original(self, method, message)
+                sucesso = True
+                return resultado
+            finally:
+                cls._local.em_espera -= 1
+                # "presence_of_element_located.<locals>._predicate" -> "presence_of_element_located"
+                condicao = getattr(method, "__qualname__", type(method).__name__).split(".<locals>")[0]
+                cls.registrar(f"{metodo}: {condicao}", "espera", inicio, cls._agora_us(), sucesso=sucesso)
+        return medido
+
+    @classmethod
+    def _envolver_sleep(cls, original):
+        def medido(segundos):
+            if getattr(cls._local, "em_espera", 0):
+                return original(segundos)
+            inicio = cls._agora_us()
+            try:
+                return original(segundos)
+            finally:
+                cls.registrar(f"sleep({segundos}s)", "sleep", inicio, cls._agora_us())
+        return medido
+
+    @classmethod
+    def _envolver_navegador(cls, original):
+        def medido(self, *args, **kwargs):
+            inicio = cls._agora_us()
+            try:
+                return original(self, *args, **kwargs)
+            finally:
+                cls.registrar("Inicialização do Chrome", "navegador", inicio, cls._agora_us())
+        return medido
+
+    # --------------------------------------------------------------- arquivo
+
+    @classmethod
+    def _metadados(cls) -> List[dict]:
+        """Nomes da trilha do worker e das threads"""
+        pid = cls._pid()
+        metadados = [{
+            "name": "process_name", "ph": "M", "pid": pid,
+            "args": {"name": f"worker {TestConfig.WORKER_ID}" if TestConfig.WORKER_ID else "execução serial"},
+        }]
+        for tid in sorted(cls._threads.values()):
+            metadados.append({
+                "name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                "args": {"name": "principal" if tid == 1 else f"thread {tid}"},
+            })
+        return metadados
+
+    @classmethod
+    def gravar(cls, caminho: str = None):
+        """
+        Grava a linha do tempo (nada é gravado se não houver eventos)
+
+        Args:
+            caminho: Arquivo de saída (usa TestConfig.LINHA_DO_TEMPO_FILE se não especificado)
+
+        Returns:
+            str | None: Caminho gravado
+        """
+        with cls._lock:
+            eventos = list(cls._eventos)
+        if not eventos:
+            return None
+        caminho = caminho or TestConfig.LINHA_DO_TEMPO_FILE
+        os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+        with open(caminho, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": cls._metadados() + eventos, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+        print(f"🕒 Linha do tempo gravada em: {caminho} (abrir em chrome://tracing ou ui.perfetto.dev)")
+        return caminho
+
+
+def mesclar(arquivos: List[str] = None, saida: str = None, desde: float = 0):
+    """
+    Junta as linhas do tempo dos workers em um único arquivo (uma trilha por worker)
+
+    Args:
+        arquivos: Arquivos a juntar (padrão: reports/linha_do_tempo_*.json)
+        saida: Arquivo de saída (padrão: reports/linha_do_tempo_mesclada.json)
+        desde: Ignora arquivos modificados antes deste instante (epoch), ex.: de execuções anteriores
+
+    Returns:
+        str | None: Caminho gravado (None se não houver arquivos)
+    """
+    saida = saida or os.path.join(TestConfig.REPORTS_DIR, "linha_do_tempo_mesclada.json")
+    if not arquivos:
+        arquivos = sorted(glob.glob(os.path.join(TestConfig.REPORTS_DIR, "linha_do_tempo_*.json")))
+    arquivos = [
+        arquivo for arquivo in arquivos
+        if os.path.abspath(arquivo) != os.path.abspath(saida) and os.path.getmtime(arquivo) >= desde
+    ]
+    if not arquivos:
+        return None
+
+    eventos = []
+    for arquivo in arquivos:
+        with open(arquivo, 'r', encoding='utf-8') as f:
+            eventos.extend(json.load(f).get("traceEvents", []))
+    with open(saida, 'w', encoding='utf-8') as f:
+        json.dump({"traceEvents": eventos, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+    print(f"🕒 Linhas do tempo de {len(arquivos)} workers mescladas em: {saida}")
+    return saida
+
+
+def main():
+    """Junta as linhas do tempo dos workers: python -m utils.linha_do_tempo [arquivos...]"""
+    parser = argparse.ArgumentParser(description="Junta as linhas do tempo (Chrome trace) dos workers")
+    parser.add_argument("arquivos", nargs="*", help="Arquivos a juntar (padrão: reports/linha_do_tempo_*.json)")
+    parser.add_argument("--saida", help="Arquivo de saída")
+    args = parser.parse_args()
+    if not mesclar(args.arquivos, args.saida):
+        print("⚠️ Nenhuma linha do tempo de worker encontrada")
+
+
+if __name__ == "__main__":
+    main()
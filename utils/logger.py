@@ -2,14 +2,75 @@
 Sistema de logging estruturado para testes de automação
 """
 
+import argparse
+import atexit
+import glob
+import heapq
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from config.test_config import TestConfig
 
+# Atributos padrão do LogRecord (o que sobra vem de extra=)
+_ATRIBUTOS_PADRAO = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class FormatadorJson(logging.Formatter):
+    """Formata cada registro como uma linha JSON"""
+
+    def format(self, record):
+        evento = {
+            "timestamp": record.created,
+            "data_hora": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "nivel": record.levelname,
+            "logger": record.name,
+            "mensagem": record.getMessage(),
+        }
+        for chave, valor in vars(record).items():
+            if chave not in _ATRIBUTOS_PADRAO and valor is not None:
+                evento[chave] = valor
+        if record.exc_info:
+            evento["excecao"] = self.formatException(record.exc_info)
+        return json.dumps(evento, ensure_ascii=False, default=str)
+
+
+class FiltroContextoTeste(logging.Filter):
+    """
+    Adiciona teste e worker ao registro na thread que fez o log
+
+    O teste vem de TestLogger.definir_teste (Behave) ou de PYTEST_CURRENT_TEST.
+    """
+
+    def filter(self, record):
+        if getattr(record, "teste", None) is None:
+            teste = TestLogger.teste_atual or os.getenv("PYTEST_CURRENT_TEST", "").rsplit(" ", 1)[0]
+            record.teste = teste or None
+        record.worker = TestConfig.WORKER_ID or None
+        return True
+
 
 class TestLogger:
-    """Sistema de logging para testes"""
+    """
+    Sistema de logging para testes
+    
+    Com SAUCE_FORMATO_LOGS=json, todos os loggers enviam os registros a uma
+    fila (QueueHandler) e uma única thread do processo (QueueListener) grava
+    as linhas JSON em TestConfig.LOG_JSON_FILE e a versão em texto no console,
+    fora da thread do teste. Cada linha traz teste, worker, etapa e duração.
+    """
+    
+    # Teste em execução definido explicitamente (cenário do Behave)
+    teste_atual = None
+    
+    _fila_json = None
+    _listener_json = None
+    _lock = threading.Lock()
     
     def __init__(self, nome_teste):
         """
@@ -19,12 +80,18 @@ class TestLogger:
             nome_teste: Nome do teste para identificar os logs
         """
         self.nome_teste = nome_teste
+        self.etapa_atual = None
         self.logger = logging.getLogger(nome_teste)
         self.logger.setLevel(logging.INFO)
         
         # Evitar duplicação de handlers
         if not self.logger.handlers:
-            self._configurar_handlers()
+            if TestConfig.FORMATO_LOGS == "json":
+                self.logger.addHandler(self._obter_handler_json())
+                # Os handlers ficam no listener; o logger raiz não recebe os registros
+                self.logger.propagate = False
+            else:
+                self._configurar_handlers()
     
     def _configurar_handlers(self):
         """Configura os handlers para console e arquivo"""
@@ -52,34 +119,161 @@ class TestLogger:
         self.logger.addHandler(file_handler)
         self.logger.addHandler(console_handler)
     
+    @classmethod
+    def _obter_handler_json(cls):
+        """QueueHandler compartilhado pelos loggers do processo (inicia o listener no primeiro uso)"""
+        with cls._lock:
+            if cls._fila_json is None:
+                os.makedirs(os.path.dirname(TestConfig.LOG_JSON_FILE) or ".", exist_ok=True)
+                # Modo 'w': o arquivo do worker guarda só a execução atual
+                arquivo = logging.FileHandler(TestConfig.LOG_JSON_FILE, mode='w', encoding='utf-8')
+                arquivo.setFormatter(FormatadorJson())
+                console = logging.StreamHandler()
+                console.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+                
+                cls._fila_json = queue.Queue(-1)
+                cls._listener_json = logging.handlers.QueueListener(cls._fila_json, arquivo, console)
+                cls._listener_json.start()
+                atexit.register(cls.encerrar)
+            handler = logging.handlers.QueueHandler(cls._fila_json)
+            handler.addFilter(FiltroContextoTeste())
+            return handler
+    
+    @classmethod
+    def encerrar(cls):
+        """Grava os registros pendentes e encerra a thread de logging (modo JSON)"""
+        with cls._lock:
+            listener, cls._listener_json = cls._listener_json, None
+            cls._fila_json = None
+        if listener:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+    
+    @classmethod
+    def definir_teste(cls, nome_teste):
+        """Define o teste associado aos próximos registros (None para voltar ao PYTEST_CURRENT_TEST)"""
+        cls.teste_atual = nome_teste
+    
+    def _log(self, nivel, emoji, mensagem, tipo, **campos):
+        if TestConfig.FORMATO_LOGS == "json":
+            campos.setdefault("etapa", self.etapa_atual)
+            self.logger.log(nivel, mensagem, extra=dict(campos, tipo=tipo))
+        else:
+            self.logger.log(nivel, f"{emoji} {mensagem}")
+    
     def info(self, mensagem):
         """Log de informação"""
-        self.logger.info(f"ℹ️  {mensagem}")
+        self._log(logging.INFO, "ℹ️ ", mensagem, "info")
     
     def error(self, mensagem):
         """Log de erro"""
-        self.logger.error(f"❌ {mensagem}")
+        self._log(logging.ERROR, "❌", mensagem, "erro")
     
     def warning(self, mensagem):
         """Log de aviso"""
-        self.logger.warning(f"⚠️  {mensagem}")
+        self._log(logging.WARNING, "⚠️ ", mensagem, "aviso")
     
     def success(self, mensagem):
         """Log de sucesso"""
-        self.logger.info(f"✅ {mensagem}")
+        self._log(logging.INFO, "✅", mensagem, "sucesso")
     
     def screenshot(self, descricao):
         """Log de screenshot"""
-        self.logger.info(f"📸 Screenshot: {descricao}")
+        self._log(logging.INFO, "📸", f"Screenshot: {descricao}", "screenshot")
     
     def step(self, descricao):
         """Log de etapa do teste"""
-        self.logger.info(f"🔄 Etapa: {descricao}")
+        self.etapa_atual = descricao
+        self._log(logging.INFO, "🔄", f"Etapa: {descricao}", "etapa", etapa=descricao)
+    
+    @contextmanager
+    def etapa(self, descricao):
+        """
+        Registra início e fim de uma etapa, com a duração
+        
+        Exemplo:
+            with logger.etapa("Login"):
+                login_page.fazer_login(usuario, senha)
+        """
+        etapa_anterior = self.etapa_atual
+        self.step(descricao)
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            duracao = time.perf_counter() - inicio
+            self._log(logging.INFO, "⏱️ ", f"Etapa concluída: {descricao} ({duracao:.2f}s)", "fim_etapa",
+                      etapa=descricao, duracao_s=round(duracao, 3))
+            self.etapa_atual = etapa_anterior
     
     def data(self, titulo, dados):
         """Log de dados estruturados"""
-        self.logger.info(f"📊 {titulo}: {dados}")
+        if TestConfig.FORMATO_LOGS == "json":
+            self._log(logging.INFO, "📊", titulo, "dados", dados=dados)
+        else:
+            self._log(logging.INFO, "📊", f"{titulo}: {dados}", "dados")
     
     def performance(self, operacao, tempo):
         """Log de performance"""
-        self.logger.info(f"⏱️  {operacao}: {tempo:.2f}s")
+        self._log(logging.INFO, "⏱️ ", f"{operacao}: {tempo:.2f}s", "performance",
+                  operacao=operacao, duracao_s=round(tempo, 3))
+
+
+def mesclar_logs(arquivos=None, saida=None, desde=0):
+    """
+    Intercala os logs JSON dos workers pelo timestamp
+    
+    Args:
+        arquivos: Arquivos JSON-lines (padrão: logs/**/<nome de TestConfig.LOG_JSON_FILE>)
+        saida: Arquivo mesclado (padrão: logs/<nome>_mesclado.jsonl)
+        desde: Ignora arquivos modificados antes deste instante (epoch), ex.: de workers de execuções anteriores
+    
+    Returns:
+        tuple: (caminho da saída, quantidade de linhas)
+    """
+    nome = os.path.basename(TestConfig.LOG_JSON_FILE)
+    if not arquivos:
+        arquivos = sorted(glob.glob(os.path.join("logs", "**", nome), recursive=True))
+    saida = saida or os.path.join("logs", nome.replace(".jsonl", "_mesclado.jsonl"))
+    arquivos = [
+        caminho for caminho in arquivos
+        if os.path.abspath(caminho) != os.path.abspath(saida) and os.path.getmtime(caminho) >= desde
+    ]
+    
+    def ler(caminho):
+        with open(caminho, 'r', encoding='utf-8') as f:
+            for linha in f:
+                linha = linha.strip()
+                if not linha:
+                    continue
+                try:
+                    yield json.loads(linha)
+                except ValueError:
+                    # Linha incompleta (processo interrompido durante a escrita)
+                    continue
+    
+    total = 0
+    os.makedirs(os.path.dirname(saida) or ".", exist_ok=True)
+    with open(saida, 'w', encoding='utf-8') as f:
+        # Cada arquivo já está em ordem: heapq.merge intercala sem carregar tudo em memória
+        for evento in heapq.merge(*(ler(caminho) for caminho in arquivos),
+                                  key=lambda evento: evento.get("timestamp", 0)):
+            f.write(json.dumps(evento, ensure_ascii=False) + "\n")
+            total += 1
+    return saida, total
+
+
+def main():
+    """Mescla os logs JSON dos workers: python -m utils.logger [arquivos...] [--saida arquivo]"""
+    parser = argparse.ArgumentParser(description="Intercala os logs JSON-lines dos workers pelo timestamp")
+    parser.add_argument("arquivos", nargs="*", help="Arquivos de log (padrão: todos os logs JSON em logs/)")
+    parser.add_argument("--saida", help="Arquivo mesclado")
+    args = parser.parse_args()
+    
+    saida, total = mesclar_logs(args.arquivos, args.saida)
+    print(f"📄 {total} registros mesclados em: {saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,416 @@
+"""
+Métricas de desempenho do navegador por página visitada
+Coleta Navigation/Paint Timing, recursos carregados e heap JS (CDP
+Performance.getMetrics) a cada navegação e compara com um baseline salvo
+"""
+
+import argparse
+import glob
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+from config.test_config import TestConfig
+from utils.test_helpers import MotorEspera
+
+# Timings do documento atual e recursos carregados desde a última coleta.
+# performance.timeOrigin muda a cada documento novo; se não mudou, a navegação
+# foi feita pelo próprio app (SPA) e só os recursos novos e o heap são medidos.
+SCRIPT_METRICAS_NAVEGACAO = """
+    var indiceRecursos = arguments[0], origemAnterior = arguments[1];
+    var novoDocumento = performance.timeOrigin !== origemAnterior;
+    var recursos = performance.getEntriesByType('resource');
+    var novos = recursos.slice(novoDocumento ? 0 : indiceRecursos);
+    var metricas = {
+        origem: performance.timeOrigin,
+        total_recursos: recursos.length,
+        pagina: location.pathname.replace(/^\\//, '') || 'index.html',
+        novo_documento: novoDocumento,
+        recursos: novos.length,
+        recursos_bytes: novos.reduce(function (soma, r) { return soma + (r.transferSize || 0); }, 0)
+    };
+    if (novoDocumento) {
+        var nav = performance.getEntriesByType('navigation')[0];
+        if (nav) {
+            metricas.ttfb_ms = nav.responseStart - nav.requestStart;
+            metricas.dom_interativo_ms = nav.domInteractive;
+            metricas.dom_content_loaded_ms = nav.domContentLoadedEventEnd;
+            metricas.load_ms = nav.loadEventEnd;
+            metricas.documento_bytes = nav.transferSize || 0;
+        }
+        performance.getEntriesByType('paint').forEach(function (p) {
+            metricas[p.name.replace(/-/g, '_') + '_ms'] = p.startTime;
+        });
+    }
+    return metricas;
+"""
+
+# Métricas do CDP Performance.getMetrics guardadas em cada amostra
+METRICAS_CDP = {
+    "JSHeapUsedSize": "js_heap_usado_bytes",
+    "JSHeapTotalSize": "js_heap_total_bytes",
+    "Nodes": "nos_dom",
+}
+
+# Diferença absoluta abaixo da qual uma piora é tratada como ruído, por sufixo da métrica
+RUIDO_MINIMO = {
+    "_ms": 50.0,
+    "_bytes": 20 * 1024,
+    "recursos": 2,
+    "nos_dom": 50,
+}
+
+
+class MetricasNavegador:
+    """
+    Coleta de métricas do navegador por teste e por página (desligada por padrão)
+
+    Com SAUCE_METRICAS_NAVEGADOR=1, WebDriverConfig instala a coleta em
+    driver.get e as páginas a chamam após as navegações por clique
+    (carrinho e etapas do checkout).
+    """
+
+    _amostras: List[dict] = []
+    _lock = threading.Lock()
+    _teste_atual: Optional[str] = None
+
+    # ------------------------------------------------------------- coleta
+
+    @classmethod
+    def instalar(cls, driver):
+        """
+        Coleta as métricas após cada driver.get do driver
+
+        Args:
+            driver: Instância do WebDriver
+        """
+        if getattr(driver, "metricas_navegador", None) is not None:
+            return
+        driver.metricas_navegador = {"origem": None, "indice_recursos": 0, "cdp": None}
+
+        def get_com_metricas(url):
+            type(driver).get(driver, url)
+            cls.coletar(driver)
+
+        driver.get = get_com_metricas
+
+    @classmethod
+    def coletar_apos_navegacao(cls, driver, trecho_url: str, pagina: str = None):
+        """
+        Aguarda a navegação iniciada por um clique e coleta as métricas
+
+        Não faz nada (nem espera) se a coleta não estiver instalada no driver.
+
+        Args:
+            driver: Instância do WebDriver
+            trecho_url: Trecho da URL de destino (ex.: "cart.html")
+            pagina: Nome da página no relatório (usa o caminho da URL se não especificado)
+        """
+        if getattr(driver, "metricas_navegador", None) is None:
+            return
+        chegou = MotorEspera.aguardar(
+            driver,
+            lambda d: trecho_url in d.current_url and d.execute_script("return document.readyState") == "complete",
+            f"métricas: navegação para {trecho_url}",
+            timeout=TestConfig.SHORT_TIMEOUT,
+            lancar_erro=False,
+        )
+        if chegou:
+            cls.coletar(driver, pagina)
+
+    @classmethod
+    def coletar(cls, driver, pagina: str = None) -> Optional[dict]:
+        """
+        Coleta as métricas da página atual
+
+        Args:
+            driver: Instância do WebDriver com a coleta instalada
+            pagina: Nome da página no relatório (usa o caminho da URL se não especificado)
+
+        Returns:
+            dict | None: Amostra registrada (None para about:/data: ou em caso de erro)
+        """
+        estado = getattr(driver, "metricas_navegador", None)
+        if estado is None:
+            return None
+        try:
+            if driver.current_url.startswith(("about:", "data:")):
+                return None
+            metricas = driver.execute_script(
+                SCRIPT_METRICAS_NAVEGACAO, estado["indice_recursos"], estado["origem"]
+            )
+            metricas.update(cls._metricas_cdp(driver, estado))
+        except Exception as e:
+            print(f"⚠️  Falha ao coletar métricas do navegador: {e}")
+            return None
+
+        estado["origem"] = metricas.pop("origem")
+        estado["indice_recursos"] = metricas.pop("total_recursos")
+        pagina_url = metricas.pop("pagina")
+        amostra = {
+            "teste": cls._teste_atual or "(fora de teste)",
+            "pagina": pagina or pagina_url,
+            "timestamp": time.time(),
+            **metricas,
+        }
+        with cls._lock:
+            cls._amostras.append(amostra)
+        return amostra
+
+    @staticmethod
+    def _metricas_cdp(driver, estado) -> dict:
+        """Heap JS e nós do DOM pelo CDP (vazio fora do Chrome)"""
+        if estado["cdp"] is False:
+            return {}
+        try:
+            if estado["cdp"] is None:
+                driver.execute_cdp_cmd("Performance.enable", {})
+                estado["cdp"] = True
+            resposta = driver.execute_cdp_cmd("Performance.getMetrics", {})
+        except Exception:
+            estado["cdp"] = False
+            return {}
+        return {
+            METRICAS_CDP[metrica["name"]]: metrica["value"]
+            for metrica in resposta.get("metrics", [])
+            if metrica["name"] in METRICAS_CDP
+        }
+
+    # ---------------------------------------------------------- por teste
+
+    @classmethod
+    def iniciar_teste(cls, nome_teste: str):
+        """Associa as próximas amostras ao teste"""
+        cls._teste_atual = nome_teste
+
+    @classmethod
+    def finalizar_teste(cls):
+        """Encerra a associação das amostras ao teste atual"""
+        cls._teste_atual = None
+
+    # ---------------------------------------------------------- relatórios
+
+    @staticmethod
+    def agregar(amostras: List[dict]) -> Dict[str, Dict[str, dict]]:
+        """
+        Mediana de cada métrica por teste e página
+
+        Returns:
+            dict: teste -> página -> {"amostras": n, métrica: mediana}
+        """
+        grupos: Dict[tuple, List[dict]] = {}
+        for amostra in amostras:
+            grupos.setdefault((amostra["teste"], amostra["pagina"]), []).append(amostra)
+
+        agregado: Dict[str, Dict[str, dict]] = {}
+        for (teste, pagina), grupo in sorted(grupos.items()):
+            metricas = {"amostras": len(grupo)}
+            nomes = {
+                chave for amostra in grupo for chave, valor in amostra.items()
+                if isinstance(valor, (int, float)) and not isinstance(valor, bool) and chave != "timestamp"
+            }
+            for nome in sorted(nomes):
+                valores = [amostra[nome] for amostra in grupo if nome in amostra]
+                metricas[nome] = round(statistics.median(valores), 3)
+            agregado.setdefault(teste, {})[pagina] = metricas
+        return agregado
+
+    @staticmethod
+    def comparar(atual: dict, baseline: dict, limite: float = None) -> List[dict]:
+        """
+        Compara as medianas atuais com o baseline
+
+        Uma métrica regride quando piora mais que o limite relativo e mais
+        que o ruído mínimo absoluto (RUIDO_MINIMO).
+
+        Args:
+            atual: Resultado de agregar() da execução atual
+            baseline: Resultado de agregar() salvo como baseline
+            limite: Piora relativa tolerada (usa TestConfig.LIMITE_REGRESSAO_METRICAS se não especificado)
+
+        Returns:
+            list[dict]: Diferenças por teste/página/métrica, com o campo "regressao"
+        """
+        limite = TestConfig.LIMITE_REGRESSAO_METRICAS if limite is None else limite
+        diferencas = []
+        for teste, paginas in atual.items():
+            for pagina, metricas in paginas.items():
+                referencia = baseline.get(teste, {}).get(pagina)
+                if not referencia:
+                    continue
+                for nome, valor in metricas.items():
+                    if nome == "amostras" or not isinstance(referencia.get(nome), (int, float)):
+                        continue
+                    base = referencia[nome]
+                    ruido = next((v for sufixo, v in RUIDO_MINIMO.items() if nome.endswith(sufixo)), 0)
+                    delta = valor - base
+                    diferencas.append({
+                        "teste": teste,
+                        "pagina": pagina,
+                        "metrica": nome,
+                        "baseline": base,
+                        "atual": valor,
+                        "variacao": round(delta / base, 4) if base else None,
+                        "regressao": delta > ruido and delta > abs(base) * limite,
+                    })
+        return diferencas
+
+    @classmethod
+    def gravar_relatorio(cls, caminho: str = None) -> Optional[str]:
+        """
+        Grava as amostras e as medianas da execução e, se houver baseline,
+        o diff (arquivo _diff) com as regressões exibidas no console
+
+        Args:
+            caminho: Arquivo de saída (usa TestConfig.METRICAS_NAVEGADOR_FILE se não especificado)
+
+        Returns:
+            str | None: Caminho gravado (None se nada foi coletado)
+        """
+        with cls._lock:
+            amostras = list(cls._amostras)
+        if not amostras:
+            return None
+
+        caminho = caminho or TestConfig.METRICAS_NAVEGADOR_FILE
+        _gravar(caminho, amostras, worker=TestConfig.WORKER_ID or None)
+        print(f"📈 Métricas do navegador gravadas em: {caminho}")
+        return caminho
+
+
+def _gravar(caminho, amostras, **metadados):
+    """Grava amostras e medianas e, se houver baseline, o diff (arquivo _diff) com as regressões no console"""
+    os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+    agregado = MetricasNavegador.agregar(amostras)
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(dict(metadados, testes=agregado, amostras=amostras), f, indent=2, ensure_ascii=False)
+
+    baseline = ler_baseline()
+    if baseline:
+        diferencas = MetricasNavegador.comparar(agregado, baseline)
+        caminho_diff = f"{os.path.splitext(caminho)[0]}_diff.json"
+        with open(caminho_diff, 'w', encoding='utf-8') as f:
+            json.dump(diferencas, f, indent=2, ensure_ascii=False)
+        mostrar_regressoes(diferencas)
+
+
+def _arquivo_execucao() -> str:
+    """Arquivo com as métricas da execução inteira (serial, ou mesclado dos workers)"""
+    return os.path.join(TestConfig.REPORTS_DIR, "metricas_navegador.json")
+
+
+def mesclar(arquivos: List[str] = None, saida: str = None, desde: float = 0) -> Optional[str]:
+    """
+    Junta as amostras dos workers e recalcula as medianas (e o diff) da execução
+
+    Args:
+        arquivos: Arquivos dos workers (padrão: reports/metricas_navegador_*.json)
+        saida: Arquivo de saída (padrão: reports/metricas_navegador.json)
+        desde: Ignora arquivos modificados antes deste instante (epoch), ex.: de execuções anteriores
+
+    Returns:
+        str | None: Caminho gravado (None se não houver arquivos)
+    """
+    saida = saida or _arquivo_execucao()
+    if not arquivos:
+        arquivos = sorted(glob.glob(os.path.join(TestConfig.REPORTS_DIR, "metricas_navegador_*.json")))
+    arquivos = [
+        arquivo for arquivo in arquivos
+        if not arquivo.endswith("_diff.json")
+        and os.path.abspath(arquivo) != os.path.abspath(saida) and os.path.getmtime(arquivo) >= desde
+    ]
+    if not arquivos:
+        return None
+
+    amostras = []
+    workers = []
+    for arquivo in arquivos:
+        with open(arquivo, 'r', encoding='utf-8') as f:
+            dados = json.load(f)
+        workers.append(dados.get("worker"))
+        amostras.extend(dados.get("amostras", []))
+
+    _gravar(saida, amostras, workers=workers)
+    print(f"📈 Métricas do navegador de {len(arquivos)} workers mescladas em: {saida}")
+    return saida
+
+
+def ler_baseline(caminho: str = None) -> dict:
+    """Lê o baseline de métricas do navegador (vazio se não existir)"""
+    try:
+        with open(caminho or TestConfig.BASELINE_METRICAS_NAVEGADOR_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)["testes"]
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def ler_execucao(desde: float = 0) -> List[dict]:
+    """
+    Lê as amostras da última execução
+
+    Execuções paralelas são lidas do arquivo mesclado pelo controlador
+    (mesclar), que só junta os workers da própria execução.
+
+    Args:
+        desde: Ignora o arquivo se modificado antes deste instante (epoch)
+
+    Returns:
+        list[dict]: Amostras da execução (vazia se não houver)
+    """
+    caminho = _arquivo_execucao()
+    if not os.path.exists(caminho) or os.path.getmtime(caminho) < desde:
+        return []
+    with open(caminho, 'r', encoding='utf-8') as f:
+        return json.load(f).get("amostras", [])
+
+
+def mostrar_regressoes(diferencas: List[dict]):
+    """Exibe as regressões encontradas no diff"""
+    regressoes = [diferenca for diferenca in diferencas if diferenca["regressao"]]
+    if not regressoes:
+        print(f"✅ Métricas do navegador dentro do baseline ({len(diferencas)} comparações)")
+        return
+    print(f"⚠️  {len(regressoes)} métricas do navegador pioraram em relação ao baseline:")
+    for regressao in regressoes:
+        variacao = f"{regressao['variacao']:+.0%}" if regressao["variacao"] is not None else "n/d"
+        print(f"   {regressao['teste']} [{regressao['pagina']}] {regressao['metrica']}: "
+              f"{regressao['baseline']} -> {regressao['atual']} ({variacao})")
+
+
+def main():
+    """Salva ou compara o baseline: python -m utils.metricas_navegador --salvar-baseline | --comparar"""
+    parser = argparse.ArgumentParser(description="Baseline das métricas do navegador")
+    grupo = parser.add_mutually_exclusive_group(required=True)
+    grupo.add_argument("--salvar-baseline", action="store_true", help="Usa a última execução como baseline")
+    grupo.add_argument("--comparar", action="store_true", help="Compara a última execução com o baseline")
+    parser.add_argument("--limite", type=float, default=TestConfig.LIMITE_REGRESSAO_METRICAS)
+    args = parser.parse_args()
+
+    amostras = ler_execucao()
+    if not amostras:
+        raise SystemExit("❌ Nenhuma métrica encontrada em reports/ (execute com SAUCE_METRICAS_NAVEGADOR=1)")
+    agregado = MetricasNavegador.agregar(amostras)
+
+    if args.salvar_baseline:
+        caminho = TestConfig.BASELINE_METRICAS_NAVEGADOR_FILE
+        os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+        with open(caminho, 'w', encoding='utf-8') as f:
+            json.dump({"salvo_em": time.strftime("%Y-%m-%dT%H:%M:%S"), "testes": agregado}, f,
+                      indent=2, ensure_ascii=False)
+        print(f"📄 Baseline salvo em: {caminho}")
+        return
+
+    baseline = ler_baseline()
+    if not baseline:
+        raise SystemExit("❌ Baseline não encontrado (use --salvar-baseline)")
+    diferencas = MetricasNavegador.comparar(agregado, baseline, args.limite)
+    mostrar_regressoes(diferencas)
+    sys.exit(1 if any(diferenca["regressao"] for diferenca in diferencas) else 0)
+
+
+if __name__ == "__main__":
+    main()
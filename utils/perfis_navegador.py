@@ -0,0 +1,264 @@
+"""
+Perfis de navegador para os testes de automação
+Permite alternar entre o navegador visível e perfis headless de baixo consumo
+"""
+
+import json
+import os
+import time
+
+from config.test_config import TestConfig
+
+try:
+    import psutil
+except ImportError:  # psutil é opcional: sem ele a medição de memória usa apenas o heap JS
+    psutil = None
+
+
+class PerfilNavegador:
+    """Conjunto de opções do Chrome aplicadas a um driver"""
+
+    def __init__(self, nome, headless=False, tamanho_janela=None, bloquear_imagens=False,
+                 urls_bloqueadas=(), argumentos_extras=()):
+        """
+        Inicializa o perfil
+
+        Args:
+            nome: Nome do perfil
+            headless: True para executar o Chrome sem janela
+            tamanho_janela: Tupla (largura, altura) ou None para maximizar a janela
+            bloquear_imagens: True para não carregar imagens
+            urls_bloqueadas: Padrões bloqueados via CDP (fontes, CSS...)
+            argumentos_extras: Argumentos adicionais do Chrome
+        """
+        self.nome = nome
+        self.headless = headless
+        self.tamanho_janela = tamanho_janela
+        self.bloquear_imagens = bloquear_imagens
+        self.urls_bloqueadas = urls_bloqueadas
+        self.argumentos_extras = argumentos_extras
+
+
+def _tamanho_janela_config():
+    """Converte TestConfig.BROWSER_WINDOW_SIZE ('--window-size=L,A') em tupla"""
+    valor = TestConfig.BROWSER_WINDOW_SIZE.split("=")[-1]
+    largura, altura = valor.split(",")
+    return int(largura), int(altura)
+
+
+# Argumentos que reduzem consumo de memória e tráfego em segundo plano
+_ARGUMENTOS_BAIXO_CONSUMO = (
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-gpu",
+    "--no-first-run",
+    "--mute-audio",
+    "--metrics-recording-only",
+)
+
+
+class PerfisNavegador:
+    """Perfis de navegador disponíveis e aplicação das opções no Chrome"""
+
+    PERFIS = {
+        # Comportamento original: janela visível e maximizada
+        "padrao": PerfilNavegador(nome="padrao"),
+        # Headless com viewport fixo, sem extensões nem rede em segundo plano
+        "headless": PerfilNavegador(
+            nome="headless",
+            headless=True,
+            tamanho_janela=_tamanho_janela_config(),
+            argumentos_extras=_ARGUMENTOS_BAIXO_CONSUMO,
+        ),
+        # Headless sem imagens, fontes e CSS: maior densidade de navegadores por máquina
+        "leve": PerfilNavegador(
+            nome="leve",
+            headless=True,
+            tamanho_janela=(1280, 800),
+            bloquear_imagens=True,
+            urls_bloqueadas=("*.css", "*.woff", "*.woff2", "*.ttf", "*.otf"),
+            argumentos_extras=_ARGUMENTOS_BAIXO_CONSUMO,
+        ),
+    }
+
+    # Perfil escolhido pelo marker do teste em execução (definido pelo conftest)
+    _perfil_do_teste = None
+
+    @classmethod
+    def definir_perfil_do_teste(cls, nome):
+        """
+        Define o perfil pedido pelo teste atual (marker perfil_navegador)
+
+        Args:
+            nome: Nome do perfil ou None para voltar ao padrão da execução
+        """
+        cls._perfil_do_teste = nome
+
+    @classmethod
+    def obter(cls, nome=None):
+        """
+        Resolve o perfil de navegador a ser usado
+
+        Prioridade: nome explícito > marker do teste > variável de ambiente
+        SAUCE_PERFIL_NAVEGADOR > TestConfig.BROWSER_HEADLESS.
+
+        Args:
+            nome: Nome do perfil (opcional)
+
+        Returns:
+            PerfilNavegador: Perfil resolvido
+        """
+        nome = nome or cls._perfil_do_teste or TestConfig.PERFIL_NAVEGADOR
+        if not nome:
+            nome = "headless" if TestConfig.BROWSER_HEADLESS else "padrao"
+
+        if nome not in cls.PERFIS:
+            raise ValueError(f"Perfil de navegador desconhecido: '{nome}'. Disponíveis: {list(cls.PERFIS)}")
+        return cls.PERFIS[nome]
+
+    @staticmethod
+    def aplicar_opcoes(chrome_options, perfil, prefs):
+        """
+        Aplica as opções do perfil às opções do Chrome
+
+        Args:
+            chrome_options: Instância de selenium.webdriver.chrome.options.Options
+            perfil: PerfilNavegador a aplicar
+            prefs: Dicionário de prefs que será enviado ao Chrome (alterado no local)
+        """
+        if perfil.headless:
+            chrome_options.add_argument("--headless=new")
+        if perfil.tamanho_janela:
+            largura, altura = perfil.tamanho_janela
+            chrome_options.add_argument(f"--window-size={largura},{altura}")
+        for argumento in perfil.argumentos_extras:
+            chrome_options.add_argument(argumento)
+        if perfil.bloquear_imagens:
+            prefs["profile.managed_default_content_settings.images"] = 2
+
+    @staticmethod
+    def aplicar_no_driver(driver, perfil):
+        """
+        Aplica as configurações do perfil que dependem de uma sessão ativa
+
+        Args:
+            driver: Instância do WebDriver
+            perfil: PerfilNavegador a aplicar
+        """
+        if perfil.urls_bloqueadas:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(perfil.urls_bloqueadas)})
+        PerfisNavegador.ajustar_janela(driver, perfil)
+
+    @staticmethod
+    def ajustar_janela(driver, perfil):
+        """
+        Restaura o tamanho de janela definido pelo perfil
+
+        Args:
+            driver: Instância do WebDriver
+            perfil: PerfilNavegador a aplicar
+        """
+        if perfil.tamanho_janela:
+            driver.set_window_size(*perfil.tamanho_janela)
+        else:
+            driver.maximize_window()
+
+    @staticmethod
+    def medir(nome, url=None, repeticoes=3):
+        """
+        Mede tempo de carregamento e memória de um perfil
+
+        Args:
+            nome: Nome do perfil
+            url: URL carregada na medição (usa TestConfig.BASE_URL se não especificada)
+            repeticoes: Quantidade de carregamentos medidos
+
+        Returns:
+            dict: Métricas do perfil (tempos de carregamento e memória)
+        """
+        # Import local para evitar dependência circular com webdriver_config
+        from utils.webdriver_config import WebDriverConfig
+
+        url = url or TestConfig.BASE_URL
+        inicio = time.time()
+        driver = WebDriverConfig().obter_driver(perfil=nome)
+        tempo_inicializacao = time.time() - inicio
+
+        try:
+            tempos_carregamento = []
+            for _ in range(repeticoes):
+                driver.get("about:blank")
+                driver.get(url)
+                duracao = driver.execute_script(
+                    "const n = performance.getEntriesByType('navigation')[0];"
+                    "return n ? n.loadEventEnd - n.startTime : null;"
+                )
+                if duracao is not None:
+                    tempos_carregamento.append(duracao / 1000)
+
+            metricas_cdp = {}
+            if PerfisNavegador._cdp_disponivel(driver):
+                metricas_cdp = driver.execute_cdp_cmd("Performance.getMetrics", {})
+            heap_js = {
+                m["name"]: m["value"] for m in metricas_cdp.get("metrics", [])
+            }.get("JSHeapUsedSize")
+
+            return {
+                "perfil": nome,
+                "tempo_inicializacao_s": round(tempo_inicializacao, 3),
+                "tempo_carregamento_medio_s": round(sum(tempos_carregamento) / len(tempos_carregamento), 3) if tempos_carregamento else None,
+                "heap_js_mb": round(heap_js / 1024 / 1024, 2) if heap_js else None,
+                "memoria_processos_mb": PerfisNavegador._memoria_processos_navegador(driver),
+            }
+        finally:
+            WebDriverConfig.fechar_driver(driver)
+
+    @staticmethod
+    def _cdp_disponivel(driver):
+        """Verifica se a sessão aceita comandos CDP (Performance.enable)"""
+        try:
+            driver.execute_cdp_cmd("Performance.enable", {})
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _memoria_processos_navegador(driver):
+        """Soma a memória residente (RSS) do ChromeDriver e dos processos do Chrome"""
+        if psutil is None:
+            return None
+        try:
+            processo = psutil.Process(driver.service.process.pid)
+            processos = [processo] + processo.children(recursive=True)
+            total = sum(p.memory_info().rss for p in processos if p.is_running())
+            return round(total / 1024 / 1024, 1)
+        except Exception:
+            return None
+
+
+def main():
+    """Mede todos os perfis e grava o resultado em reports/perfis_navegador.json"""
+    resultados = []
+    for nome in PerfisNavegador.PERFIS:
+        print(f"⏱️  Medindo perfil '{nome}'...")
+        try:
+            resultado = PerfisNavegador.medir(nome)
+        except Exception as e:
+            print(f"❌ Erro ao medir perfil '{nome}': {e}")
+            continue
+        resultados.append(resultado)
+        print(f"   {resultado}")
+
+    os.makedirs(TestConfig.REPORTS_DIR, exist_ok=True)
+    caminho = os.path.join(TestConfig.REPORTS_DIR, "perfis_navegador.json")
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(resultados, f, indent=2, ensure_ascii=False)
+    print(f"📄 Medições gravadas em: {caminho}")
+
+
+if __name__ == "__main__":
+    main()
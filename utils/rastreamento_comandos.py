@@ -0,0 +1,205 @@
+"""
+Rastreamento dos comandos WebDriver
+Registra cada roundtrip ao chromedriver (comando, locator, duração e tamanho
+da resposta) e grava um arquivo de trace por teste
+"""
+
+import json
+import os
+import re
+import threading
+import time
+import weakref
+from collections import Counter, defaultdict
+from typing import List, Optional
+
+from config.test_config import TestConfig
+
+# Tamanho máximo do trecho de script/URL guardado no campo locator
+TAMANHO_MAXIMO_ALVO = 80
+
+
+class RastreadorComandos:
+    """
+    Rastreador de comandos de um driver (desligado por padrão)
+
+    Com SAUCE_RASTREAR_COMANDOS=1, WebDriverConfig instala um rastreador em
+    cada driver criado, substituindo driver.execute na instância. Comandos de
+    elementos (click, getText...) também passam por driver.execute, então todo
+    roundtrip é registrado.
+
+    Os limites de cada teste são marcados com iniciar_teste/finalizar_teste
+    (conftest.py e features/environment.py), que abrangem todos os drivers
+    rastreados do processo.
+    """
+
+    # Rastreadores dos drivers vivos do processo
+    _rastreadores = weakref.WeakSet()
+    _lock = threading.Lock()
+    _inicio_teste = time.perf_counter()
+
+    def __init__(self, driver):
+        self.sessao = driver.session_id
+        self.comandos: List[dict] = []
+
+    @classmethod
+    def instalar(cls, driver) -> "RastreadorComandos":
+        """
+        Passa a registrar os comandos do driver
+
+        Args:
+            driver: Instância do WebDriver
+
+        Returns:
+            RastreadorComandos: Rastreador do driver (o mesmo, se já instalado)
+        """
+        rastreador = getattr(driver, "rastreador_comandos", None)
+        if rastreador is not None:
+            return rastreador
+
+        rastreador = cls(driver)
+
+        def execute_rastreado(driver_command, params=None):
+            alvo = cls._descrever_alvo(driver_command, params)
+            inicio = time.perf_counter()
+            resposta = None
+            try:
+                # Resolvido pela classe a cada chamada: respeita a instrumentação aplicada depois
+                resposta = type(driver).execute(driver, driver_command, params)
+                return resposta
+            finally:
+                rastreador.registrar(driver_command, alvo, inicio, time.perf_counter() - inicio, resposta)
+
+        driver.execute = execute_rastreado
+        driver.rastreador_comandos = rastreador
+        with cls._lock:
+            cls._rastreadores.add(rastreador)
+        return rastreador
+
+    def registrar(self, comando: str, alvo: Optional[str], inicio: float, duracao: float, resposta):
+        """Adiciona um comando ao trace"""
+        self.comandos.append({
+            "inicio_ms": round((inicio - RastreadorComandos._inicio_teste) * 1000, 3),
+            "comando": comando,
+            "locator": alvo,
+            "duracao_ms": round(duracao * 1000, 3),
+            "tamanho_bytes": self._tamanho_resposta(resposta),
+            "sucesso": resposta is not None,
+            "sessao": self.sessao,
+        })
+
+    @staticmethod
+    def _descrever_alvo(comando: str, params) -> Optional[str]:
+        """Locator (find*), URL (get) ou início do script (execute*) do comando"""
+        if not params:
+            return None
+        if "using" in params and "value" in params:
+            return f"{params['using']}={params['value']}"
+        for chave in ("url", "script", "cmd", "name"):
+            if chave in params:
+                return re.sub(r"\s+", " ", str(params[chave])).strip()[:TAMANHO_MAXIMO_ALVO]
+        return None
+
+    @staticmethod
+    def _tamanho_resposta(resposta) -> int:
+        """Tamanho aproximado (bytes) do valor retornado pelo chromedriver"""
+        if not resposta:
+            return 0
+        valor = resposta.get("value")
+        if valor is None:
+            return 0
+        if isinstance(valor, str):
+            return len(valor)
+        # WebElements já foram desembrulhados pelo Selenium: conta o id do elemento
+        return len(json.dumps(valor, default=lambda objeto: getattr(objeto, "id", str(objeto))))
+
+    # ------------------------------------------------------------ por teste
+
+    @classmethod
+    def iniciar_teste(cls):
+        """Descarta os comandos anteriores ao teste (ex.: criação do driver)"""
+        with cls._lock:
+            rastreadores = list(cls._rastreadores)
+            cls._inicio_teste = time.perf_counter()
+        for rastreador in rastreadores:
+            rastreador.comandos = []
+
+    @classmethod
+    def finalizar_teste(cls, nome_teste: str):
+        """
+        Grava o trace do teste e retorna o resumo
+
+        Args:
+            nome_teste: Identificação do teste (nodeid do pytest ou nome do cenário)
+
+        Returns:
+            tuple: (caminho do trace, resumo em texto), ou (None, None) se nada foi registrado
+        """
+        with cls._lock:
+            rastreadores = list(cls._rastreadores)
+        comandos = []
+        for rastreador in rastreadores:
+            comandos.extend(rastreador.comandos)
+            rastreador.comandos = []
+        if not comandos:
+            return None, None
+        comandos.sort(key=lambda comando: comando["inicio_ms"])
+
+        resumo = cls.resumir(comandos)
+        os.makedirs(TestConfig.TRACES_DIR, exist_ok=True)
+        nome_arquivo = re.sub(r"[^\w.-]+", "_", nome_teste).strip("_")[:150] or "teste"
+        caminho = os.path.join(TestConfig.TRACES_DIR, f"{nome_arquivo}.json")
+        with open(caminho, 'w', encoding='utf-8') as f:
+            json.dump({"teste": nome_teste, "resumo": resumo, "comandos": comandos}, f, indent=2, ensure_ascii=False)
+        return caminho, cls.formatar_resumo(nome_teste, resumo)
+
+    @staticmethod
+    def resumir(comandos: List[dict]) -> dict:
+        """
+        Agrega os comandos de um teste
+
+        Returns:
+            dict: roundtrips, tempo e bytes totais, totais por comando e
+            os pares comando+locator mais repetidos (candidatos a extração em lote)
+        """
+        por_comando = defaultdict(lambda: {"quantidade": 0, "duracao_ms": 0.0, "bytes": 0})
+        for comando in comandos:
+            agregado = por_comando[comando["comando"]]
+            agregado["quantidade"] += 1
+            agregado["duracao_ms"] += comando["duracao_ms"]
+            agregado["bytes"] += comando["tamanho_bytes"]
+
+        repetidos = Counter(
+            (comando["comando"], comando["locator"]) for comando in comandos if comando["locator"]
+        )
+        return {
+            "roundtrips": len(comandos),
+            "duracao_ms": round(sum(comando["duracao_ms"] for comando in comandos), 3),
+            "bytes": sum(comando["tamanho_bytes"] for comando in comandos),
+            "por_comando": {
+                nome: dict(agregado, duracao_ms=round(agregado["duracao_ms"], 3))
+                for nome, agregado in sorted(por_comando.items(), key=lambda item: -item[1]["quantidade"])
+            },
+            "repetidos": [
+                {"comando": nome, "locator": alvo, "quantidade": quantidade}
+                for (nome, alvo), quantidade in repetidos.most_common(10)
+                if quantidade > 1
+            ],
+        }
+
+    @staticmethod
+    def formatar_resumo(nome_teste: str, resumo: dict) -> str:
+        """Resumo legível para anexar ao Allure"""
+        linhas = [
+            f"Teste: {nome_teste}",
+            f"Roundtrips: {resumo['roundtrips']} ({resumo['duracao_ms'] / 1000:.2f}s, {resumo['bytes']} bytes)",
+            "",
+            "Por comando:",
+        ]
+        for nome, agregado in resumo["por_comando"].items():
+            linhas.append(f"  {nome:<28}{agregado['quantidade']:>6}x {agregado['duracao_ms'] / 1000:>8.3f}s")
+        if resumo["repetidos"]:
+            linhas += ["", "Comandos repetidos:"]
+            for repetido in resumo["repetidos"]:
+                linhas.append(f"  {repetido['quantidade']:>4}x {repetido['comando']} {repetido['locator']}")
+        return "\n".join(linhas)
@@ -10,6 +10,16 @@ from datetime import datetime
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
+from config.test_config import TestConfig
+from utils.armazem_screenshots import ArmazemScreenshots
+from utils.evidencias_falha import BufferEvidencias
+from utils.gravador_screenshots import GravadorScreenshots
+
+# Área de um elemento em coordenadas da página (clip do Page.captureScreenshot)
+SCRIPT_AREA_ELEMENTO = """
+const area = arguments[0].getBoundingClientRect();
+return {x: area.left + window.scrollX, y: area.top + window.scrollY, width: area.width, height: area.height};
+"""
 
 
 class ReportUtils:
@@ -17,20 +27,23 @@ class ReportUtils:
     
     def __init__(self, driver):
         self.driver = driver
-        self.screenshots_dir = "screenshots"
-        self.reports_dir = "reports"
+        # Em execuções paralelas os screenshots ficam no diretório do worker
+        self.screenshots_dir = TestConfig.SCREENSHOTS_DIR
+        self.reports_dir = TestConfig.REPORTS_DIR
         self._criar_diretorios()
     
     def _criar_diretorios(self):
         """Cria os diretórios necessários para screenshots e relatórios"""
         for diretorio in [self.screenshots_dir, self.reports_dir]:
-            if not os.path.exists(diretorio):
-                os.makedirs(diretorio)
+            os.makedirs(diretorio, exist_ok=True)
     
     def capturar_screenshot(self, nome_arquivo=None):
         """
         Captura screenshot da tela atual
         
+        O arquivo e o anexo do Allure são gravados em segundo plano
+        (GravadorScreenshots); o teste só espera o roundtrip da captura.
+        
         Args:
             nome_arquivo: Nome do arquivo para salvar (opcional)
         
@@ -41,25 +54,26 @@ class ReportUtils:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             nome_arquivo = f"screenshot_{timestamp}.png"
         
-        caminho_completo = os.path.join(self.screenshots_dir, nome_arquivo)
-        
+        with allure.step(f"Capturando screenshot: {nome_arquivo}"):
+            return self._enfileirar_screenshot(nome_arquivo, nome_arquivo)
+    
+    def _enfileirar_screenshot(self, nome_arquivo, titulo_allure, conteudo_base64=None):
+        """Captura o screenshot e o anexa uma única vez ao passo atual do Allure"""
         try:
-            self.driver.save_screenshot(caminho_completo)
-            print(f"📸 Screenshot capturado: {caminho_completo}")
-            
-            # Anexar screenshot ao relatório Allure
-            with allure.step(f"Capturando screenshot: {nome_arquivo}"):
-                allure.attach.file(
-                    caminho_completo,
-                    name=nome_arquivo,
-                    attachment_type=allure.attachment_type.PNG
-                )
-            
+            caminho_completo = GravadorScreenshots.enfileirar(
+                self.driver, nome_arquivo, titulo_allure, conteudo_base64
+            )
+            print(f"📸 Screenshot capturado: {nome_arquivo} ({caminho_completo})")
             return caminho_completo
         except Exception as e:
             print(f"❌ Erro ao capturar screenshot: {e}")
             return None
     
+    @staticmethod
+    def aguardar_screenshots():
+        """Aguarda a gravação dos screenshots pendentes (chamado ao final da sessão)"""
+        GravadorScreenshots.aguardar()
+    
     def capturar_screenshot_em_caso_de_falha(self, nome_teste):
         """
         Captura screenshot quando um teste falha
@@ -70,16 +84,9 @@ class ReportUtils:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         nome_arquivo = f"falha_{nome_teste}_{timestamp}.png"
         
-        caminho = self.capturar_screenshot(nome_arquivo)
-        
-        if caminho:
-            # Adicionar ao relatório Allure como evidência de falha
-            with allure.step("Screenshot da falha"):
-                allure.attach.file(
-                    caminho,
-                    name=f"Falha - {nome_teste}",
-                    attachment_type=allure.attachment_type.PNG
-                )
+        # Adicionar ao relatório Allure como evidência de falha
+        with allure.step("Screenshot da falha"):
+            return self._enfileirar_screenshot(nome_arquivo, f"Falha - {nome_teste}")
     
     def capturar_screenshot_etapa(self, etapa, nome_teste=None):
         """
@@ -95,17 +102,17 @@ class ReportUtils:
         else:
             nome_arquivo = f"{etapa}_{timestamp}.png"
         
-        caminho = self.capturar_screenshot(nome_arquivo)
+        # SAUCE_MODO_EVIDENCIAS=falha: fica em memória e só é gravado se o teste falhar
+        if BufferEvidencias.ativo():
+            try:
+                BufferEvidencias.registrar(self.driver, etapa, nome_arquivo)
+            except Exception as e:
+                print(f"❌ Erro ao registrar evidência da etapa {etapa}: {e}")
+            return None
         
         # Adicionar ao relatório Allure com descrição da etapa
         with allure.step(f"Screenshot - {etapa}"):
-            allure.attach.file(
-                caminho,
-                name=f"{etapa} - {nome_arquivo}",
-                attachment_type=allure.attachment_type.PNG
-            )
-        
-        return caminho
+            return self._enfileirar_screenshot(nome_arquivo, f"{etapa} - {nome_arquivo}")
     
     def gerar_relatorio_json(self, dados_teste, resultado):
         """
@@ -146,17 +153,11 @@ class ReportUtils:
             return None
     
     def _obter_screenshots_recentes(self):
-        """Obtém lista de screenshots recentes"""
-        screenshots = []
-        if os.path.exists(self.screenshots_dir):
-            arquivos = os.listdir(self.screenshots_dir)
-            arquivos_png = [f for f in arquivos if f.endswith('.png')]
-            # Pegar os 5 mais recentes
-            arquivos_png.sort(key=lambda x: os.path.getmtime(os.path.join(self.screenshots_dir, x)), reverse=True)
-            screenshots = arquivos_png[:5]
-        return screenshots
+        """Obtém os 5 screenshots mais recentes (nome lógico e arquivo no armazém)"""
+        return ArmazemScreenshots.recentes(5)
     
-    def adicionar_evidencia_allure(self, titulo, conteudo, tipo="text"):
+    @staticmethod
+    def adicionar_evidencia_allure(titulo, conteudo, tipo="text"):
         """
         Adiciona evidência ao relatório Allure
         
@@ -173,12 +174,17 @@ class ReportUtils:
             elif tipo == "json":
                 allure.attach(conteudo, name=titulo, attachment_type=allure.attachment_type.JSON)
     
-    def capturar_pagina_completa(self, nome_arquivo=None):
+    def capturar_pagina_completa(self, nome_arquivo=None, elemento=None):
         """
-        Captura screenshot da página completa (scroll)
+        Captura screenshot da página completa (além da área visível) ou de um elemento
+        
+        Usa o Page.captureScreenshot do CDP com captureBeyondViewport: a janela
+        não é redimensionada e a viewport fica intacta para as próximas etapas.
+        Sem CDP (outros navegadores), captura a área visível ou o elemento.
         
         Args:
             nome_arquivo: Nome do arquivo para salvar (opcional)
+            elemento: WebElement ou locator (By, valor) para recortar a captura (opcional)
         
         Returns:
             str: Caminho do arquivo salvo
@@ -188,25 +194,40 @@ class ReportUtils:
             nome_arquivo = f"pagina_completa_{timestamp}.png"
         
         try:
-            # Obter altura total da página
-            altura_total = self.driver.execute_script("return document.body.scrollHeight")
-            largura = self.driver.execute_script("return document.body.scrollWidth")
-            
-            # Definir tamanho da janela
-            self.driver.set_window_size(largura, altura_total)
-            
-            # Capturar screenshot
-            caminho = self.capturar_screenshot(nome_arquivo)
+            if isinstance(elemento, tuple):
+                elemento = self.driver.find_element(*elemento)
+            conteudo = self._capturar_alem_da_viewport(elemento)
             
             # Anexar ao Allure como página completa
             with allure.step("Screenshot da página completa"):
-                allure.attach.file(
-                    caminho,
-                    name=f"Página Completa - {nome_arquivo}",
-                    attachment_type=allure.attachment_type.PNG
-                )
-            
-            return caminho
+                return self._enfileirar_screenshot(nome_arquivo, f"Página Completa - {nome_arquivo}", conteudo)
         except Exception as e:
             print(f"❌ Erro ao capturar página completa: {e}")
             return None
+    
+    def _capturar_alem_da_viewport(self, elemento=None):
+        """
+        PNG em base64 da página inteira ou da área de um elemento
+        
+        Args:
+            elemento: WebElement a recortar (None para a página inteira)
+        """
+        try:
+            if elemento is not None:
+                # Retângulo em coordenadas da página, não da viewport
+                area = self.driver.execute_script(SCRIPT_AREA_ELEMENTO, elemento)
+            else:
+                metricas = self.driver.execute_cdp_cmd("Page.getLayoutMetrics", {})
+                tamanho = metricas.get("cssContentSize") or metricas["contentSize"]
+                area = {"x": 0, "y": 0, "width": tamanho["width"], "height": tamanho["height"]}
+            resposta = self.driver.execute_cdp_cmd("Page.captureScreenshot", {
+                "format": "png",
+                "captureBeyondViewport": True,
+                "clip": dict(area, scale=1),
+            })
+            return resposta["data"]
+        except (AttributeError, WebDriverException) as e:
+            print(f"⚠️ Captura pelo CDP indisponível, usando a área visível: {e}")
+            if elemento is not None:
+                return elemento.screenshot_as_base64
+            return self.driver.get_screenshot_as_base64()
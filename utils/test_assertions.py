@@ -3,6 +3,7 @@ Assertions descritivos para testes de automação
 """
 
 from config.test_config import TestConfig
+from utils.catalogo_produtos import CatalogoProdutos
 from utils.test_helpers import TestHelpers
 
 
@@ -148,6 +149,25 @@ class TestAssertions:
                 f"Produtos no carrinho: {nomes_reais}"
             )
     
+    @staticmethod
+    def assert_precos_conforme_catalogo(produtos):
+        """
+        Valida se os preços exibidos correspondem aos do catálogo de produtos
+        
+        Args:
+            produtos: Lista de produtos com 'nome' e 'preco' (float)
+            
+        Raises:
+            AssertionError: Se algum produto não existir no catálogo ou tiver preço divergente
+        """
+        catalogo = CatalogoProdutos.obter()
+        for produto in produtos:
+            try:
+                preco_catalogo = catalogo.preco_esperado(produto['nome'])
+            except KeyError:
+                raise AssertionError(f"Produto '{produto['nome']}' não encontrado no catálogo")
+            TestAssertions.assert_preco_correto(preco_catalogo, produto['preco'], f"de '{produto['nome']}'")
+    
     @staticmethod
     def assert_elemento_visivel(driver, locator, descricao=""):
         """
@@ -170,6 +190,24 @@ class TestAssertions:
                 f"Erro: {str(e)}"
             )
     
+    @staticmethod
+    def assert_elemento_ausente(driver, locator, descricao=""):
+        """
+        Valida, sem esperar timeout, que um elemento não está na página
+        
+        Args:
+            driver: Instância do WebDriver
+            locator: Localizador do elemento
+            descricao: Descrição do elemento
+            
+        Raises:
+            AssertionError: Se o elemento estiver presente
+        """
+        assert TestHelpers.elemento_ausente(driver, locator), (
+            f"Elemento {descricao} não deveria estar presente. "
+            f"Locator: {locator}"
+        )
+    
     @staticmethod
     def assert_url_correta(driver, url_esperada):
         """
@@ -2,10 +2,14 @@
 Utilitários para facilitar a escrita de testes de automação
 """
 
+import threading
 import time
+from collections import deque
 from datetime import datetime
+from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 from config.test_config import TestConfig
 
 
@@ -79,7 +83,50 @@ class TestHelpers:
             tempo_execucao = fim - inicio
             return resultado, tempo_execucao
         return wrapper
-    
+
+    @staticmethod
+    def calcular_percentil(valores, percentil):
+        """
+        Calcula um percentil com interpolação linear entre as amostras
+
+        Args:
+            valores: Amostras (não precisam estar ordenadas)
+            percentil: Percentil desejado, de 0 a 100
+
+        Returns:
+            float: Valor do percentil (0.0 se não houver amostras)
+        """
+        ordenados = sorted(valores)
+        if not ordenados:
+            return 0.0
+        posicao = (len(ordenados) - 1) * percentil / 100
+        inferior = int(posicao)
+        superior = min(inferior + 1, len(ordenados) - 1)
+        return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * (posicao - inferior)
+
+    @staticmethod
+    def resumir_duracoes(duracoes):
+        """
+        Resume uma lista de durações em segundos
+
+        Args:
+            duracoes: Durações em segundos
+
+        Returns:
+            dict: amostras, media, p50, p95, p99 e max (segundos, 4 casas)
+        """
+        duracoes = list(duracoes)
+        if not duracoes:
+            return {"amostras": 0, "media": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        return {
+            "amostras": len(duracoes),
+            "media": round(sum(duracoes) / len(duracoes), 4),
+            "p50": round(TestHelpers.calcular_percentil(duracoes, 50), 4),
+            "p95": round(TestHelpers.calcular_percentil(duracoes, 95), 4),
+            "p99": round(TestHelpers.calcular_percentil(duracoes, 99), 4),
+            "max": round(max(duracoes), 4),
+        }
+
     @staticmethod
     def aguardar_elemento_visivel(driver, locator, timeout=None):
         """
@@ -120,6 +167,48 @@ class TestHelpers:
             EC.element_to_be_clickable(locator)
         )
     
+    @staticmethod
+    def elemento_ausente(driver, locator):
+        """
+        Verifica, sem esperar, se um elemento está ausente do DOM
+        
+        Usa find_elements, que retorna lista vazia imediatamente quando não há
+        espera implícita configurada (política do projeto).
+        
+        Args:
+            driver: Instância do WebDriver
+            locator: Localizador do elemento
+            
+        Returns:
+            bool: True se nenhum elemento corresponde ao localizador
+        """
+        return len(driver.find_elements(*locator)) == 0
+    
+    @staticmethod
+    def aguardar_elemento_ausente(driver, locator, timeout=None):
+        """
+        Aguarda um elemento sair do DOM ou ficar invisível
+        
+        Retorna imediatamente se o elemento já estiver ausente.
+        
+        Args:
+            driver: Instância do WebDriver
+            locator: Localizador do elemento
+            timeout: Timeout em segundos (usa SHORT_TIMEOUT se não especificado)
+            
+        Returns:
+            bool: True se o elemento ficou ausente dentro do timeout
+        """
+        if timeout is None:
+            timeout = TestConfig.SHORT_TIMEOUT
+        
+        try:
+            return WebDriverWait(driver, timeout).until(
+                EC.invisibility_of_element_located(locator)
+            )
+        except TimeoutException:
+            return False
+    
     @staticmethod
     def extrair_numero_de_texto(texto):
         """
@@ -172,3 +261,163 @@ class TestHelpers:
     def aguardar_pausa_padrao():
         """Aguarda uma pausa padrão"""
         time.sleep(TestConfig.DEFAULT_TIMEOUT)
+
+
+class MotorEspera:
+    """
+    Esperas orientadas a condições concretas da página
+    
+    Cada espera retorna assim que a condição é atendida (polling curto) e
+    registra quanto tempo realmente levou, substituindo pausas fixas com
+    time.sleep.
+    """
+    
+    INTERVALO_POLLING = 0.1
+    CONTADOR_CARRINHO = (By.CLASS_NAME, "shopping_cart_badge")
+    
+    # Últimas esperas executadas no processo: {"descricao", "duracao", "sucesso"}
+    # (limitado: em execuções longas, e com as jornadas concorrentes, registra de várias threads)
+    MAXIMO_HISTORICO = 1000
+    historico = deque(maxlen=MAXIMO_HISTORICO)
+    _tempo_total = 0.0
+    _lock = threading.Lock()
+    
+    @classmethod
+    def aguardar(cls, driver, condicao, descricao, timeout=None, lancar_erro=True):
+        """
+        Aguarda uma condição e registra o tempo gasto
+        
+        Args:
+            driver: Instância do WebDriver
+            condicao: Callable que recebe o driver e retorna valor verdadeiro quando atendida
+            descricao: Descrição da espera (usada no histórico)
+            timeout: Timeout em segundos (usa DEFAULT_TIMEOUT se não especificado)
+            lancar_erro: Se False, retorna False em vez de lançar TimeoutException
+            
+        Returns:
+            Valor retornado pela condição, ou False se expirou com lancar_erro=False
+        """
+        if timeout is None:
+            timeout = TestConfig.DEFAULT_TIMEOUT
+        
+        inicio = time.perf_counter()
+        sucesso = False
+        try:
+            espera = WebDriverWait(
+                driver, timeout,
+                poll_frequency=cls.INTERVALO_POLLING,
+                ignored_exceptions=(StaleElementReferenceException,)
+            )
+            resultado = espera.until(condicao)
+            sucesso = True
+            return resultado
+        except TimeoutException:
+            if lancar_erro:
+                raise
+            return False
+        finally:
+            duracao = time.perf_counter() - inicio
+            with cls._lock:
+                cls.historico.append({"descricao": descricao, "duracao": duracao, "sucesso": sucesso})
+                cls._tempo_total += duracao
+    
+    @classmethod
+    def aguardar_url_mudar(cls, driver, url_anterior, timeout=None, lancar_erro=True):
+        """
+        Aguarda a URL atual deixar de ser url_anterior
+        
+        Args:
+            driver: Instância do WebDriver
+            url_anterior: URL antes da ação (ex.: antes do clique em login)
+            timeout: Timeout em segundos
+            lancar_erro: Se False, retorna False ao expirar
+        """
+        return cls.aguardar(
+            driver, EC.url_changes(url_anterior), f"URL mudar de {url_anterior}",
+            timeout, lancar_erro
+        )
+    
+    @classmethod
+    def aguardar_url_conter(cls, driver, trecho, timeout=None, lancar_erro=True):
+        """
+        Aguarda a URL atual conter um trecho (ex.: "inventory", "cart.html")
+        
+        Args:
+            driver: Instância do WebDriver
+            trecho: Texto esperado na URL
+            timeout: Timeout em segundos
+            lancar_erro: Se False, retorna False ao expirar
+        """
+        return cls.aguardar(
+            driver, EC.url_contains(trecho), f"URL conter '{trecho}'", timeout, lancar_erro
+        )
+    
+    @classmethod
+    def aguardar_quantidade_carrinho(cls, driver, quantidade, timeout=None, lancar_erro=True):
+        """
+        Aguarda o contador do carrinho chegar a uma quantidade (0 = contador ausente)
+        
+        Args:
+            driver: Instância do WebDriver
+            quantidade: Quantidade esperada de itens
+            timeout: Timeout em segundos
+            lancar_erro: Se False, retorna False ao expirar
+        """
+        def contador_igual(d):
+            contadores = d.find_elements(*cls.CONTADOR_CARRINHO)
+            atual = int(contadores[0].text) if contadores and contadores[0].text.strip() else 0
+            return atual == quantidade
+        
+        return cls.aguardar(
+            driver, contador_igual, f"carrinho com {quantidade} itens", timeout, lancar_erro
+        )
+    
+    @classmethod
+    def aguardar_texto_botao(cls, driver, botao, texto="Remove", timeout=None, lancar_erro=True):
+        """
+        Aguarda o texto de um botão mudar (ex.: "Add to cart" -> "Remove")
+        
+        Args:
+            driver: Instância do WebDriver
+            botao: Localizador (tupla) ou WebElement do botão
+            texto: Texto esperado
+            timeout: Timeout em segundos
+            lancar_erro: Se False, retorna False ao expirar
+        """
+        if isinstance(botao, tuple):
+            condicao = EC.text_to_be_present_in_element(botao, texto)
+        else:
+            condicao = lambda d: texto in botao.text
+        
+        return cls.aguardar(driver, condicao, f"botão com texto '{texto}'", timeout, lancar_erro)
+    
+    @classmethod
+    def aguardar_elemento_presente(cls, driver, locator, timeout=None, lancar_erro=True):
+        """
+        Aguarda um elemento estar presente no DOM
+        
+        Args:
+            driver: Instância do WebDriver
+            locator: Localizador do elemento
+            timeout: Timeout em segundos
+            lancar_erro: Se False, retorna False ao expirar
+            
+        Returns:
+            WebElement: Elemento encontrado
+        """
+        return cls.aguardar(
+            driver, EC.presence_of_element_located(locator), f"elemento {locator}", timeout, lancar_erro
+        )
+    
+    @classmethod
+    def tempo_total(cls):
+        """Retorna o tempo total gasto em esperas no processo (segundos), inclusive as que já saíram do histórico"""
+        with cls._lock:
+            return cls._tempo_total
+    
+    @classmethod
+    def limpar_historico(cls):
+        """Limpa o histórico de esperas e zera o tempo total"""
+        with cls._lock:
+            cls.historico.clear()
+            cls._tempo_total = 0.0
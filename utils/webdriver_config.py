@@ -3,10 +3,14 @@ Configuração do WebDriver para automação do Sauce Demo
 Inclui configurações para desabilitar detecção de vazamento de senha
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from config.test_config import TestConfig
+from utils.chromedriver_resolver import ResolvedorChromeDriver
+from utils.perfis_navegador import PerfisNavegador
+from utils.rastreamento_comandos import RastreadorComandos
+from utils.metricas_navegador import MetricasNavegador
+import atexit
+import threading
 import time
 
 
@@ -17,23 +21,31 @@ class WebDriverConfig:
         """Inicializa a configuração do WebDriver"""
         pass
     
-    def obter_driver(self):
+    def obter_driver(self, perfil=None):
         """
         Retorna uma instância configurada do Chrome WebDriver
         
+        Args:
+            perfil: Nome do perfil de navegador (opcional, ver utils/perfis_navegador.py)
+        
         Returns:
             webdriver.Chrome: Instância do Chrome WebDriver configurada
         """
-        driver = self.configurar_chrome_driver()
-        self.configurar_driver_com_espera_implicita(driver)
+        driver = self.configurar_chrome_driver(perfil)
+        self.configurar_driver_com_espera_implicita(driver, perfil=perfil)
         return driver
     
     @staticmethod
-    def configurar_chrome_driver():
+    def configurar_chrome_driver(perfil=None):
         """
         Configura e retorna uma instância do Chrome WebDriver
         com opções otimizadas para automação
+        
+        Args:
+            perfil: Nome do perfil de navegador (usa o perfil da execução se não especificado)
         """
+        perfil_navegador = PerfisNavegador.obter(perfil)
+        
         # Configurações do Chrome
         chrome_options = Options()
         
@@ -49,50 +61,62 @@ class WebDriverConfig:
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
         # Desabilitar detecção de vazamento de senha
-        chrome_options.add_experimental_option(
-            "prefs", {
-                "profile.password_manager_leak_detection": False,
-                "credentials_enable_service": False,  # Também desabilita o prompt "Oferecer para salvar senhas"
-                "profile.password_manager_enabled": False,  # Desabilita o gerenciador de senhas completamente
-                "profile.default_content_setting_values.notifications": 2
-            }
-        )
-        
-        # Inicializar o driver
+        prefs = {
+            "profile.password_manager_leak_detection": False,
+            "credentials_enable_service": False,  # Também desabilita o prompt "Oferecer para salvar senhas"
+            "profile.password_manager_enabled": False,  # Desabilita o gerenciador de senhas completamente
+            "profile.default_content_setting_values.notifications": 2
+        }
+        
+        # Headless, viewport e bloqueio de recursos conforme o perfil
+        PerfisNavegador.aplicar_opcoes(chrome_options, perfil_navegador, prefs)
+        chrome_options.add_experimental_option("prefs", prefs)
+        
+        # Logs do console guardados com as evidências de etapa (SAUCE_MODO_EVIDENCIAS=falha)
+        if TestConfig.MODO_EVIDENCIAS == "falha":
+            chrome_options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+        
+        # Inicializar o driver (caminho resolvido uma vez e cacheado entre processos)
         try:
-            # Tentar com ChromeDriverManager primeiro
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver = ResolvedorChromeDriver.iniciar_chrome(chrome_options)
         except Exception as e:
-            print(f"Erro ao inicializar ChromeDriver com ChromeDriverManager: {e}")
-            try:
-                # Tentar sem service (usando PATH)
-                driver = webdriver.Chrome(options=chrome_options)
-            except Exception as e2:
-                print(f"Erro ao inicializar ChromeDriver sem service: {e2}")
-                # Última tentativa: usar driver local
-                try:
-                    driver = webdriver.Chrome(options=chrome_options)
-                except Exception as e3:
-                    print(f"Erro final ao inicializar ChromeDriver: {e3}")
-                    raise Exception("Não foi possível inicializar o ChromeDriver")
+            print(f"Erro final ao inicializar ChromeDriver: {e}")
+            raise Exception("Não foi possível inicializar o ChromeDriver")
+        
+        # Registro de cada comando enviado ao chromedriver (SAUCE_RASTREAR_COMANDOS=1)
+        if TestConfig.RASTREAR_COMANDOS:
+            RastreadorComandos.instalar(driver)
+        
+        # Métricas do navegador a cada driver.get (SAUCE_METRICAS_NAVEGADOR=1)
+        if TestConfig.COLETAR_METRICAS_NAVEGADOR:
+            MetricasNavegador.instalar(driver)
         
         # Executar script para remover propriedades de automação
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
+        # Guardar o perfil para que o pool saiba restaurar a janela
+        driver.perfil_navegador = perfil_navegador
+        
         return driver
     
     @staticmethod
-    def configurar_driver_com_espera_implicita(driver, tempo_espera=10):
+    def configurar_driver_com_espera_implicita(driver, tempo_espera=0, perfil=None):
         """
-        Configura o tempo de espera implícita do driver
+        Configura o tempo de espera implícita e a janela do driver
+        
+        A política do projeto é não usar espera implícita (padrão: 0): todas as
+        esperas são explícitas, com os timeouts de TestConfig. Misturar as duas
+        faz verificações negativas (elemento ausente) levarem o timeout inteiro.
         
         Args:
             driver: Instância do WebDriver
-            tempo_espera: Tempo de espera em segundos (padrão: 10)
+            tempo_espera: Tempo de espera implícita em segundos (padrão: 0, desabilitada)
+            perfil: Nome do perfil de navegador (usa o perfil do driver se não especificado)
         """
-        driver.implicitly_wait(tempo_espera)
-        driver.maximize_window()
+        if tempo_espera:
+            driver.implicitly_wait(tempo_espera)
+        perfil_navegador = getattr(driver, "perfil_navegador", None) or PerfisNavegador.obter(perfil)
+        PerfisNavegador.aplicar_no_driver(driver, perfil_navegador)
     
     @staticmethod
     def fechar_driver(driver):
@@ -104,3 +128,191 @@ class WebDriverConfig:
         """
         if driver:
             driver.quit()
+    
+    @staticmethod
+    def obter_pool():
+        """
+        Retorna o pool de drivers compartilhado pelo processo
+        
+        Returns:
+            PoolDrivers: Pool criado sob demanda na primeira chamada
+        """
+        global _pool_global
+        with _pool_lock:
+            if _pool_global is None:
+                _pool_global = PoolDrivers(lambda perfil: WebDriverConfig().obter_driver(perfil))
+            return _pool_global
+    
+    @staticmethod
+    def obter_driver_do_pool(perfil=None):
+        """
+        Empresta um driver aquecido do pool (ou cria um novo se necessário)
+        
+        Quando TestConfig.REUTILIZAR_DRIVERS estiver desligado, cria sempre
+        um navegador novo, como no comportamento original.
+        
+        Args:
+            perfil: Nome do perfil de navegador (usa o perfil da execução se não especificado)
+        
+        Returns:
+            webdriver.Chrome: Instância do Chrome WebDriver pronta para uso
+        """
+        if not TestConfig.REUTILIZAR_DRIVERS:
+            return WebDriverConfig().obter_driver(perfil)
+        return WebDriverConfig.obter_pool().adquirir(PerfisNavegador.obter(perfil).nome)
+    
+    @staticmethod
+    def devolver_driver(driver):
+        """
+        Devolve um driver ao pool no lugar de fechá-lo
+        
+        Args:
+            driver: Instância do WebDriver obtida com obter_driver_do_pool
+        """
+        if not driver:
+            return
+        if not TestConfig.REUTILIZAR_DRIVERS:
+            WebDriverConfig.fechar_driver(driver)
+            return
+        WebDriverConfig.obter_pool().devolver(driver)
+    
+    @staticmethod
+    def encerrar_pool():
+        """Fecha todos os navegadores mantidos pelo pool"""
+        global _pool_global
+        with _pool_lock:
+            pool, _pool_global = _pool_global, None
+        if pool:
+            pool.encerrar()
+
+
+class PoolDrivers:
+    """
+    Pool de sessões do Chrome reutilizáveis entre testes
+    
+    Mantém navegadores aquecidos e, ao devolvê-los, limpa cookies,
+    localStorage e sessionStorage e navega para about:blank em vez de
+    chamar quit(). A inicialização do navegador é paga uma única vez.
+    Os drivers ociosos são separados por perfil de navegador.
+    """
+    
+    def __init__(self, fabrica_driver, tamanho_maximo=None):
+        """
+        Inicializa o pool
+        
+        Args:
+            fabrica_driver: Função que recebe o nome do perfil e cria um driver configurado
+            tamanho_maximo: Quantidade máxima de drivers ociosos mantidos (usa TestConfig se não especificado)
+        """
+        self.fabrica_driver = fabrica_driver
+        self.tamanho_maximo = tamanho_maximo or TestConfig.TAMANHO_POOL_DRIVERS
+        self._livres = {}
+        self._em_uso = {}
+        self._lock = threading.Lock()
+        atexit.register(self.encerrar)
+    
+    def adquirir(self, perfil="padrao"):
+        """
+        Empresta um driver do pool
+        
+        Args:
+            perfil: Nome do perfil de navegador desejado
+        
+        Returns:
+            webdriver.Chrome: Driver livre e com a sessão ativa
+        """
+        while True:
+            with self._lock:
+                livres = self._livres.get(perfil)
+                driver = livres.pop() if livres else None
+            if driver is None:
+                driver = self.fabrica_driver(perfil)
+                break
+            if self._sessao_ativa(driver):
+                break
+            # Sessão morta (navegador fechado ou travado): descartar e tentar o próximo
+            self._fechar_silenciosamente(driver)
+        
+        with self._lock:
+            self._em_uso[driver] = perfil
+        return driver
+    
+    def devolver(self, driver):
+        """
+        Limpa o estado do driver e o devolve ao pool
+        
+        Args:
+            driver: Driver emprestado com adquirir()
+        """
+        with self._lock:
+            perfil = self._em_uso.pop(driver, "padrao")
+        
+        try:
+            self.resetar_estado(driver)
+        except Exception as e:
+            print(f"⚠️  Driver descartado do pool (falha ao limpar estado): {e}")
+            self._fechar_silenciosamente(driver)
+            return
+        
+        with self._lock:
+            livres = self._livres.setdefault(perfil, [])
+            if len(livres) < self.tamanho_maximo:
+                livres.append(driver)
+                return
+        self._fechar_silenciosamente(driver)
+    
+    @staticmethod
+    def resetar_estado(driver):
+        """
+        Remove o estado deixado pelo teste anterior
+        
+        Args:
+            driver: Instância do WebDriver
+        """
+        # Storage só pode ser limpo enquanto a página ainda está na origem do teste
+        if not driver.current_url.startswith(("about:", "data:")):
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        
+        try:
+            # Limpa cookies de todos os domínios, não apenas do atual
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except Exception:
+            driver.delete_all_cookies()
+        
+        driver.get("about:blank")
+        # Alguns testes redimensionam a janela (ex.: captura de página completa)
+        perfil = getattr(driver, "perfil_navegador", None)
+        if perfil:
+            PerfisNavegador.ajustar_janela(driver, perfil)
+        else:
+            driver.maximize_window()
+    
+    def encerrar(self):
+        """Fecha todos os drivers do pool, ociosos e emprestados"""
+        with self._lock:
+            drivers = [d for livres in self._livres.values() for d in livres] + list(self._em_uso)
+            self._livres = {}
+            self._em_uso = {}
+        for driver in drivers:
+            self._fechar_silenciosamente(driver)
+    
+    @staticmethod
+    def _sessao_ativa(driver):
+        """Verifica se a sessão do navegador ainda responde"""
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+    
+    @staticmethod
+    def _fechar_silenciosamente(driver):
+        """Fecha o driver ignorando erros de sessão já encerrada"""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+_pool_global = None
+_pool_lock = threading.Lock()